@@ -0,0 +1,505 @@
+"""Simulate boost strategies against household phase current traces.
+
+Replays a phase current trace through the real boost switch, with a fake
+coordinator in front of a modeled charger that applies commands after a
+response delay and ramps its current. Time is simulated, so days of traces
+run in seconds. Each strategy is scored on the energy delivered, the share
+of the available headroom it used, the time the phase spent over the max
+load and the number of commands sent. Phase current readings reach the
+switch through the Home Assistant state machine, like in production.
+
+Without a trace, a synthetic household is simulated in each scenario: a
+baseline meter, a fast meter that reports more often than the rate cap of
+the boost, and a meter that drops out for minutes at a time.
+
+Traces are CSV or NDJSON with a `time` (epoch seconds or ISO 8601) and a
+`current` or `state` column, and an optional `unit`. History exported from
+Home Assistant as CSV (`entity_id,state,last_changed`) works as is.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_boost --days 7
+    python -m benchmarks.bench_boost --days 21 --scenarios baseline
+    python -m benchmarks.bench_boost history.csv --max-load 25 --delay 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import random
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, UnitOfElectricCurrent
+from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from custom_components.oncharger import switch as switch_module
+from custom_components.oncharger.conditioning import parse_current
+from custom_components.oncharger.const import (
+    CHARGER_BOOST_NATIVE_KEY,
+    CHARGER_BOOST_TYPE_KEY,
+    CHARGER_MAX_CHARGING_CURRENT_KEY,
+    CHARGER_NAME_KEY,
+    CONDITIONER_OUTLIER_FACTOR,
+    CONNECTION_TYPE,
+    DEVICE_NAME,
+    DEVICE_TYPE,
+    FILTER_EWMA,
+    FILTER_MEDIAN,
+    FILTER_NONE,
+    LOCAL,
+    PHASE_CURRENT_ENTITY,
+    PHASE_CURRENT_FILTER,
+    PHASE_MAX_LOAD,
+    PHASE_MAX_LOAD_MIN,
+    PREDICTIVE_HEADROOM,
+    SINGLE_PHASE,
+)
+from custom_components.oncharger.predictor import BoostStats, LoadPredictor
+
+from .common import async_test_home_assistant
+
+ENTITY_ID = "sensor.phase_current"
+MIN_PILOT = 6
+DROPOUT_SECONDS = 600
+
+STRATEGIES: dict[str, dict[str, Any]] = {
+    "reactive": {PHASE_CURRENT_FILTER: FILTER_NONE},
+    "median": {PHASE_CURRENT_FILTER: FILTER_MEDIAN},
+    "ewma": {PHASE_CURRENT_FILTER: FILTER_EWMA},
+    "predictive": {PHASE_CURRENT_FILTER: FILTER_NONE, PREDICTIVE_HEADROOM: True},
+    "predictive_median": {
+        PHASE_CURRENT_FILTER: FILTER_MEDIAN,
+        PREDICTIVE_HEADROOM: True,
+    },
+}
+
+SCENARIOS: dict[str, dict[str, Any]] = {
+    "baseline": {},
+    # Faster than the 5 s rate cap of the conditioner
+    "fast": {"interval": 2},
+    "dropout": {"dropouts": 3},
+}
+
+
+@dataclass
+class Sample:
+    """Phase current state at a point in time."""
+
+    time: float
+    state: str
+    unit: str | None = UnitOfElectricCurrent.AMPERE
+    # Actual household load in A, when the state does not report it
+    load: float | None = field(default=None, compare=False)
+
+
+def parse_time(value: str | float) -> float:
+    """Return epoch seconds of a number or an ISO 8601 string."""
+    try:
+        return float(value)
+    except ValueError:
+        if (parsed := dt_util.parse_datetime(str(value))) is None:
+            raise ValueError(f"Invalid time: {value}") from None
+        return dt_util.as_utc(parsed).timestamp()
+
+
+def read_trace(path: str) -> list[Sample]:
+    """Read a CSV or NDJSON phase current trace."""
+    with open(path, encoding="utf-8") as file:
+        if path.endswith((".ndjson", ".jsonl", ".json")):
+            rows: Iterator[dict[str, Any]] = (
+                json.loads(line) for line in file if line.strip()
+            )
+        else:
+            rows = csv.DictReader(file)
+        samples = [
+            Sample(
+                parse_time(row["time"] if "time" in row else row["last_changed"]),
+                str(row["current"] if "current" in row else row["state"]),
+                row.get("unit") or UnitOfElectricCurrent.AMPERE,
+            )
+            for row in rows
+        ]
+    samples.sort(key=lambda sample: sample.time)
+    return samples
+
+
+def synthetic_trace(
+    days: int, interval: float, seed: int, start: float, dropouts: int = 0
+) -> Iterator[Sample]:
+    """Generate a household with daily routines, appliances and glitches.
+
+    Dropouts are windows per day in which the meter reports unavailable
+    while the household keeps drawing current."""
+    rng = random.Random(seed)
+    for day in range(days):
+        midnight = start + day * 86400
+        # (start, duration, amps, duty cycle) in seconds from midnight
+        events = [
+            (7 * 3600 + rng.uniform(-600, 600), 180, 9.0, 1.0),
+            (18 * 3600 + rng.uniform(-900, 900), 3600, 8.0, 0.7),
+            *(
+                (rng.uniform(6 * 3600, 23 * 3600), 180, 9.0, 1.0)
+                for _ in range(rng.randint(1, 4))
+            ),
+        ]
+        if day % 3 == 0:
+            events.append((10 * 3600 + rng.uniform(-1800, 1800), 1200, 9.0, 1.0))
+        outages = [rng.uniform(0, 86400 - DROPOUT_SECONDS) for _ in range(dropouts)]
+
+        offset = 0.0
+        while offset < 86400:
+            load = max(0.3, rng.gauss(1.2, 0.2))
+            for begin, duration, amps, duty in events:
+                if begin <= offset < begin + duration and (
+                    duty >= 1 or (offset - begin) % 120 < 120 * duty
+                ):
+                    load += amps
+            if (glitch := rng.random()) < 0.001 or any(
+                begin <= offset < begin + DROPOUT_SECONDS for begin in outages
+            ):
+                state = "unavailable"
+            elif glitch < 0.0015:
+                state = "999"
+            else:
+                state = f"{load:.2f}"
+            yield Sample(midnight + offset, state, load=load)
+            offset += interval
+
+
+def write_trace(path: str, samples: list[Sample]) -> None:
+    """Write a trace as CSV."""
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["time", "state", "unit"])
+        writer.writerows((sample.time, sample.state, sample.unit) for sample in samples)
+
+
+class SimulatedClock:
+    """Simulated time shared by the charger, timers and the predictor."""
+
+    seconds = 0.0
+
+    def monotonic(self) -> float:
+        """Return the simulated time in seconds."""
+        return self.seconds
+
+    def now(self) -> datetime:
+        """Return the simulated time as a datetime."""
+        return datetime.fromtimestamp(self.seconds, timezone.utc)
+
+
+class SimulatedTimers:
+    """Stand-in for `async_call_later` that fires on simulated time."""
+
+    def __init__(self, clock: SimulatedClock) -> None:
+        """Initialize."""
+        self._clock = clock
+        self._timers: list[list[Any]] = []
+
+    def call_later(
+        self,
+        _hass: HomeAssistant,
+        delay: float,
+        action: Callable[[datetime], Awaitable[None]],
+    ) -> Callable[[], None]:
+        """Schedule an action and return a function that cancels it."""
+        timer = [self._clock.seconds + delay, action]
+        self._timers.append(timer)
+        return lambda: timer in self._timers and self._timers.remove(timer)
+
+    @property
+    def next_due(self) -> float:
+        """Return the time the next action is due."""
+        return min((timer[0] for timer in self._timers), default=float("inf"))
+
+    async def async_fire(self) -> None:
+        """Run the actions that are due."""
+        while due := [t for t in self._timers if t[0] <= self._clock.seconds]:
+            for timer in due:
+                self._timers.remove(timer)
+                await timer[1](self._clock.now())
+
+
+class SimulatedPredictor(LoadPredictor):
+    """Load predictor that learns on simulated time."""
+
+    def __init__(self, hass: HomeAssistant, clock: SimulatedClock) -> None:
+        """Initialize."""
+        super().__init__(hass, "simulation")
+        self._clock = clock
+
+    def async_update(self, current: float, now: datetime | None = None) -> None:
+        """Record a household load reading in A."""
+        super().async_update(current, now or self._clock.now())
+
+    def predict(self, now: datetime | None = None) -> float | None:
+        """Return the expected peak load in A for now and the next slot."""
+        return super().predict(now or self._clock.now())
+
+
+class ChargerModel:
+    """Charger that applies the pilot after a delay and ramps the current."""
+
+    def __init__(
+        self, clock: SimulatedClock, delay: float, ramp: float, car_max: float
+    ) -> None:
+        """Initialize."""
+        self._clock = clock
+        self._delay = delay
+        self._ramp = ramp
+        self._car_max = car_max
+        self._commands: deque[tuple[float, float]] = deque()
+        self.pilot = float(PHASE_MAX_LOAD_MIN)
+        self.current = self.target
+
+    @property
+    def target(self) -> float:
+        """Return the current the car settles at for the applied pilot."""
+        return 0.0 if self.pilot < MIN_PILOT else min(self.pilot, self._car_max)
+
+    @property
+    def settled(self) -> bool:
+        """Return whether the current stays the same until the next command."""
+        return not self._commands and self.current == self.target
+
+    def command(self, pilot: float) -> None:
+        """Receive a pilot command."""
+        self._commands.append((self._clock.seconds + self._delay, pilot))
+
+    def step(self, seconds: float) -> None:
+        """Advance the charger by a number of seconds."""
+        while self._commands and self._commands[0][0] <= self._clock.seconds:
+            self.pilot = self._commands.popleft()[1]
+        change = self.target - self.current
+        limit = self._ramp * seconds
+        self.current += max(-limit, min(limit, change))
+
+
+class FakeCoordinator:
+    """Coordinator parts the boost switch uses, backed by the charger model."""
+
+    last_update_success = True
+    meter = None
+
+    def __init__(self, charger: ChargerModel, predictor: LoadPredictor) -> None:
+        """Initialize."""
+        self.charger = charger
+        self.predictor = predictor
+        self.boost_stats = BoostStats()
+        self.analytics = SimpleNamespace(max_current=charger.current)
+        self.commands = 0
+        self.data: dict[str, Any] = {
+            CHARGER_NAME_KEY: "simulation",
+            CHARGER_BOOST_TYPE_KEY: 5,
+            CHARGER_BOOST_NATIVE_KEY: 0,
+            CHARGER_MAX_CHARGING_CURRENT_KEY: charger.pilot,
+        }
+
+    def async_add_listener(self, *_args: Any, **_kwargs: Any) -> Callable[[], None]:
+        """Ignore listeners, entities are driven directly."""
+        return lambda: None
+
+    async def async_set_charging_current(
+        self, value: float, journal: bool = True
+    ) -> None:
+        """Send the charging current to the charger model."""
+        self.commands += 1
+        self.data[CHARGER_MAX_CHARGING_CURRENT_KEY] = value
+        self.charger.command(value)
+
+
+@contextmanager
+def simulated_call_later(timers: SimulatedTimers) -> Iterator[None]:
+    """Make the boost switch schedule its timers on simulated time."""
+    original = switch_module.async_call_later
+    switch_module.async_call_later = timers.call_later
+    try:
+        yield
+    finally:
+        switch_module.async_call_later = original
+
+
+async def async_simulate(
+    hass: HomeAssistant,
+    args: argparse.Namespace,
+    samples: list[Sample],
+    scenario: str,
+    strategy: str,
+) -> dict[str, Any]:
+    """Run one strategy over the trace and score it."""
+    # Switches of earlier runs keep tracking their own entity
+    entity_id = f"{ENTITY_ID}_{scenario}_{strategy}"
+    options = {
+        PHASE_CURRENT_ENTITY: entity_id,
+        PHASE_MAX_LOAD: args.max_load,
+        **STRATEGIES[strategy],
+    }
+    clock = SimulatedClock()
+    clock.seconds = samples[0].time
+    timers = SimulatedTimers(clock)
+    charger = ChargerModel(clock, args.delay, args.ramp, args.car_max)
+    coordinator = FakeCoordinator(charger, SimulatedPredictor(hass, clock))
+    entry = SimpleNamespace(
+        entry_id="simulation",
+        data={
+            DEVICE_NAME: "simulation",
+            DEVICE_TYPE: SINGLE_PHASE,
+            CONNECTION_TYPE: LOCAL,
+        },
+        options=options,
+        add_update_listener=lambda _listener: lambda: None,
+        async_on_unload=lambda _unsub: None,
+    )
+    switch = switch_module.OnchargerSwitch(
+        hass,
+        coordinator,
+        entry,
+        switch_module.ENTITY_DESCRIPTIONS[CHARGER_BOOST_TYPE_KEY],
+        clock=clock.monotonic,
+    )
+
+    max_valid = args.max_load * CONDITIONER_OUTLIER_FACTOR
+    household = 0.0
+    delivered = available = overload_seconds = overload_amp_seconds = 0.0
+    # Parsed values repeat a lot, parse each state only once
+    values: dict[tuple[str, str | None], float | None] = {}
+    index = 0
+    end = samples[-1].time
+    start = time.perf_counter()
+
+    with simulated_call_later(timers):
+        await switch.async_added_to_hass()
+        while clock.seconds <= end:
+            while index < len(samples) and samples[index].time <= clock.seconds:
+                sample = samples[index]
+                index += 1
+                attributes = (
+                    {ATTR_UNIT_OF_MEASUREMENT: sample.unit} if sample.unit else {}
+                )
+                if (key := (sample.state, sample.unit)) not in values:
+                    try:
+                        value: float | None = parse_current(
+                            State(entity_id, sample.state, attributes)
+                        )
+                    except ValueError:
+                        value = None
+                    if value is not None and not 0 <= value <= max_valid:
+                        value = None
+                    values[key] = value
+                if sample.load is not None:
+                    household = sample.load
+                elif (value := values[key]) is not None:
+                    household = value
+                coordinator.analytics.max_current = charger.current
+                # Unchanged states fire no event, like in production
+                hass.states.async_set(entity_id, sample.state, attributes)
+                await hass.async_block_till_done()
+            await timers.async_fire()
+
+            # Nothing changes between events once the charger has settled
+            step = args.step
+            if charger.settled:
+                next_event = min(
+                    samples[index].time if index < len(samples) else end + step,
+                    timers.next_due,
+                )
+                step = max(step, next_event - clock.seconds)
+
+            charger.step(step)
+            headroom = min(args.car_max, args.max_load - household)
+            if headroom >= MIN_PILOT:
+                available += headroom * step
+            delivered += charger.current * step
+            if (excess := household + charger.current - args.max_load) > 0:
+                overload_seconds += step
+                overload_amp_seconds += excess * step
+            clock.seconds += step
+
+    elapsed = time.perf_counter() - start
+    return {
+        "scenario": scenario,
+        "strategy": strategy,
+        "energy_kwh": round(delivered * args.voltage / 3.6e6, 2),
+        "headroom_utilization": round(delivered / available, 3) if available else 0,
+        "overload_seconds": round(overload_seconds),
+        "overload_amp_seconds": round(overload_amp_seconds),
+        "commands": coordinator.commands,
+        "phase_current_events": switch.extra_state_attributes["phase_current_events"],
+        "simulated_hours": round((end - samples[0].time) / 3600, 1),
+        "speedup": round((end - samples[0].time) / elapsed),
+    }
+
+
+async def async_run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Load or generate the traces and simulate every strategy on each."""
+    if args.trace:
+        traces = {"trace": read_trace(args.trace)}
+    else:
+        start = datetime(2026, 1, 5, tzinfo=timezone.utc).timestamp()
+        traces = {
+            scenario: list(
+                synthetic_trace(
+                    args.days,
+                    SCENARIOS[scenario].get("interval", args.interval),
+                    args.seed,
+                    start,
+                    SCENARIOS[scenario].get("dropouts", 0),
+                )
+            )
+            for scenario in args.scenarios
+        }
+    if args.save_trace:
+        write_trace(args.save_trace, next(iter(traces.values())))
+    if not all(traces.values()):
+        raise SystemExit("Trace is empty")
+
+    async with async_test_home_assistant() as hass:
+        return [
+            await async_simulate(hass, args, samples, scenario, strategy)
+            for scenario, samples in traces.items()
+            for strategy in args.strategies
+        ]
+
+
+def main() -> None:
+    """Parse arguments and run the boost simulation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", nargs="?", help="CSV or NDJSON phase current trace")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--interval", type=float, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--save-trace", help="Write the trace of the first scenario as CSV"
+    )
+    parser.add_argument("--max-load", type=int, default=25)
+    parser.add_argument("--car-max", type=float, default=32)
+    parser.add_argument("--voltage", type=float, default=230)
+    parser.add_argument(
+        "--delay", type=float, default=2, help="Seconds until a command applies"
+    )
+    parser.add_argument("--ramp", type=float, default=2, help="Current ramp in A/s")
+    parser.add_argument("--step", type=float, default=1, help="Simulation step in s")
+    parser.add_argument(
+        "--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES)
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(async_run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
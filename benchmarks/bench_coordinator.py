@@ -0,0 +1,110 @@
+"""Benchmark the Oncharger coordinator against the fake HTTP server.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_coordinator --latency 0.02 --three-phase
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+from custom_components.oncharger.coordinator import OnchargerCoordinator
+from custom_components.oncharger.oncharger import Oncharger
+
+from .common import async_test_home_assistant, entry_data, summarize
+from .fake_oncharger import FakeOncharger, FakeOnchargerOptions
+
+
+async def async_bench(args: argparse.Namespace) -> dict:
+    """Run the benchmark."""
+    options = FakeOnchargerOptions(
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        three_phase=args.three_phase,
+    )
+    results: dict = {"options": vars(args)}
+
+    with FakeOncharger(options) as server:
+        async with async_test_home_assistant() as hass:
+            server.add_charger("bench")
+            coordinator = OnchargerCoordinator(
+                Oncharger(entry_data(server, "bench", cloud=args.cloud)), hass
+            )
+
+            poll_samples = []
+            for _ in range(args.polls):
+                start = time.monotonic()
+                await coordinator.async_refresh()
+                poll_samples.append(time.monotonic() - start)
+            results["poll"] = summarize(poll_samples)
+            results["poll"]["failures"] = coordinator.stats.error_count
+
+            start = time.monotonic()
+            for index in range(args.commands):
+                try:
+                    await coordinator.jobs.async_run(
+                        coordinator._set_charging_current, 6 + index % 10
+                    )
+                except ConnectionError:
+                    pass
+            elapsed = time.monotonic() - start
+            results["commands"] = {
+                "count": args.commands,
+                "per_second": round(args.commands / elapsed, 1),
+            }
+
+            results["executor"] = {
+                "submitted": coordinator.jobs.submitted,
+                "coalesced": coordinator.jobs.coalesced,
+                "rejected": coordinator.jobs.rejected,
+            }
+
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            coordinators = []
+            for index in range(args.coordinators):
+                server.add_charger(f"memory-{index}")
+                extra = OnchargerCoordinator(
+                    Oncharger(entry_data(server, f"memory-{index}", cloud=args.cloud)),
+                    hass,
+                )
+                await extra.async_refresh()
+                coordinators.append(extra)
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            allocated = sum(
+                stat.size_diff for stat in after.compare_to(before, "filename")
+            )
+            results["memory"] = {
+                "coordinators": args.coordinators,
+                "bytes_per_coordinator": allocated // max(args.coordinators, 1),
+            }
+            results["requests"] = server.requests
+
+    return results
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cloud", action="store_true")
+    parser.add_argument("--three-phase", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--coordinators", type=int, default=20)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(async_bench(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Replay captured Oncharger traffic through the coordinator.
+
+Captures come from the `oncharger.capture` service. Every poll's normalized
+data can be written out and compared against an earlier run, which makes
+firmware quirks found in the field regression tests.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_replay capture.ndjson --expect snapshots.ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from custom_components.oncharger.capture import ReplayOncharger
+from custom_components.oncharger.coordinator import OnchargerCoordinator
+
+from .common import async_test_home_assistant
+
+
+async def async_replay(args: argparse.Namespace) -> list[dict]:
+    """Replay the capture and return normalized data of every poll."""
+    replay = ReplayOncharger(args.capture, realtime=args.realtime)
+    snapshots: list[dict] = []
+
+    async with async_test_home_assistant() as hass:
+        coordinator = OnchargerCoordinator(replay, hass)
+        start = time.monotonic()
+        while not replay.exhausted:
+            await coordinator.async_refresh()
+            if coordinator.last_update_success:
+                snapshots.append(coordinator.data)
+            elif not replay.exhausted:
+                snapshots.append({"error": str(coordinator.last_exception)})
+        elapsed = time.monotonic() - start
+
+    print(
+        json.dumps(
+            {
+                "polls": len(snapshots),
+                "polls_per_second": round(len(snapshots) / elapsed, 1),
+                "stats": coordinator.stats.as_dict(),
+            },
+            indent=2,
+        )
+    )
+    return snapshots
+
+
+def main() -> None:
+    """Parse arguments, replay and compare snapshots."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture")
+    parser.add_argument("--realtime", action="store_true")
+    parser.add_argument("--output", help="Write normalized snapshots to a file")
+    parser.add_argument("--expect", help="Compare normalized snapshots to a file")
+    args = parser.parse_args()
+
+    snapshots = asyncio.run(async_replay(args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.writelines(json.dumps(snapshot) + "\n" for snapshot in snapshots)
+
+    if args.expect:
+        with open(args.expect, encoding="utf-8") as file:
+            expected = [json.loads(line) for line in file if line.strip()]
+        if expected != json.loads(json.dumps(snapshots)):
+            print("Normalized snapshots differ from expectation", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Scale test for many Oncharger chargers in one Home Assistant instance.
+
+For each charger count N this sets up N config entries with their
+coordinators, persisted state and entities against the in-process fake
+server. Every charger then polls back to back for a number of rounds, while
+optional slow chargers answer only after a long delay. Reports event loop
+lag, CPU per poll, memory per entry, state write rate, and the throughput
+and poll latency of the healthy chargers. Exits non-zero if the per-entry
+costs do not scale flat, or if the healthy chargers are held up.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scale --chargers 10 50 200 --three-phase
+    python -m benchmarks.bench_scale --chargers 4 40 --slow-chargers 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.oncharger import lock, number, sensor, switch
+from custom_components.oncharger.const import (
+    DEVICE_NAME,
+    DOMAIN,
+    LOCAL,
+    PHASE_MAX_LOAD,
+    TARIFF,
+)
+from custom_components.oncharger.coordinator import OnchargerCoordinator
+from custom_components.oncharger.oncharger import Oncharger
+
+from .common import async_test_home_assistant, entry_data
+from .fake_oncharger import FakeOncharger, FakeOnchargerOptions
+
+PLATFORMS = [sensor, number, lock, switch]
+# Config and status are requested concurrently
+REQUESTS_PER_POLL = 1
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a periodic tick."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """Init monitor."""
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self.samples: list[float] = []
+
+    async def _run(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self._interval)
+            self.samples.append(max(0, time.monotonic() - start - self._interval))
+
+    def start(self) -> None:
+        """Start monitoring."""
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop monitoring."""
+        if self._task:
+            self._task.cancel()
+
+
+async def async_setup_charger(
+    hass: HomeAssistant,
+    server: FakeOncharger,
+    index: int,
+    cloud: bool,
+    latency: float = 0.0,
+) -> list[Any]:
+    """Set up one charger with its entities and return the entities."""
+    username = f"scale-{index}"
+    server.add_charger(username).latency = latency
+    data = entry_data(server, username, cloud=cloud)
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=data[DEVICE_NAME],
+        data=data,
+        source="user",
+        options={PHASE_MAX_LOAD: 16, TARIFF: "00:00=0.2,07:00=0.3,23:00=0.2"},
+        unique_id=f"{username}-{LOCAL}",
+        entry_id=username,
+    )
+    coordinator = OnchargerCoordinator(Oncharger(entry.data), hass, entry)
+    await coordinator.async_load()
+    await coordinator.async_refresh()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    entities: list[Any] = []
+    for platform in PLATFORMS:
+        await platform.async_setup_entry(hass, entry, entities.extend)
+
+    for entity_index, entity in enumerate(entities):
+        entity.entity_id = f"sensor.scale_{index}_{entity_index}"
+
+        @callback
+        def write_state(entity=entity) -> None:
+            hass.states.async_set(
+                entity.entity_id, entity.state, entity.extra_state_attributes
+            )
+
+        coordinator.async_add_listener(write_state)
+
+    return entities
+
+
+async def async_bench_chargers(args: argparse.Namespace, chargers: int) -> dict:
+    """Run the scale test for a given charger count."""
+    options = FakeOnchargerOptions(latency=args.latency, three_phase=args.three_phase)
+
+    with FakeOncharger(options) as server:
+        async with async_test_home_assistant() as hass:
+            await dr.async_load(hass)
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            entities = []
+            for index in range(chargers):
+                entities += await async_setup_charger(hass, server, index, args.cloud)
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            memory = sum(
+                stat.size_diff for stat in after.compare_to(before, "filename")
+            )
+            coordinators: list[OnchargerCoordinator] = list(hass.data[DOMAIN].values())
+
+            # Slow chargers are set up on top, so they do not skew the costs
+            for index in range(chargers, chargers + args.slow_chargers):
+                await async_setup_charger(
+                    hass, server, index, args.cloud, args.slow_latency
+                )
+            slow = list(hass.data[DOMAIN].values())[chargers:]
+
+            writes = 0
+
+            @callback
+            def count_write(_event) -> None:
+                nonlocal writes
+                writes += 1
+
+            hass.bus.async_listen("state_changed", count_write)
+
+            latencies: list[float] = []
+            healthy_done = asyncio.Event()
+
+            async def poll_healthy(coordinator: OnchargerCoordinator) -> None:
+                for _ in range(args.rounds):
+                    start = time.monotonic()
+                    await coordinator.async_refresh()
+                    latencies.append(time.monotonic() - start)
+
+            async def poll_slow(coordinator: OnchargerCoordinator) -> None:
+                while not healthy_done.is_set():
+                    await coordinator.async_refresh()
+
+            slow_tasks = [asyncio.create_task(poll_slow(item)) for item in slow]
+            monitor = LoopLagMonitor()
+            monitor.start()
+            cpu_start = time.process_time()
+            wall_start = time.monotonic()
+            await asyncio.gather(*(poll_healthy(item) for item in coordinators))
+            wall = time.monotonic() - wall_start
+            cpu = time.process_time() - cpu_start
+            monitor.stop()
+            healthy_done.set()
+            await asyncio.gather(*slow_tasks)
+
+    polls = chargers * args.rounds
+    lag = sorted(monitor.samples) or [0.0]
+    latencies.sort()
+    # Polls can go no faster than the fake latency allows with every charger
+    # in flight at once, nor faster than the CPU they take on the event loop
+    cpu_per_poll = cpu / polls
+    expected = min(
+        chargers / (REQUESTS_PER_POLL * args.latency + cpu_per_poll),
+        1 / cpu_per_poll,
+    )
+    return {
+        "chargers": chargers,
+        "slow_chargers": args.slow_chargers,
+        "entities": len(entities),
+        "memory_per_entry_bytes": memory // chargers,
+        "cpu_per_poll_ms": round(cpu / polls * 1000, 3),
+        "loop_lag_p95_ms": round(lag[int(len(lag) * 0.95) - 1] * 1000, 3),
+        "loop_lag_max_ms": round(lag[-1] * 1000, 3),
+        "state_writes_per_second": round(writes / wall, 1),
+        "polls_per_second": round(polls / wall, 1),
+        "throughput_ratio": round(polls / wall / expected, 3),
+        "poll_latency_p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+        "poll_latency_p95_ms": round(
+            latencies[int(len(latencies) * 0.95) - 1] * 1000, 3
+        ),
+    }
+
+
+def main() -> None:
+    """Parse arguments, run the scale test and gate on flat scaling."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chargers", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--slow-chargers", type=int, default=0)
+    parser.add_argument(
+        "--slow-latency", type=float, default=3, help="Response delay of slow chargers"
+    )
+    parser.add_argument("--cloud", action="store_true")
+    parser.add_argument("--three-phase", action="store_true")
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=1.5,
+        help="Allowed ratio of per-entry cost between the largest and smallest N",
+    )
+    parser.add_argument(
+        "--min-throughput",
+        type=float,
+        default=0.5,
+        help="Minimum ratio of healthy polls per second to the I/O or CPU bound",
+    )
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(async_bench_chargers(args, chargers))
+        for chargers in sorted(args.chargers)
+    ]
+    print(json.dumps(results, indent=2))
+
+    smallest, largest = results[0], results[-1]
+    failed = [
+        metric
+        for metric in ("memory_per_entry_bytes", "cpu_per_poll_ms")
+        if smallest[metric] and largest[metric] / smallest[metric] > args.max_growth
+    ]
+    if failed:
+        print(f"Per-entry cost grows with N: {', '.join(failed)}", file=sys.stderr)
+    if starved := [
+        result["chargers"]
+        for result in results
+        if result["throughput_ratio"] < args.min_throughput
+    ]:
+        print(
+            f"Healthy chargers are held up at N={', '.join(map(str, starved))}",
+            file=sys.stderr,
+        )
+    if failed or starved:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Startup benchmark for the Oncharger integration.
+
+Measures the import time of the integration and of each platform in fresh
+interpreters, on top of the Home Assistant modules that are already loaded
+when an integration is set up. Then sets up a number of entries against the
+in-process fake server and reports the setup time per entry and the
+entities each forwarded platform created. The import results also report
+whether importing the integration loaded requests.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup --runs 5 --entries 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import statistics
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.oncharger import entry_platforms
+from custom_components.oncharger.const import DOMAIN
+from custom_components.oncharger.coordinator import OnchargerCoordinator
+from custom_components.oncharger.oncharger import Oncharger
+
+from .common import async_test_home_assistant, entry_data, summarize
+from .fake_oncharger import FakeOncharger, FakeOnchargerOptions
+
+BASELINE_MODULES = [
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+]
+
+IMPORT_SCRIPT = """
+import importlib, json, sys, time
+for module in {baseline!r}:
+    importlib.import_module(module)
+preloaded = "requests" in sys.modules
+results = {{}}
+for module in {modules!r}:
+    start = time.perf_counter()
+    importlib.import_module(module)
+    results[module] = time.perf_counter() - start
+results["requests_loaded"] = not preloaded and "requests" in sys.modules
+print(json.dumps(results))
+"""
+
+
+def measure_imports(runs: int) -> dict[str, Any]:
+    """Measure import times in fresh interpreters and return the medians."""
+    modules = [
+        "custom_components.oncharger",
+        *[
+            f"custom_components.oncharger.{platform}"
+            for platform in ("sensor", "number", "lock", "switch")
+        ],
+    ]
+    script = IMPORT_SCRIPT.format(baseline=BASELINE_MODULES, modules=modules)
+
+    samples: list[dict[str, Any]] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=True, text=True
+        ).stdout
+        samples.append(json.loads(output))
+
+    return {
+        **{
+            module.rsplit(".", 1)[-1]
+            + "_ms": round(
+                statistics.median(sample[module] for sample in samples) * 1000, 3
+            )
+            for module in modules
+        },
+        "requests_loaded_on_import": any(
+            sample["requests_loaded"] for sample in samples
+        ),
+    }
+
+
+async def async_measure_setup(args: argparse.Namespace) -> dict[str, Any]:
+    """Set up entries against the fake server and time each setup."""
+    options = FakeOnchargerOptions(three_phase=args.three_phase)
+    samples: list[float] = []
+    created: dict[str, int] = {}
+
+    with FakeOncharger(options) as server:
+        async with async_test_home_assistant() as hass:
+            for index in range(args.entries):
+                username = f"startup-{index}"
+                server.add_charger(username)
+                entry = SimpleNamespace(
+                    entry_id=username,
+                    data=entry_data(server, username, cloud=args.cloud),
+                    options={},
+                )
+
+                start = time.perf_counter()
+                coordinator = OnchargerCoordinator(Oncharger(entry.data), hass, entry)
+                await coordinator.async_validate_input()
+                await coordinator.async_load()
+                await coordinator.async_refresh()
+                hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+                entities: dict[str, list[Any]] = {}
+                for platform in entry_platforms(entry):
+                    module = importlib.import_module(
+                        f"custom_components.oncharger.{platform.value}"
+                    )
+                    await module.async_setup_entry(
+                        hass, entry, entities.setdefault(platform.value, []).extend
+                    )
+                samples.append(time.perf_counter() - start)
+
+                for platform, platform_entities in entities.items():
+                    created[platform] = created.get(platform, 0) + len(
+                        platform_entities
+                    )
+
+    return {"setup": summarize(samples), "entities": created}
+
+
+def main() -> None:
+    """Parse arguments and run the startup benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--entries", type=int, default=20)
+    parser.add_argument("--cloud", action="store_true")
+    parser.add_argument("--three-phase", action="store_true")
+    args = parser.parse_args()
+
+    results = {
+        "imports": measure_imports(args.runs),
+        **asyncio.run(async_measure_setup(args)),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
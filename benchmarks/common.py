@@ -0,0 +1,67 @@
+"""Helpers shared by the Oncharger benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import statistics
+import tempfile
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.oncharger import oncharger as oncharger_module
+from custom_components.oncharger.const import (
+    DEVICE_NAME,
+    DEVICE_TYPE,
+    IP_ADDRESS,
+    PASSWORD,
+    SINGLE_PHASE,
+    THREE_PHASE,
+    USERNAME,
+)
+
+from .fake_oncharger import PASSWORD as FAKE_PASSWORD, FakeOncharger
+
+
+@asynccontextmanager
+async def async_test_home_assistant() -> AsyncIterator[HomeAssistant]:
+    """Create a bare Home Assistant instance in a temporary config dir."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            yield hass
+        finally:
+            await hass.async_stop(force=True)
+
+
+def entry_data(
+    server: FakeOncharger, username: str, cloud: bool = False
+) -> dict[str, Any]:
+    """Build config entry data pointing at the fake server."""
+    if cloud:
+        oncharger_module.API_BASE = f"http://{server.host}/api"
+
+    data = {
+        DEVICE_NAME: username,
+        DEVICE_TYPE: THREE_PHASE if server.options.three_phase else SINGLE_PHASE,
+        USERNAME: username,
+        PASSWORD: FAKE_PASSWORD,
+    }
+    if not cloud:
+        data[IP_ADDRESS] = server.host
+    return data
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize latency samples in milliseconds."""
+    samples = sorted(samples)
+    if not samples:
+        return {}
+    return {
+        "count": len(samples),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "p50_ms": round(samples[len(samples) // 2] * 1000, 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1] * 1000, 3),
+        "max_ms": round(samples[-1] * 1000, 3),
+    }
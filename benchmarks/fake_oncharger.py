@@ -0,0 +1,214 @@
+"""Local stand-in for the Oncharger device and cloud HTTP APIs.
+
+Local endpoints authenticate with `login`/`pass` query parameters, cloud
+endpoints (under `/api/`) with `x-ocid`/`x-password` headers, like the real
+device and cloud do."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import random
+import sys
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+USERNAME = "oncharger"
+PASSWORD = "secret"
+
+
+@dataclass
+class FakeCharger:
+    """State of a simulated charger."""
+
+    ocid: str
+    three_phase: bool = False
+    pilot: int = 16
+    loc: bool = False
+    state: int = 3
+    boost_type: int = 0
+    boost_native: int = 0
+    session_energy: int = 0
+    total_energy: int = 123456
+    elapsed: int = 0
+    latency: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def config(self) -> dict[str, Any]:
+        """Return the /config payload."""
+        return {
+            "ocid": self.ocid,
+            "ver": "fake-1.0",
+            "mp": 32,
+            "pilot": self.pilot,
+            "loc": self.loc,
+            "chargeBoostType": self.boost_type,
+            "remotePMCon": self.boost_native,
+        }
+
+    def status(self, cloud: bool) -> dict[str, Any]:
+        """Return the /status payload, advancing the session a bit."""
+        with self.lock:
+            if self.state == 3:
+                self.elapsed += 5
+                self.session_energy += 5 * self.pilot * 230
+
+        current = self.pilot * 1000 if self.state == 3 else 0
+        data: dict[str, Any] = {
+            "state": self.state,
+            "temp1": 315,
+            "wsec": self.session_energy,
+            "wat": self.total_energy,
+            "elapsed": self.elapsed,
+        }
+        if self.three_phase:
+            # NOTE: mimics firmware which reports volt instead of volt1
+            data |= {
+                "amp1": current,
+                "amp2": current,
+                "amp3": current,
+                "volt": 2301,
+                "volt2": 2297,
+                "volt3": 2310,
+            }
+        else:
+            data |= {"amp1" if not cloud else "amp": current, "volt": 2301}
+        if cloud:
+            data["isOnline"] = True
+        return data
+
+    def update(self, param: str, value: str) -> None:
+        """Apply a write request."""
+        with self.lock:
+            if param in ("pilot", "maxCurrent"):
+                self.pilot = int(float(value))
+            elif param in ("lock", "loc"):
+                self.loc = value == "true"
+            elif param == "cb_config":
+                self.boost_type = int(value.split("|")[0])
+
+
+class FakeServer(ThreadingHTTPServer):
+    """HTTP server that accepts bursts of concurrent connections."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        """Ignore clients that gave up on a slow response."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+@dataclass
+class FakeOnchargerOptions:
+    """Behaviour of the fake server."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    three_phase: bool = False
+
+
+class FakeOncharger:
+    """Threaded HTTP server emulating any number of chargers.
+
+    All chargers share one server, so the charger is chosen by the username:
+    the `login` query parameter locally and the `x-ocid` header in the cloud."""
+
+    def __init__(self, options: FakeOnchargerOptions | None = None) -> None:
+        """Init server."""
+        self.options = options or FakeOnchargerOptions()
+        self.chargers: dict[str, FakeCharger] = {}
+        self.requests = 0
+        self._server = FakeServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-oncharger", daemon=True
+        )
+
+    @property
+    def host(self) -> str:
+        """Return host:port of the server."""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def add_charger(self, username: str = USERNAME) -> FakeCharger:
+        """Add a charger authenticated by username."""
+        charger = FakeCharger(
+            ocid=f"fake-{len(self.chargers)}", three_phase=self.options.three_phase
+        )
+        self.chargers[username] = charger
+        return charger
+
+    def __enter__(self) -> FakeOncharger:
+        """Start the server."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Request handler."""
+
+            def log_message(self, *args: Any) -> None:
+                """Silence request logging."""
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                """Handle GET request."""
+                fake.requests += 1
+                options = fake.options
+                if options.latency or options.jitter:
+                    time.sleep(
+                        max(0, options.latency + random.uniform(0, options.jitter))
+                    )
+                if random.random() < options.failure_rate:
+                    return self._respond(503, {"error": "injected failure"})
+
+                url = urlparse(self.path)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                cloud = url.path.startswith("/api/")
+
+                if cloud:
+                    username = self.headers.get("x-ocid")
+                    password = self.headers.get("x-password")
+                else:
+                    username = query.get("login")
+                    password = query.get("pass")
+
+                charger = fake.chargers.get(username or "")
+                if charger is None or password != PASSWORD:
+                    return self._respond(200, {"err.auth.msg": "Forbidden"})
+                if charger.latency:
+                    time.sleep(charger.latency)
+
+                path = url.path.removeprefix("/api") if cloud else url.path
+                if path == "/config":
+                    return self._respond(200, charger.config())
+                if path == "/status":
+                    return self._respond(200, charger.status(cloud))
+                if path in ("/api", "/update"):
+                    charger.update(query.get("param", ""), query.get("value", ""))
+                    return self._respond(200, {"result": "ok"})
+                if path == "/save-pm":
+                    charger.update("cb_config", query.get("conn", "0"))
+                    return self._respond(200, {"result": "ok"})
+                return self._respond(404, {"error": "not found"})
+
+            def _respond(self, status: int, body: dict[str, Any]) -> None:
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
@@ -0,0 +1,93 @@
+"""Local stand-in for a telemetry sink.
+
+Receives telemetry exported by the integration over UDP and HTTP and
+prints the number of received lines every few seconds:
+
+    python -m benchmarks.telemetry_collector --udp-port 8089 --http-port 8086
+
+Then set the export target option to udp://<host>:8089 or
+http://<host>:8086/write.
+"""
+
+from __future__ import annotations
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import socketserver
+import threading
+import time
+from typing import Any
+
+
+class Collector:
+    """Count received telemetry lines."""
+
+    def __init__(self, output: str | None = None) -> None:
+        """Init collector."""
+        self.lines = 0
+        self.payloads = 0
+        self._lock = threading.Lock()
+        self._output = open(output, "a", encoding="utf-8") if output else None
+
+    def receive(self, payload: bytes) -> None:
+        """Record a payload."""
+        lines = [line for line in payload.decode().splitlines() if line]
+        with self._lock:
+            self.payloads += 1
+            self.lines += len(lines)
+            if self._output:
+                self._output.write("\n".join(lines) + "\n")
+                self._output.flush()
+
+
+def main() -> None:
+    """Parse arguments and run the collector."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--udp-port", type=int, default=8089)
+    parser.add_argument("--http-port", type=int, default=8086)
+    parser.add_argument("--output", help="Append received lines to a file")
+    args = parser.parse_args()
+
+    collector = Collector(args.output)
+
+    class UDPHandler(socketserver.BaseRequestHandler):
+        """UDP handler."""
+
+        def handle(self) -> None:
+            """Handle datagram."""
+            collector.receive(self.request[0])
+
+    class HTTPHandler(BaseHTTPRequestHandler):
+        """HTTP handler."""
+
+        def log_message(self, *args: Any) -> None:
+            """Silence request logging."""
+
+        def do_POST(self) -> None:  # pylint: disable=invalid-name
+            """Handle POST request."""
+            length = int(self.headers.get("Content-Length", 0))
+            collector.receive(self.rfile.read(length))
+            self.send_response(204)
+            self.end_headers()
+
+    servers = [
+        socketserver.ThreadingUDPServer((args.host, args.udp_port), UDPHandler),
+        ThreadingHTTPServer((args.host, args.http_port), HTTPHandler),
+    ]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        while True:
+            time.sleep(5)
+            print(f"payloads={collector.payloads} lines={collector.lines}", flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
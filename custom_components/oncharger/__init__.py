@@ -2,25 +2,55 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.const import Platform
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import ConfigType
 
 from .oncharger import Oncharger
 from .coordinator import InvalidAuth, OnchargerCoordinator
-from .const import DOMAIN
+from .const import DOMAIN, EXPORT_FLUSH_INTERVAL, IP_ADDRESS
+from .services import async_setup_services
+
+BACKFILL_INTERVAL = timedelta(hours=1)
+EXPORT_INTERVAL = timedelta(seconds=EXPORT_FLUSH_INTERVAL)
 
 PLATFORMS = [Platform.SENSOR, Platform.NUMBER, Platform.LOCK, Platform.SWITCH]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def entry_platforms(entry: ConfigEntry) -> list[Platform]:
+    """Return the platforms of an entry."""
+    # Boost is supported for local only
+    if entry.data.get(IP_ADDRESS):
+        return PLATFORMS
+    return [platform for platform in PLATFORMS if platform != Platform.SWITCH]
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Oncharger integration."""
+    async_setup_services(hass)
+
+    return True
+
+
 async def update_listener(hass, entry):
     """Handle options update."""
     coordinator: OnchargerCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    if coordinator.costs.reload_required or coordinator.meter.reload_required:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
     await coordinator.async_request_refresh()
 
 
@@ -30,32 +60,64 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = OnchargerCoordinator(
         oncharger,
         hass,
+        entry,
     )
 
+    # The coordinator holds a thread of the shared pool until it is unloaded
     try:
         await coordinator.async_validate_input()
+        await coordinator.async_load()
+        await coordinator.async_config_entry_first_refresh()
 
     except InvalidAuth as invalid_auth_error:
+        coordinator.jobs.async_close()
         raise ConfigEntryAuthFailed from invalid_auth_error
 
     except ConnectionError as connection_error:
+        coordinator.jobs.async_close()
         raise ConfigEntryNotReady from connection_error
 
-    await coordinator.async_config_entry_first_refresh()
+    except BaseException:
+        coordinator.jobs.async_close()
+        raise
 
+    await coordinator.meter.async_start()
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, entry_platforms(entry))
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
+    entry.async_on_unload(
+        async_track_time_interval(hass, coordinator.async_backfill, BACKFILL_INTERVAL)
+    )
+    hass.async_create_background_task(
+        coordinator.async_backfill(), f"{DOMAIN} energy backfill"
+    )
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, coordinator.exporter.async_flush, EXPORT_INTERVAL
+        )
+    )
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator: OnchargerCoordinator = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, entry_platforms(entry)
+    )
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_stop_capture()
+        await coordinator.exporter.async_close()
+        await coordinator.meter.async_stop()
+        coordinator.jobs.async_close()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data of a config entry."""
+    await OnchargerCoordinator(Oncharger(entry.data), hass, entry).async_remove()
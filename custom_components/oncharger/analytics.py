@@ -0,0 +1,96 @@
+"""Derived power analytics for the Oncharger integration."""
+
+from __future__ import annotations
+
+from array import array
+from math import ceil
+import time
+from typing import Any
+
+from .const import (
+    CHARGER_CURRENT_KEY,
+    CHARGER_VOLTAGE_KEY,
+    PHASE_ACTIVE_CURRENT,
+    ROLLING_WINDOWS,
+)
+
+
+class PhaseAnalytics:
+    """Derive power analytics from the phase vector of each poll.
+
+    Total power samples are kept in a fixed size ring buffer backed by two
+    arrays, large enough to cover the longest rolling window at the poll
+    interval. Each sample stands for the time since the previous one, so
+    the rolling averages stay time-weighted when polls fail or drift."""
+
+    def __init__(self, phases: list[str], interval: float) -> None:
+        """Initialize."""
+        self._phases = phases
+        self._interval = interval
+        self._capacity = 2 * ceil(max(ROLLING_WINDOWS) / interval) + 1
+        self._times = array("d", bytes(8 * self._capacity))
+        self._samples = array("d", bytes(8 * self._capacity))
+        self._head = 0
+        self._count = 0
+        self.currents: dict[str, float] = {}
+        self.power: dict[str, float] = {}
+        self.total_power: float | None = None
+        self.max_current: float | None = None
+        self.imbalance: float | None = None
+        self.averages: dict[int, float | None] = dict.fromkeys(ROLLING_WINDOWS)
+
+    def update(self, data: dict[str, Any], now: float | None = None) -> None:
+        """Update analytics from a new snapshot."""
+        now = time.monotonic() if now is None else now
+
+        currents: dict[str, float] = {}
+        power: dict[str, float] = {}
+        for phase in self._phases:
+            current = data[f"{CHARGER_CURRENT_KEY}{phase}"]
+            currents[phase] = current / 1000
+            power[phase] = current * data[f"{CHARGER_VOLTAGE_KEY}{phase}"] / 10000
+        self.currents = currents
+        self.power = power
+        self.total_power = sum(power.values())
+        self.max_current = max(currents.values())
+
+        mean = sum(currents.values()) / len(currents)
+        self.imbalance = (
+            max(abs(current - mean) for current in currents.values()) / mean * 100
+            if len(currents) > 1 and mean * 1000 >= PHASE_ACTIVE_CURRENT
+            else None
+        )
+
+        self._add(now, self.total_power)
+        self._update_averages(now)
+
+    def _add(self, now: float, value: float) -> None:
+        self._times[self._head] = now
+        self._samples[self._head] = value
+        self._head = (self._head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def _update_averages(self, now: float) -> None:
+        """Compute all rolling averages in one pass from newest to oldest."""
+        longest = max(ROLLING_WINDOWS)
+        totals = dict.fromkeys(ROLLING_WINDOWS, 0.0)
+        weights = dict.fromkeys(ROLLING_WINDOWS, 0.0)
+        index = self._head
+        for remaining in range(self._count, 0, -1):
+            index = (index - 1) % self._capacity
+            end = self._times[index]
+            start = (
+                self._times[(index - 1) % self._capacity]
+                if remaining > 1
+                else end - self._interval
+            )
+            for window in ROLLING_WINDOWS:
+                if (weight := end - max(start, now - window)) > 0:
+                    totals[window] += self._samples[index] * weight
+                    weights[window] += weight
+            if start <= now - longest:
+                break
+        self.averages = {
+            window: totals[window] / weights[window] if weights[window] else None
+            for window in ROLLING_WINDOWS
+        }
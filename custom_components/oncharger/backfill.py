@@ -0,0 +1,125 @@
+"""Long-term energy statistics backfill for the Oncharger integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+from homeassistant.util import slugify
+
+from .const import BACKFILL_BATCH_SIZE, DOMAIN, STORAGE_VERSION
+
+HOUR = timedelta(hours=1)
+
+
+def hourly_energy(
+    sessions: list[dict[str, Any]], since: datetime
+) -> dict[datetime, float]:
+    """Spread the energy of sessions evenly over the hours they span."""
+    hours: dict[datetime, float] = {}
+    for session in sessions:
+        start = dt_util.parse_datetime(session["start"])
+        end = dt_util.parse_datetime(session["end"])
+        if end <= since:
+            continue
+        span = max((end - start).total_seconds(), 1)
+
+        hour = start.replace(minute=0, second=0, microsecond=0)
+        while hour < end:
+            overlap = (min(hour + HOUR, end) - max(hour, start)).total_seconds()
+            hours[hour] = (
+                hours.get(hour, 0) + session["energy"] * max(overlap, 0) / span
+            )
+            hour += HOUR
+    return hours
+
+
+def hourly_sums(
+    hours: dict[datetime, float], total_energy: float, until: datetime
+) -> list[dict[str, Any]]:
+    """Return statistic rows for the hours before until.
+
+    The sum of the last row is the lifetime total minus the energy of
+    hours from until onwards, and each earlier row subtracts the energy of
+    the hour after it."""
+    energy = total_energy - sum(value for hour, value in hours.items() if hour >= until)
+    rows = []
+    hour = until - HOUR
+    first = min(hours)
+    while hour >= first:
+        rows.append({"start": hour, "state": energy, "sum": energy})
+        energy -= hours.get(hour, 0)
+        hour -= HOUR
+    rows.reverse()
+    return rows
+
+
+class EnergyBackfill:
+    """Import hourly energy reconstructed from sessions as external statistics.
+
+    Sums are anchored at the lifetime counter, so the sum at any hour is the
+    current total minus the energy of later sessions. That keeps rows stable
+    across runs and log compaction, and re-imports simply overwrite them."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entry = entry
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.backfill"
+        )
+        self._imported: datetime | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_remove(self) -> None:
+        """Remove backfill state from storage."""
+        await self._store.async_remove()
+
+    async def async_import(
+        self, charger_id: str, total_energy: float, sessions: list[dict[str, Any]]
+    ) -> None:
+        """Import hours completed since the last import."""
+        if "recorder" not in self._hass.config.components or not sessions:
+            return
+
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        async with self._lock:
+            if self._imported is None and (data := await self._store.async_load()):
+                self._imported = dt_util.parse_datetime(data["imported"])
+
+            until = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+            since = self._imported or dt_util.parse_datetime(sessions[0]["start"])
+            hours = hourly_energy(sessions, since)
+            if not hours:
+                return
+
+            # NOTE: keyed on the entry id, so renaming the entry keeps the rows
+            statistic_id = f"{DOMAIN}:{slugify(f'{charger_id}_{self._entry.entry_id}')}"
+            metadata = {
+                "has_mean": False,
+                "has_sum": True,
+                "name": f"{self._entry.title} charging energy",
+                "source": DOMAIN,
+                "statistic_id": f"{statistic_id}_energy",
+                "unit_of_measurement": UnitOfEnergy.KILO_WATT_HOUR,
+            }
+
+            rows = hourly_sums(hours, total_energy, until)
+            for index in range(0, len(rows), BACKFILL_BATCH_SIZE):
+                async_add_external_statistics(
+                    self._hass, metadata, rows[index : index + BACKFILL_BATCH_SIZE]
+                )
+                await asyncio.sleep(0)
+
+            self._imported = until
+            await self._store.async_save({"imported": until.isoformat()})
@@ -0,0 +1,186 @@
+"""Record and replay of Oncharger traffic."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Any, TextIO
+from urllib.parse import parse_qsl, urlencode
+
+from .client import AsyncOncharger
+from .const import IP_ADDRESS, PASSWORD, REDACT_KEYS, USERNAME
+from .oncharger import Forbidden, Oncharger
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+CAPTURE_VERSION = 1
+REDACTED = "**REDACTED**"
+
+
+def redact(data: Any) -> Any:
+    """Redact sensitive values from a query or response."""
+    if isinstance(data, dict):
+        return {
+            key: REDACTED if key.lower() in REDACT_KEYS else redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [redact(value) for value in data]
+    return data
+
+
+class TrafficRecorder:
+    """Append redacted request/response pairs to a line-delimited file.
+
+    The first line describes the capture, every following line is one
+    request with its offset from the start of the capture and its latency.
+    Requests are recorded from the event loop, so they are buffered until
+    the next flush in the executor."""
+
+    def __init__(self, path: str, local: bool) -> None:
+        """Open the capture file, this does blocking I/O."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._pending: list[dict[str, Any]] = []
+        self._file: TextIO = open(path, "a", encoding="utf-8")
+        self._pending.append({"version": CAPTURE_VERSION, "local": local})
+        self.flush()
+
+    def record(
+        self,
+        path: str,
+        query: str | None,
+        elapsed: float,
+        status: int | None = None,
+        body: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Record a request."""
+        entry: dict[str, Any] = {
+            "t": round(time.monotonic() - self._start - elapsed, 3),
+            "path": path,
+            "elapsed": round(elapsed, 4),
+        }
+        if query:
+            entry["query"] = urlencode(redact(dict(parse_qsl(query))))
+        if status is not None:
+            entry["status"] = status
+        if body is not None:
+            try:
+                entry["body"] = redact(json.loads(body))
+            except ValueError:
+                entry["text"] = body
+        if error is not None:
+            entry["error"] = error
+        with self._lock:
+            self._pending.append(entry)
+
+    def flush(self) -> None:
+        """Write the recorded requests, this does blocking I/O."""
+        with self._lock:
+            entries, self._pending = self._pending, []
+            if not self._file.closed:
+                self._file.writelines(
+                    json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries
+                )
+                self._file.flush()
+
+    def close(self) -> None:
+        """Write the recorded requests and close the capture file."""
+        self.flush()
+        with self._lock:
+            self._file.close()
+
+
+class ReplayOncharger(Oncharger):
+    """Oncharger client answering requests from a capture file.
+
+    Requests are answered in capture order, skipping entries of other
+    endpoints. With realtime set, answers are delayed to match the
+    captured timing, otherwise they are returned as fast as possible."""
+
+    def __init__(self, path: str, realtime: bool = False) -> None:
+        """Load the capture, this does blocking I/O."""
+        with open(path, encoding="utf-8") as file:
+            meta, *entries = [json.loads(line) for line in file if line.strip()]
+
+        super().__init__(
+            {
+                IP_ADDRESS: REDACTED if meta.get("local") else None,
+                USERNAME: REDACTED,
+                PASSWORD: REDACTED,
+            }
+        )
+        self._entries = deque(entries)
+        self._realtime = realtime
+        self._start: float | None = None
+
+    @property
+    def exhausted(self) -> bool:
+        """Return whether all captured requests were replayed."""
+        return not self._entries
+
+    def async_client(self, session: ClientSession | None = None) -> AsyncOncharger:
+        """Create an async client answering polls from the capture."""
+        return ReplayClient(self)
+
+    def _next(self, path: str) -> tuple[dict[str, Any], float]:
+        """Pop the next captured request of an endpoint and its delay."""
+        while self._entries and self._entries[0]["path"] != path:
+            self._entries.popleft()
+        if not self._entries:
+            raise ConnectionError("Capture exhausted")
+        entry = self._entries.popleft()
+
+        if self._start is None:
+            self._start = time.monotonic() - entry["t"]
+        if not self._realtime:
+            return entry, 0
+        return entry, self._start + entry["t"] + entry["elapsed"] - time.monotonic()
+
+    def _get_request(self, path: str, query: str | None = None) -> dict[str, Any]:
+        """Answer GET request from the capture."""
+        entry, delay = self._next(path)
+        if delay > 0:
+            time.sleep(delay)
+        return self._answer(path, entry)
+
+    def _answer(self, path: str, entry: dict[str, Any]) -> dict[str, Any]:
+        """Answer GET request with a captured entry."""
+        if error := entry.get("error"):
+            self.stats.record_error(path, error)
+            raise ConnectionError(error)
+
+        body = entry.get("body", {})
+        self.stats.record_request(path, entry["elapsed"], len(json.dumps(body)))
+        status = entry.get("status", 200)
+        if status == 403 or (isinstance(body, dict) and body.get("err.auth.msg")):
+            self.stats.record_error(path, "forbidden")
+            raise Forbidden
+        if status >= 400:
+            self.stats.record_error(path, f"http_{status}")
+            raise ConnectionError(f"HTTP {status}")
+        return body
+
+
+class ReplayClient(AsyncOncharger):
+    """Async client answering polls from a capture."""
+
+    def __init__(self, replay: ReplayOncharger) -> None:
+        """Init client."""
+        super().__init__(None, REDACTED, REDACTED, hooks=replay)
+        self._replay = replay
+
+    async def _get_request(
+        self, path: str, params: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Answer GET request from the capture."""
+        entry, delay = self._replay._next(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._replay._answer(path, entry)
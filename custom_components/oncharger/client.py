@@ -0,0 +1,311 @@
+"""Async Oncharger client that does not depend on a running Home Assistant.
+
+The integration shares the normalization of config and status with this
+module. Run it as a script to poll a fleet of chargers from a hosts file
+and write the snapshots as NDJSON:
+
+    python custom_components/oncharger/client.py hosts.txt --rounds 10
+
+Each line of the hosts file is `<ip> <login> <password>` for a local
+charger or `cloud <ocid> <password>` for a cloud charger.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import json
+import statistics
+import sys
+import time
+from typing import Any, TextIO
+from urllib.parse import urlencode
+
+import aiohttp
+
+try:
+    from .const import HTTP_TIMEOUT, URL_BASE
+except ImportError:
+    # Run as a script, outside of the package
+    from const import HTTP_TIMEOUT, URL_BASE  # type: ignore[no-redef]
+
+CLOUD_API_BASE = f"{URL_BASE}/api"
+CLOUD_HOST = "cloud"
+
+
+class OnchargerAuthError(Exception):
+    """Error to indicate the charger rejected the credentials."""
+
+
+class RequestHooks:
+    """Hooks a client calls around each request, which do nothing here."""
+
+    def request_timeout(self, path: str) -> tuple[float, float] | None:
+        """Return the connect and read timeouts of a request."""
+        return None
+
+    def record_response(
+        self, path: str, query: str | None, elapsed: float, status: int, text: str
+    ) -> None:
+        """Record a response."""
+
+    def record_failure(
+        self, path: str, query: str | None, elapsed: float, error: str
+    ) -> None:
+        """Record a request that failed without a response."""
+
+    def record_error(self, path: str, error: str) -> None:
+        """Record a response that was not usable."""
+
+
+def normalize(config: dict[str, Any], status: dict[str, Any]) -> dict[str, Any]:
+    """Merge config and status and smooth over firmware differences."""
+    if status.get("isOnline") is False:
+        raise ConnectionError("Device is offline")
+
+    data = config | status
+
+    # NOTE: cloud is amp, local is amp1
+    if data.get("amp") is None:
+        data["amp"] = data["amp1"]
+    # NOTE: 3 phase for some reason does not have volt1 but have volt
+    if data.get("volt1") is None:
+        data["volt1"] = data["volt"]
+
+    return data
+
+
+def detect_phases(data: dict[str, Any]) -> list[str]:
+    """Return the suffixes of the phase currents a snapshot reports."""
+    # NOTE: only three phase chargers report amp2 and amp3
+    if data.get("amp2") is not None and data.get("amp3") is not None:
+        return ["1", "2", "3"]
+    return [""]
+
+
+class AsyncOncharger:
+    """Async client for the local or cloud Oncharger API."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        password: str,
+        ip_address: str | None = None,
+        api_base: str = CLOUD_API_BASE,
+        timeout: float = HTTP_TIMEOUT,
+        hooks: RequestHooks | None = None,
+    ) -> None:
+        """Init client."""
+        self._session = session
+        self._username = username
+        self._password = password
+        self._ip_address = ip_address
+        self._api_base = api_base
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._hooks = hooks or RequestHooks()
+        self.raw: dict[str, dict[str, Any]] = {}
+
+    async def get_config(self) -> dict[str, Any]:
+        """Get config data."""
+        return await self._get_request("config")
+
+    async def get_status(self) -> dict[str, Any]:
+        """Get status data."""
+        return await self._get_request("status")
+
+    async def get_data(self) -> dict[str, Any]:
+        """Get normalized config and status, fetched concurrently."""
+        config, status = await asyncio.gather(self.get_config(), self.get_status())
+        self.raw = {"config": config, "status": status}
+        return normalize(config, status)
+
+    async def _get_request(
+        self, path: str, params: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Make GET request to the Oncharger API."""
+        query = urlencode(params) if params else None
+        if self._ip_address:
+            url = f"http://{self._ip_address}/{path}"
+            params = {"login": self._username, "pass": self._password, **(params or {})}
+            headers = None
+        else:
+            url = f"{self._api_base}/{path}"
+            headers = {"x-ocid": self._username, "x-password": self._password}
+
+        timeout = self._timeout
+        if timeouts := self._hooks.request_timeout(path):
+            timeout = aiohttp.ClientTimeout(
+                total=None, sock_connect=timeouts[0], sock_read=timeouts[1]
+            )
+
+        start = time.monotonic()
+        try:
+            async with self._session.get(
+                url, params=params, headers=headers, timeout=timeout
+            ) as response:
+                text = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as client_error:
+            if isinstance(client_error, aiohttp.ServerTimeoutError):
+                # NOTE: before aiohttp 3.10 only the message tells them apart
+                connect = str(client_error).startswith("Connection timeout")
+                error = "connect_timeout" if connect else "read_timeout"
+            elif isinstance(client_error, asyncio.TimeoutError):
+                error = "timeout"
+            else:
+                error = "connection"
+            self._hooks.record_failure(path, query, time.monotonic() - start, error)
+            raise ConnectionError(str(client_error) or repr(client_error)) from (
+                client_error
+            )
+        self._hooks.record_response(
+            path, query, time.monotonic() - start, response.status, text
+        )
+
+        if response.status == 403:
+            self._hooks.record_error(path, "forbidden")
+            raise OnchargerAuthError(text)
+        if response.status >= 400:
+            self._hooks.record_error(path, f"http_{response.status}")
+            raise ConnectionError(f"HTTP {response.status}")
+        try:
+            data = json.loads(text)
+        except ValueError as value_error:
+            self._hooks.record_error(path, "invalid_json")
+            raise ConnectionError(f"Invalid response: {value_error}") from value_error
+
+        if data.get("err.auth.msg"):
+            self._hooks.record_error(path, "forbidden")
+            raise OnchargerAuthError(data["err.auth.msg"])
+        return data
+
+
+@dataclass
+class Host:
+    """Charger to poll, as read from a hosts file."""
+
+    ip_address: str | None
+    username: str
+    password: str
+
+    @property
+    def name(self) -> str:
+        """Return a name for output."""
+        return self.ip_address or f"{CLOUD_HOST}/{self.username}"
+
+
+def read_hosts(lines: TextIO) -> list[Host]:
+    """Read hosts from `<ip|cloud> <login> <password>` lines."""
+    hosts = []
+    for line in lines:
+        if not (line := line.split("#", 1)[0].strip()):
+            continue
+        address, username, password = line.split()
+        hosts.append(
+            Host(None if address == CLOUD_HOST else address, username, password)
+        )
+    return hosts
+
+
+async def async_poll_fleet(args: argparse.Namespace, hosts: list[Host]) -> None:
+    """Poll all hosts concurrently and write NDJSON snapshots."""
+    output = open(args.output, "a", encoding="utf-8") if args.output else sys.stdout
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async with aiohttp.ClientSession() as session:
+        clients = [
+            AsyncOncharger(
+                session,
+                host.username,
+                host.password,
+                host.ip_address,
+                args.api_base,
+                args.timeout,
+            )
+            for host in hosts
+        ]
+
+        async def poll(host: Host, client: AsyncOncharger) -> None:
+            nonlocal errors
+            async with semaphore:
+                start = time.monotonic()
+                record: dict[str, Any] = {
+                    "time": datetime.now(timezone.utc).isoformat(),
+                    "host": host.name,
+                }
+                try:
+                    record["data"] = await client.get_data()
+                except (ConnectionError, OnchargerAuthError) as error:
+                    errors += 1
+                    record["error"] = f"{type(error).__name__}: {error}"
+                elapsed = time.monotonic() - start
+                latencies.append(elapsed)
+                record["latency"] = round(elapsed, 4)
+                output.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+        start = time.monotonic()
+        round_index = 0
+        try:
+            while not args.rounds or round_index < args.rounds:
+                round_start = time.monotonic()
+                await asyncio.gather(
+                    *(poll(host, client) for host, client in zip(hosts, clients))
+                )
+                round_index += 1
+                output.flush()
+                if not args.rounds or round_index < args.rounds:
+                    await asyncio.sleep(
+                        max(0, args.interval - (time.monotonic() - round_start))
+                    )
+        finally:
+            elapsed = time.monotonic() - start
+            if output is not sys.stdout:
+                output.close()
+
+    latencies.sort()
+    print(
+        json.dumps(
+            {
+                "hosts": len(hosts),
+                "polls": len(latencies),
+                "errors": errors,
+                "polls_per_second": round(len(latencies) / elapsed, 1),
+                "latency_p50_ms": round(latencies[len(latencies) // 2] * 1000, 1),
+                "latency_p95_ms": round(
+                    latencies[max(0, int(len(latencies) * 0.95) - 1)] * 1000, 1
+                ),
+                "latency_mean_ms": round(statistics.fmean(latencies) * 1000, 1),
+            }
+            if latencies
+            else {"hosts": len(hosts), "polls": 0}
+        ),
+        file=sys.stderr,
+    )
+
+
+def main() -> None:
+    """Parse arguments and poll the fleet."""
+    parser = argparse.ArgumentParser(description="Poll a fleet of Oncharger chargers")
+    parser.add_argument("hosts", type=argparse.FileType("r"))
+    parser.add_argument(
+        "--rounds", type=int, default=1, help="Number of polls, 0 to poll forever"
+    )
+    parser.add_argument("--interval", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=HTTP_TIMEOUT)
+    parser.add_argument("--api-base", default=CLOUD_API_BASE)
+    parser.add_argument("--output", help="Append NDJSON to a file instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(async_poll_fleet(args, read_hosts(args.hosts)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Conditioning of the phase current signal for the Oncharger boost."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import statistics
+import time
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    UnitOfElectricCurrent,
+)
+from homeassistant.core import State
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.unit_conversion import ElectricCurrentConverter
+
+from .const import (
+    CONDITIONER_EWMA_ALPHA,
+    CONDITIONER_MAX_FAILURES,
+    CONDITIONER_MEDIAN_WINDOW,
+    CONDITIONER_MIN_INTERVAL,
+    CONDITIONER_OUTLIER_FACTOR,
+    FILTER_EWMA,
+    FILTER_MEDIAN,
+)
+
+
+def parse_current(state: State | None) -> float:
+    """Return the current of a state in A, or raise ValueError."""
+    if state is None or state.state in (None, STATE_UNKNOWN, STATE_UNAVAILABLE):
+        raise ValueError("Phase current is unknown")
+
+    current = float(state.state)
+    if unit_of_measurement := state.attributes.get(ATTR_UNIT_OF_MEASUREMENT):
+        try:
+            current = ElectricCurrentConverter.convert(
+                current, unit_of_measurement, UnitOfElectricCurrent.AMPERE
+            )
+        except HomeAssistantError as conversion_error:
+            raise ValueError(str(conversion_error)) from conversion_error
+    return current
+
+
+class PhaseCurrentConditioner:
+    """Condition phase current state changes before they reach the boost.
+
+    Stages run in order and count the events they drop: repeated states and
+    attribute-only changes, unparsable states, outliers, readings that leave
+    the conditioned current unchanged, and decreases that arrive faster than
+    the rate cap. Negative currents of a phase exporting solar power are
+    valid. Increases of the load always pass the rate cap, so the charger
+    backs off without delay.
+
+    As repeated states are dropped, a reading that holds steady never fills
+    the filter by itself, so the caller settles the filter on a reading once
+    it held for the settle interval."""
+
+    def __init__(
+        self,
+        max_load: float,
+        filter_type: str | None = None,
+        min_interval: float = CONDITIONER_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize."""
+        self._min_current = -max_load
+        self._max_current = max_load * CONDITIONER_OUTLIER_FACTOR
+        self._filter_type = filter_type
+        self._min_interval = min_interval
+        self._clock = clock
+        self._window: deque[float] = deque(maxlen=CONDITIONER_MEDIAN_WINDOW)
+        self._last_state: tuple[str, Any] | None = None
+        self._reading: float | None = None
+        self._failures = 0
+        self._emitted: float | None = None
+        self._emitted_at = 0.0
+        self.value: float | None = None
+        self.sample: float | None = None
+        self.pending: float | None = None
+        self.received = 0
+        self.unchanged = 0
+        self.invalid = 0
+        self.outliers = 0
+        self.throttled = 0
+        self.emitted = 0
+
+    @property
+    def lost(self) -> bool:
+        """Return whether the signal failed too many times in a row."""
+        return self._failures >= CONDITIONER_MAX_FAILURES
+
+    @property
+    def failing(self) -> bool:
+        """Return whether the last reading was invalid."""
+        return self._failures > 0
+
+    @property
+    def settling(self) -> bool:
+        """Return whether the filter has not settled on the last reading."""
+        return not self.failing and self.value != self._reading
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until a pending value may be emitted."""
+        return max(0.0, self._emitted_at + self._min_interval - self._clock())
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Return the number of events seen and dropped per stage."""
+        return {
+            "received": self.received,
+            "unchanged": self.unchanged,
+            "invalid": self.invalid,
+            "outliers": self.outliers,
+            "throttled": self.throttled,
+            "emitted": self.emitted,
+        }
+
+    def process(self, state: State | None, resample: bool = False) -> float | None:
+        """Return the conditioned current in A to act on, or None to skip.
+
+        A resample processes the state again, even if it did not change."""
+        self.received += 1
+        self.sample = None
+
+        key = (
+            (state.state, state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+            if state
+            else None
+        )
+        if key == self._last_state and not resample:
+            self.unchanged += 1
+            return None
+        self._last_state = key
+
+        try:
+            current = parse_current(state)
+        except ValueError:
+            self.invalid += 1
+            self._failures += 1
+            return None
+
+        if not self._min_current <= current <= self._max_current:
+            self.outliers += 1
+            self._failures += 1
+            return None
+
+        self._failures = 0
+        self._reading = current
+        self.sample = self.value = self._filter(current)
+        return self._output()
+
+    def settle(self) -> float | None:
+        """Settle the filter on the last reading, as it held steady."""
+        if not self.settling:
+            return None
+        self._window.extend([self._reading] * CONDITIONER_MEDIAN_WINDOW)
+        self.value = self._reading
+        return self._output()
+
+    def flush(self) -> float | None:
+        """Return the pending value once the rate cap allows it."""
+        if self.pending is None or self.retry_in > 0:
+            return None
+        return self._emit(self.pending, self._clock())
+
+    def _output(self) -> float | None:
+        if self.value == self._emitted:
+            # A held back decrease is obsolete once the value is back
+            self.unchanged += 1
+            self.pending = None
+            return None
+
+        now = self._clock()
+        if (
+            self._emitted is not None
+            and self.value < self._emitted
+            and now - self._emitted_at < self._min_interval
+        ):
+            self.throttled += 1
+            self.pending = self.value
+            return None
+
+        return self._emit(self.value, now)
+
+    def _filter(self, current: float) -> float:
+        if self._filter_type == FILTER_MEDIAN:
+            self._window.append(current)
+            return statistics.median(self._window)
+        if self._filter_type == FILTER_EWMA and self.value is not None:
+            return self.value + CONDITIONER_EWMA_ALPHA * (current - self.value)
+        return current
+
+    def _emit(self, value: float, now: float) -> float:
+        self.pending = None
+        self._emitted = value
+        self._emitted_at = now
+        self.emitted += 1
+        return value
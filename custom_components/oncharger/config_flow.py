@@ -27,18 +27,33 @@ from .const import (
     DEVICE_NAME,
     DEVICE_TYPE,
     DOMAIN,
+    EXPORT_FORMAT,
+    EXPORT_URL,
+    FILTER_EWMA,
+    FILTER_MEDIAN,
+    FILTER_NONE,
     IP_ADDRESS,
+    LINE_PROTOCOL,
     LOCAL,
+    METER_PORT,
+    METER_PORT_DEFAULT,
+    NATIVE_BOOST,
+    NDJSON,
     PASSWORD,
     PHASE_CURRENT_ENTITY,
+    PHASE_CURRENT_FILTER,
     PHASE_MAX_LOAD_MIN,
     PHASE_MAX_LOAD,
+    PREDICTIVE_HEADROOM,
+    PRICE_ENTITY,
     SINGLE_PHASE,
+    TARIFF,
     THREE_PHASE,
     USERNAME,
 )
 from .oncharger import Oncharger
 from .coordinator import InvalidAuth, OnchargerCoordinator
+from .cost import validate_tariff
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +69,24 @@ BOOST_FIELDS = {
     vol.Optional(PHASE_MAX_LOAD, default=16): vol.All(
         vol.Coerce(int), vol.Range(min=PHASE_MAX_LOAD_MIN)
     ),
+    vol.Optional(PREDICTIVE_HEADROOM, default=False): cv.boolean,
+    vol.Optional(PHASE_CURRENT_FILTER, default=FILTER_NONE): vol.In(
+        (FILTER_NONE, FILTER_MEDIAN, FILTER_EWMA)
+    ),
+}
+METER_FIELDS = {
+    vol.Optional(NATIVE_BOOST, default=False): cv.boolean,
+    vol.Optional(METER_PORT, default=METER_PORT_DEFAULT): cv.port,
+}
+COST_FIELDS = {
+    vol.Optional(PRICE_ENTITY): selector(
+        {ATTR_ENTITY: {ATTR_DOMAIN: [Platform.SENSOR, "input_number"]}}
+    ),
+    vol.Optional(TARIFF): vol.All(cv.string, validate_tariff),
+}
+EXPORT_FIELDS = {
+    vol.Optional(EXPORT_URL): cv.string,
+    vol.Optional(EXPORT_FORMAT, default=NDJSON): vol.In((NDJSON, LINE_PROTOCOL)),
 }
 LOGIN_FIELDS = {
     vol.Required(USERNAME): cv.string,
@@ -77,7 +110,10 @@ LOCAL_SCHEMA = vol.Schema(
     }
 )
 CLOUD_SCHEMA = vol.Schema(LOGIN_FIELDS)
-OPTIONS_SCHEMA = vol.Schema(BOOST_FIELDS)
+OPTIONS_SCHEMA = vol.Schema(
+    {**BOOST_FIELDS, **METER_FIELDS, **COST_FIELDS, **EXPORT_FIELDS}
+)
+CLOUD_OPTIONS_SCHEMA = vol.Schema({**COST_FIELDS, **EXPORT_FIELDS})
 
 
 async def validate_input(hass: HomeAssistant, data: dict) -> dict[str, Any]:
@@ -88,7 +124,10 @@ async def validate_input(hass: HomeAssistant, data: dict) -> dict[str, Any]:
 
     oncharger = Oncharger(data)
     coordinator = OnchargerCoordinator(oncharger, hass)
-    coordinator_data = await coordinator.async_validate_input()
+    try:
+        coordinator_data = await coordinator.async_validate_input()
+    finally:
+        coordinator.jobs.async_close()
 
     return {"title": data[DEVICE_NAME], "unique_id": coordinator_data[CHARGER_NAME_KEY]}
 
@@ -185,15 +224,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> config_entries.FlowResult:
         """Manage the options."""
         data_schema = self.add_suggested_values_to_schema(
-            OPTIONS_SCHEMA, self.config_entry.options
+            (
+                OPTIONS_SCHEMA
+                if self.config_entry.data.get(IP_ADDRESS)
+                else CLOUD_OPTIONS_SCHEMA
+            ),
+            self.config_entry.options,
         )
 
         if user_input is None:
-            return self.async_show_form(
-                step_id="init",
-                data_schema=(
-                    data_schema if self.config_entry.data.get(IP_ADDRESS) else None
-                ),
-            )
+            return self.async_show_form(step_id="init", data_schema=data_schema)
 
         return self.async_create_entry(title="", data=user_input)
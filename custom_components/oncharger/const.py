@@ -1,27 +1,76 @@
-"""Constants for the Oncharger integration."""
+"""Constants for the Oncharger integration.
+
+This module must not import Home Assistant, client.py uses it standalone.
+"""
 
 from enum import StrEnum
-from homeassistant.const import CONF_IP_ADDRESS
 
 DOMAIN = "oncharger"
 HTTP_TIMEOUT = 5
+HTTP_TIMEOUT_MAX = 15
+LOCAL_CONNECT_TIMEOUT = 1
+LOCAL_READ_TIMEOUT_MIN = 0.5
+LOCAL_READ_TIMEOUT_MAX = HTTP_TIMEOUT
+CLOUD_CONNECT_TIMEOUT = 3
+CLOUD_READ_TIMEOUT_MIN = 3
+CLOUD_READ_TIMEOUT_MAX = HTTP_TIMEOUT_MAX
+EXECUTOR_MIN_WORKERS = 4
+EXECUTOR_MAX_WORKERS = 16
+EXECUTOR_MAX_PENDING = 4
 CLOUD_UPDATE_INTERVAL = 30
 LOCAL_UPDATE_INTERVAL = 5
+STORAGE_VERSION = 1
+SESSION_LOG_MAX = 500
+SESSION_LOG_KEEP = 250
+PHASE_ACTIVE_CURRENT = 500
+ROLLING_WINDOWS = (60, 300, 900)
+BACKFILL_BATCH_SIZE = 500
+EXPORT_BATCH_SIZE = 100
+EXPORT_BUFFER_SIZE = 5000
+EXPORT_FLUSH_INTERVAL = 10
+EXPORT_RETRY_MAX = 300
+POLL_HISTORY_SIZE = 100
+COMMAND_HISTORY_SIZE = 20
+METER_PORT_DEFAULT = 8099
+PREDICTOR_ALPHA = 0.25
+PREDICTOR_MIN_SAMPLES = 2
+CONDITIONER_MEDIAN_WINDOW = 3
+CONDITIONER_EWMA_ALPHA = 0.5
+CONDITIONER_MAX_FAILURES = 3
+CONDITIONER_MIN_INTERVAL = 5
+CONDITIONER_OUTLIER_FACTOR = 4
+CONDITIONER_SETTLE_INTERVAL = 30
 URL_BASE = "https://my.oncharger.com"
 
+# Keys of device queries and responses that identify the charger or its owner
+REDACT_KEYS = {"ip", "login", "mac", "ocid", "pass", "password", "ssid"}
+
 ATTR_ENTITY = "entity"
 
 CLOUD = "cloud"
 CONNECTION_TYPE = "connection_type"
 DEVICE_NAME = "device_name"
 DEVICE_TYPE = "device_type"
-IP_ADDRESS = CONF_IP_ADDRESS
+EXPORT_FORMAT = "export_format"
+EXPORT_URL = "export_url"
+FILTER_EWMA = "ewma"
+FILTER_MEDIAN = "median"
+FILTER_NONE = "none"
+IP_ADDRESS = "ip_address"  # CONF_IP_ADDRESS
+LINE_PROTOCOL = "line_protocol"
 LOCAL = "local"
+METER_PORT = "meter_port"
+NATIVE_BOOST = "native_boost"
+NDJSON = "ndjson"
 PASSWORD = "password"
 PHASE_CURRENT_ENTITY = "phase_current_entity"
+PHASE_CURRENT_FILTER = "phase_current_filter"
 PHASE_MAX_LOAD_MIN = 10
 PHASE_MAX_LOAD = "phase_max_load"
+PREDICTIVE_HEADROOM = "predictive_headroom"
+PRICE_ENTITY = "price_entity"
 SINGLE_PHASE = "single_phase"
+TARIFF = "tariff"
 THREE_PHASE = "three_phase"
 USERNAME = "username"
 
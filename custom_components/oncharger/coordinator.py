@@ -2,36 +2,90 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .analytics import PhaseAnalytics
+from .backfill import EnergyBackfill
+from .client import AsyncOncharger, OnchargerAuthError, detect_phases
+from .cost import CostEngine
+from .events import EdgeDetector
+from .executor import OnchargerJobs
+from .exporter import TelemetryExporter
+from .journal import CommandJournal
+from .meter import MeterServer
+from .predictor import BoostStats, LoadPredictor
 from .oncharger import Forbidden, Oncharger
+from .session import SessionTracker
+from .stats import RequestStats
 from .const import (
+    CHARGER_BOOST_TYPE_KEY,
+    CHARGER_LOCKED_UNLOCKED_KEY,
+    CHARGER_MAX_CHARGING_CURRENT_KEY,
+    CHARGER_NAME_KEY,
+    CHARGER_TOTAL_ENERGY_KEY,
     DOMAIN,
     CLOUD_UPDATE_INTERVAL,
     LOCAL_UPDATE_INTERVAL,
 )
 
+if TYPE_CHECKING:
+    from .profiler import OnchargerProfiler
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class OnchargerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Oncharger Coordinator class."""
 
-    def __init__(self, oncharger: Oncharger, hass: HomeAssistant) -> None:
+    def __init__(
+        self,
+        oncharger: Oncharger,
+        hass: HomeAssistant,
+        entry: ConfigEntry | None = None,
+    ) -> None:
         """Initialize."""
         self._oncharger = oncharger
+        self._client: AsyncOncharger | None = None
+        self.raw: dict[str, dict[str, Any]] = {}
+        self._fetch_task: asyncio.Task[dict[str, Any]] | None = None
+        self._followup = False
+        self.fetches = 0
+        self.shared_fetches = 0
+        self.followup_fetches = 0
+        self.jobs = OnchargerJobs(hass)
+        self.profiler: OnchargerProfiler | None = None
+        self.phases = ["1", "2", "3"] if oncharger.three_phase else [""]
+        self.sessions = (
+            SessionTracker(hass, entry.entry_id, self.phases) if entry else None
+        )
+        self.costs = CostEngine(hass, entry) if entry else None
+        self.backfill = EnergyBackfill(hass, entry) if entry else None
+        self.edges = EdgeDetector(hass, entry) if entry else None
+        self.exporter = TelemetryExporter(hass, entry, self.phases) if entry else None
+        self.meter = MeterServer(hass, entry, self) if entry else None
+        self.predictor = LoadPredictor(hass, entry.entry_id) if entry else None
+        self.boost_stats = (
+            self.predictor.boost_stats if self.predictor else BoostStats()
+        )
+        self.journal = CommandJournal(hass, entry.entry_id) if entry else None
+        self._replaying = False
 
         interval = (
             LOCAL_UPDATE_INTERVAL
             if self._oncharger._ip_address
             else CLOUD_UPDATE_INTERVAL
         )
+        self.analytics = PhaseAnalytics(self.phases, interval)
 
         super().__init__(
             hass,
@@ -40,40 +94,230 @@ class OnchargerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=interval),
         )
 
-    def _validate(self) -> None:
+    @property
+    def three_phase(self) -> bool:
+        """Return whether the charger reports three phases.
+
+        Until the first poll, this is the device type of the config entry."""
+        return self.phases != [""]
+
+    @property
+    def client(self) -> AsyncOncharger:
+        """Return the async client polling the device."""
+        if self._client is None:
+            self._client = self._oncharger.async_client(
+                async_get_clientsession(self.hass)
+            )
+        return self._client
+
+    @property
+    def stats(self) -> RequestStats:
+        """Return request statistics for the device."""
+        return self._oncharger.stats
+
+    async def async_load(self) -> None:
+        """Load persisted state of the device."""
+        if self.sessions:
+            await self.sessions.async_load()
+        if self.costs:
+            await self.costs.async_load()
+        if self.predictor:
+            await self.predictor.async_load()
+        if self.journal:
+            await self.journal.async_load()
+
+    async def async_remove(self) -> None:
+        """Remove persisted state of the device."""
+        if self.sessions:
+            await self.sessions.async_remove()
+        if self.costs:
+            await self.costs.async_remove()
+        if self.backfill:
+            await self.backfill.async_remove()
+        if self.predictor:
+            await self.predictor.async_remove()
+        if self.journal:
+            await self.journal.async_remove()
+
+    async def async_backfill(self, _now: datetime | None = None) -> None:
+        """Import energy statistics reconstructed from finished sessions."""
+        if self.backfill and self.sessions and self.data:
+            await self.backfill.async_import(
+                self.data[CHARGER_NAME_KEY],
+                self.data[CHARGER_TOTAL_ENERGY_KEY] / 1000,
+                self.sessions.sessions,
+            )
+
+    @property
+    def capturing(self) -> bool:
+        """Return whether traffic is being captured."""
+        return self._oncharger.capture is not None
+
+    async def async_start_capture(self, path: str) -> None:
+        """Start capturing traffic to a file."""
+        from .capture import (  # pylint: disable=import-outside-toplevel
+            TrafficRecorder,
+        )
+
+        self._oncharger.capture = await self.hass.async_add_executor_job(
+            TrafficRecorder, path, bool(self._oncharger._ip_address)
+        )
+
+    async def async_stop_capture(self) -> None:
+        """Stop capturing traffic."""
+        if (recorder := self._oncharger.capture) is None:
+            return
+        self._oncharger.capture = None
+        await self.hass.async_add_executor_job(recorder.close)
+
+    async def async_validate_input(self) -> dict[str, Any]:
         """Validate using Oncharger API."""
         try:
-            return self._oncharger.get_config()
-        except Forbidden as forbidden_error:
-            raise InvalidAuth from forbidden_error
+            return await self.client.get_config()
+        except OnchargerAuthError as auth_error:
+            raise InvalidAuth from auth_error
 
-    async def async_validate_input(self) -> None:
-        """Get new sensor data for Oncharger component."""
-        return await self.hass.async_add_executor_job(self._validate)
-
-    def _get_data(self) -> dict[str, Any]:
-        """Get new sensor data for Oncharger component."""
+    async def _async_get_data(self) -> dict[str, Any]:
+        """Fetch and normalize config and status from Oncharger."""
         try:
-            config: dict[str, Any] = self._oncharger.get_config()
-            status: dict[str, Any] = self._oncharger.get_status()
-            data = config | status
-
-            # NOTE: cloud is amp, local is amp1
-            if data.get("amp") is None:
-                data["amp"] = data["amp1"]
-            # NOTE: 3 phase for some reason does not have volt1 but have volt
-            if data.get("volt1") is None:
-                data["volt1"] = data["volt"]
-
-            return data
-        except Forbidden as forbidden_error:
-            raise InvalidAuth from forbidden_error
-        except ConnectionError as http_error:
-            raise UpdateFailed from http_error
+            data = await self.client.get_data()
+        except OnchargerAuthError as auth_error:
+            raise InvalidAuth from auth_error
+        self.raw = self.client.raw
+        return data
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh.
+
+        A request that arrives while a fetch is in flight schedules a single
+        follow-up fetch, so writes made during the fetch are not missed."""
+        if self._fetch_task is not None:
+            self._followup = True
+        await super().async_request_refresh()
 
     async def _async_update_data(self) -> dict[str, Any]:
+        """Get new sensor data, sharing the fetch that is already in flight."""
+        if self._fetch_task is None:
+            self._fetch_task = self.hass.async_create_task(
+                self._async_fetch(), f"{DOMAIN} fetch"
+            )
+        else:
+            self.shared_fetches += 1
+        return await asyncio.shield(self._fetch_task)
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        """Fetch until no follow-up was requested during the last fetch."""
+        try:
+            while True:
+                self._followup = False
+                data = await self._async_fetch_once()
+                if not self._followup:
+                    return data
+                self.followup_fetches += 1
+        finally:
+            self._fetch_task = None
+
+    async def _async_fetch_once(self) -> dict[str, Any]:
         """Get new sensor data for Oncharger component."""
-        return await self.hass.async_add_executor_job(self._get_data)
+        self.fetches += 1
+        start = time.monotonic()
+        error: str | None = None
+        try:
+            data = await self._async_get_data()
+        except ConnectionError as connection_error:
+            error = type(connection_error).__name__
+            raise UpdateFailed from connection_error
+        except HomeAssistantError as update_error:
+            error = type(update_error.__cause__ or update_error).__name__
+            raise
+        finally:
+            self.stats.record_poll(time.monotonic() - start, error)
+            if recorder := self._oncharger.capture:
+                self.hass.async_add_executor_job(recorder.flush)
+
+        if (phases := detect_phases(data)) != self.phases:
+            # NOTE: sessions, analytics and the exporter share this list
+            self.phases[:] = phases
+        self.analytics.update(data)
+        if self.sessions:
+            self.sessions.async_update(data, self.analytics.total_power)
+        if self.costs:
+            self.costs.async_update(
+                data, self.sessions.current if self.sessions else None
+            )
+        if self.exporter:
+            self.exporter.async_add(data)
+
+        return data
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners."""
+        super().async_update_listeners()
+        if self.edges and self.last_update_success:
+            self.edges.async_update(self.data)
+        if self.profiler:
+            self.profiler.async_cycle_done(self)
+        if (
+            self.journal
+            and self.journal.desired
+            and self.last_update_success
+            and not self._replaying
+        ):
+            self._replaying = True
+            self.hass.async_create_task(self._async_replay(), f"{DOMAIN} replay")
+
+    async def _async_replay(self) -> None:
+        """Apply the journaled settings in one pass after reconnecting."""
+        desired = dict(self.journal.desired)
+        try:
+            writes = await self.async_apply_profile(**desired)
+        except ConnectionError as connection_error:
+            _LOGGER.debug(f"Oncharger replay failed: {connection_error}")
+        except HomeAssistantError as rejected_error:
+            # Retrying on every poll cannot succeed, so give the settings up
+            _LOGGER.error(
+                f"Oncharger rejected {desired} on reconnect: {rejected_error}"
+            )
+            self.journal.async_clear(**desired)
+        else:
+            _LOGGER.debug(f"Oncharger replayed {desired} with {writes}")
+            self.journal.async_clear(**desired)
+        finally:
+            self._replaying = False
+
+    async def _async_write(
+        self, desired: dict[str, Any], name: str, target, *args, journal: bool = True
+    ) -> None:
+        """Write a setting, or journal it while the charger is unreachable."""
+        journal = journal and self.journal is not None
+        if journal and not self.last_update_success:
+            self._async_record(desired)
+            return
+
+        try:
+            with self.stats.command(name, **desired):
+                await self.jobs.async_run(target, *args)
+        except ConnectionError as connection_error:
+            if not journal:
+                raise
+            _LOGGER.warning(
+                f"Oncharger is unreachable, {name} will be applied on reconnect: "
+                f"{connection_error}"
+            )
+            self._async_record(desired)
+            return
+
+        if journal:
+            self.journal.async_clear(**desired)
+        await self.async_request_refresh()
+
+    @callback
+    def _async_record(self, desired: dict[str, Any]) -> None:
+        """Journal settings and show them on the entities."""
+        self.journal.async_record(**desired)
+        # Skip the replay and the edge detection, the data did not change
+        super().async_update_listeners()
 
     def _set_charging_current(self, charging_current: float) -> None:
         """Set maximum charging current for Oncharger."""
@@ -82,12 +326,20 @@ class OnchargerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except Forbidden as forbidden_error:
             raise InvalidAuth from forbidden_error
 
-    async def async_set_charging_current(self, charging_current: float) -> None:
-        """Set maximum charging current for Oncharger."""
-        await self.hass.async_add_executor_job(
-            self._set_charging_current, charging_current
+    async def async_set_charging_current(
+        self, charging_current: float, journal: bool = True
+    ) -> None:
+        """Set maximum charging current for Oncharger.
+
+        Currents that are recomputed all the time, like the boost current,
+        are not journaled, so a stale one is never replayed."""
+        await self._async_write(
+            {"charging_current": charging_current},
+            "set_charging_current",
+            self._set_charging_current,
+            charging_current,
+            journal=journal,
         )
-        await self.async_request_refresh()
 
     def _set_lock_unlock(self, lock: bool) -> None:
         """Set Oncharger to locked or unlocked."""
@@ -98,8 +350,9 @@ class OnchargerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def async_set_lock_unlock(self, lock: bool) -> None:
         """Set Oncharger to locked or unlocked."""
-        await self.hass.async_add_executor_job(self._set_lock_unlock, lock)
-        await self.async_request_refresh()
+        await self._async_write(
+            {"locked": lock}, "set_lock_unlock", self._set_lock_unlock, lock
+        )
 
     def _set_boost_config(self, *args) -> None:
         """Set Oncharger boost config."""
@@ -110,9 +363,62 @@ class OnchargerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def async_set_boost_config(self, *args) -> None:
         """Set Oncharger boost config."""
-        await self.hass.async_add_executor_job(self._set_boost_config, *args)
+        with self.stats.command("set_boost_config", boost_type=args[0]):
+            await self.jobs.async_run(self._set_boost_config, *args)
         await self.async_request_refresh()
 
+    def _apply_profile(self, writes: tuple[tuple[str, tuple], ...]) -> None:
+        """Apply several settings to Oncharger in one job."""
+        try:
+            for method, args in writes:
+                getattr(self._oncharger, method)(*args)
+        except Forbidden as forbidden_error:
+            raise InvalidAuth from forbidden_error
+
+    async def async_apply_profile(
+        self,
+        locked: bool | None = None,
+        charging_current: float | None = None,
+        boost_config: tuple[int, int, int, str] | None = None,
+    ) -> list[str]:
+        """Apply the settings that differ from the current data.
+
+        Locking happens first and unlocking last, so the car never charges
+        with a mix of old and new settings. Returns the applied writes."""
+        data = self.data or {}
+        for setting, value, key in (
+            ("locked", locked, CHARGER_LOCKED_UNLOCKED_KEY),
+            ("charging_current", charging_current, CHARGER_MAX_CHARGING_CURRENT_KEY),
+            ("boost", boost_config, CHARGER_BOOST_TYPE_KEY),
+        ):
+            if value is not None and data.get(key) is None:
+                raise HomeAssistantError(
+                    f"Cannot apply {setting}: the charger does not report {key}"
+                )
+
+        writes: list[tuple[str, tuple]] = []
+        if locked is True and not data.get(CHARGER_LOCKED_UNLOCKED_KEY):
+            writes.append(("set_lock_unlock", (True,)))
+        if boost_config is not None and (boost_config[0] == 5) != (
+            data.get(CHARGER_BOOST_TYPE_KEY) == 5
+        ):
+            writes.append(("set_boost_config", boost_config))
+        if charging_current is not None and float(charging_current) != float(
+            data.get(CHARGER_MAX_CHARGING_CURRENT_KEY)
+        ):
+            writes.append(("set_max_charging_current", (charging_current,)))
+        if locked is False and data.get(CHARGER_LOCKED_UNLOCKED_KEY):
+            writes.append(("set_lock_unlock", (False,)))
+
+        if writes:
+            with self.stats.command(
+                "apply_profile", writes=[method for method, _ in writes]
+            ):
+                await self.jobs.async_run(self._apply_profile, tuple(writes))
+            await self.async_request_refresh()
+
+        return [method for method, _ in writes]
+
 
 class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
@@ -0,0 +1,197 @@
+"""Energy cost accounting for the Oncharger integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    CHARGER_SESSION_ENERGY_KEY,
+    CHARGER_TOTAL_ENERGY_KEY,
+    DOMAIN,
+    PRICE_ENTITY,
+    STORAGE_VERSION,
+    TARIFF,
+)
+
+SAVE_INTERVAL = timedelta(seconds=60)
+TARIFF_SLOT_MINUTES = 15
+TARIFF_SLOTS = 24 * 60 // TARIFF_SLOT_MINUTES
+
+
+def parse_tariff(value: str) -> list[float]:
+    """Parse `HH:MM=price` pairs into a price per slot of the day.
+
+    Each price applies from its time until the next one, wrapping around
+    midnight, so lookups are a single list index."""
+    changes: dict[int, float] = {}
+    for part in value.replace(";", ",").split(","):
+        if not part.strip():
+            continue
+        try:
+            time, price = part.split("=")
+            hours, minutes = (int(item) for item in time.strip().split(":"))
+            if not (0 <= hours < 24 and 0 <= minutes < 60):
+                raise ValueError
+            changes[(hours * 60 + minutes) // TARIFF_SLOT_MINUTES] = float(price)
+        except ValueError as value_error:
+            raise vol.Invalid(f"Invalid tariff entry: {part.strip()}") from value_error
+    if not changes:
+        raise vol.Invalid("Tariff is empty")
+
+    price = changes[max(changes)]
+    table = []
+    for slot in range(TARIFF_SLOTS):
+        price = changes.get(slot, price)
+        table.append(price)
+    return table
+
+
+def validate_tariff(value: str) -> str:
+    """Validate a tariff option."""
+    parse_tariff(value)
+    return value
+
+
+class CostEngine:
+    """Accumulate charging cost from energy deltas between polls.
+
+    A new session or month is saved right away, other changes at most once
+    every SAVE_INTERVAL."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entry = entry
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.cost"
+        )
+        self._tariff: str | None = None
+        self._table: list[float] = []
+        self._energy: float | None = None
+        self._total: float | None = None
+        self._month: str | None = None
+        self._session: str | None = None
+        self._save_at: datetime | None = None
+        self.session_cost: float = 0
+        self.month_cost: float = 0
+        self._configured = self.configured
+
+    @property
+    def configured(self) -> bool:
+        """Return whether a price source is configured."""
+        return bool(
+            self._entry.options.get(PRICE_ENTITY) or self._entry.options.get(TARIFF)
+        )
+
+    @property
+    def reload_required(self) -> bool:
+        """Return whether a price source was added or removed since setup.
+
+        Cost sensors are only created when a price source is configured."""
+        return self.configured != self._configured
+
+    async def async_load(self) -> None:
+        """Load costs from storage."""
+        if data := await self._store.async_load():
+            self._energy = data["energy"]
+            self._total = data.get("total")
+            self._month = data["month"]
+            self._session = data["session"]
+            self.session_cost = data["session_cost"]
+            self.month_cost = data["month_cost"]
+
+    async def async_remove(self) -> None:
+        """Remove costs from storage."""
+        await self._store.async_remove()
+
+    def price(self, now: datetime) -> float | None:
+        """Return the energy price per kWh at a given time."""
+        if price_entity := self._entry.options.get(PRICE_ENTITY):
+            if (state := self._hass.states.get(price_entity)) is None:
+                return None
+            try:
+                price = float(state.state)
+            except ValueError:
+                return None
+            unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) or ""
+            if unit.endswith("/MWh"):
+                return price / 1000
+            if unit.endswith("/Wh"):
+                return price * 1000
+            return price
+
+        if tariff := self._entry.options.get(TARIFF):
+            if tariff != self._tariff:
+                self._table = parse_tariff(tariff)
+                self._tariff = tariff
+            return self._table[(now.hour * 60 + now.minute) // TARIFF_SLOT_MINUTES]
+
+        return None
+
+    @callback
+    def async_update(
+        self, data: dict[str, Any], session: dict[str, Any] | None
+    ) -> None:
+        """Add the cost of energy used since the previous poll."""
+        now = dt_util.now()
+        total = data[CHARGER_TOTAL_ENERGY_KEY] / 1000
+        energy = total + data[CHARGER_SESSION_ENERGY_KEY] / 3600000
+        changed = save_now = False
+
+        if (month := now.strftime("%Y-%m")) != self._month:
+            self._month = month
+            self.month_cost = 0
+            save_now = True
+        if session is not None and session["start"] != self._session:
+            self._session = session["start"]
+            self.session_cost = 0
+            save_now = True
+
+        # NOTE: wsec can reset at the end of a session before wat includes
+        # it, so energy only moves forward unless the lifetime counter itself
+        # went back
+        if self._energy is None or (self._total is not None and total < self._total):
+            self._energy = energy
+            changed = True
+        elif energy > self._energy:
+            if (price := self.price(now)) is not None:
+                cost = (energy - self._energy) * price
+                self.session_cost += cost
+                self.month_cost += cost
+            self._energy = energy
+            changed = True
+        if total != self._total:
+            self._total = total
+            changed = True
+
+        if save_now or self._save_at is None:
+            self._async_schedule_save(now, now)
+        elif changed and self._save_at < now:
+            self._async_schedule_save(now, max(now, self._save_at + SAVE_INTERVAL))
+
+    @callback
+    def _async_schedule_save(self, now: datetime, save_at: datetime) -> None:
+        self._save_at = save_at
+        self._store.async_delay_save(
+            self._data_to_save, (save_at - now).total_seconds()
+        )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "energy": self._energy,
+            "total": self._total,
+            "month": self._month,
+            "session": self._session,
+            "session_cost": self.session_cost,
+            "month_cost": self.month_cost,
+        }
@@ -0,0 +1,99 @@
+"""Diagnostics support for the Oncharger integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from .const import DOMAIN, EXPORT_URL, IP_ADDRESS, PASSWORD, REDACT_KEYS, USERNAME
+from .coordinator import OnchargerCoordinator
+from .lock import ENTITY_DESCRIPTIONS as LOCK_DESCRIPTIONS
+from .number import ENTITY_DESCRIPTIONS as NUMBER_DESCRIPTIONS
+from .sensor import ENTITY_DESCRIPTIONS, ENTITY_DESCRIPTIONS_1P, ENTITY_DESCRIPTIONS_3P
+from .switch import ENTITY_DESCRIPTIONS as SWITCH_DESCRIPTIONS
+
+TO_REDACT = {EXPORT_URL, IP_ADDRESS, PASSWORD, USERNAME, *REDACT_KEYS}
+
+
+def capabilities(coordinator: OnchargerCoordinator) -> dict[str, dict[str, list]]:
+    """Return which entity description keys the firmware reports per platform."""
+    data = coordinator.data or {}
+    platforms = {
+        Platform.SENSOR: {
+            **ENTITY_DESCRIPTIONS,
+            **(
+                ENTITY_DESCRIPTIONS_3P
+                if coordinator.three_phase
+                else ENTITY_DESCRIPTIONS_1P
+            ),
+        },
+        Platform.NUMBER: NUMBER_DESCRIPTIONS,
+        Platform.LOCK: LOCK_DESCRIPTIONS,
+        Platform.SWITCH: SWITCH_DESCRIPTIONS,
+    }
+    return {
+        platform: {
+            "reported": sorted(key for key in descriptions if key in data),
+            "missing": sorted(key for key in descriptions if key not in data),
+        }
+        for platform, descriptions in platforms.items()
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: OnchargerCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "data": async_redact_data(coordinator.data, TO_REDACT),
+        "raw": async_redact_data(coordinator.raw, TO_REDACT),
+        "capabilities": capabilities(coordinator),
+        "stats": coordinator.stats.as_dict(),
+        "polls": list(coordinator.stats.poll_history),
+        "commands": {
+            "pending": list(coordinator.stats.pending_commands),
+            "recent": list(coordinator.stats.commands),
+        },
+        "refresh": {
+            "fetches": coordinator.fetches,
+            "shared": coordinator.shared_fetches,
+            "followups": coordinator.followup_fetches,
+        },
+        "executor": {
+            "queue_depth": coordinator.jobs.queue_depth,
+            "submitted": coordinator.jobs.submitted,
+            "coalesced": coordinator.jobs.coalesced,
+            "rejected": coordinator.jobs.rejected,
+        },
+        "boost": {
+            "overload_seconds": coordinator.boost_stats.overload_seconds,
+            "commands": coordinator.boost_stats.commands,
+        },
+        "exporter": {
+            "exported": coordinator.exporter.exported,
+            "dropped": coordinator.exporter.dropped,
+            "failures": coordinator.exporter.failures,
+        },
+    }
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a device."""
+    return {
+        "device": {
+            "name": device.name,
+            "model": device.model,
+            "sw_version": device.sw_version,
+        },
+        **await async_get_config_entry_diagnostics(hass, entry),
+    }
@@ -0,0 +1,126 @@
+"""Edge-triggered device events for the Oncharger integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from .const import (
+    CHARGER_LOCKED_UNLOCKED_KEY,
+    CHARGER_MAX_CHARGING_CURRENT_KEY,
+    CHARGER_NAME_KEY,
+    CHARGER_STATE,
+    CHARGER_STATE_KEY,
+    ChargerState,
+    DEVICE_NAME,
+    DOMAIN,
+)
+
+PLUGGED_STATES = {ChargerState.CONNECTED, ChargerState.CHARGING}
+
+EVENT_CHARGING_STARTED = "charging_started"
+EVENT_CHARGING_STOPPED = "charging_stopped"
+EVENT_CURRENT_CHANGED = "current_changed"
+EVENT_FAULT = "fault"
+EVENT_FAULT_CLEARED = "fault_cleared"
+EVENT_LOCKED = "locked"
+EVENT_PLUGGED = "plugged"
+EVENT_UNLOCKED = "unlocked"
+EVENT_UNPLUGGED = "unplugged"
+
+EVENT_TYPES = [
+    EVENT_PLUGGED,
+    EVENT_UNPLUGGED,
+    EVENT_CHARGING_STARTED,
+    EVENT_CHARGING_STOPPED,
+    EVENT_FAULT,
+    EVENT_FAULT_CLEARED,
+    EVENT_LOCKED,
+    EVENT_UNLOCKED,
+    EVENT_CURRENT_CHANGED,
+]
+
+
+def detect_edges(
+    previous: dict[str, Any], data: dict[str, Any]
+) -> list[tuple[str, dict[str, Any]]]:
+    """Return events for the changes between two snapshots."""
+    edges: list[tuple[str, dict[str, Any]]] = []
+
+    old = CHARGER_STATE.get(previous[CHARGER_STATE_KEY], ChargerState.ERROR)
+    new = CHARGER_STATE.get(data[CHARGER_STATE_KEY], ChargerState.ERROR)
+    if old != new:
+        if old == ChargerState.ERROR:
+            edges.append((EVENT_FAULT_CLEARED, {}))
+        if old == ChargerState.READY and new in PLUGGED_STATES:
+            edges.append((EVENT_PLUGGED, {}))
+        if old != ChargerState.CHARGING and new == ChargerState.CHARGING:
+            edges.append((EVENT_CHARGING_STARTED, {}))
+        if old == ChargerState.CHARGING and new != ChargerState.CHARGING:
+            edges.append((EVENT_CHARGING_STOPPED, {}))
+        if old in PLUGGED_STATES and new == ChargerState.READY:
+            edges.append((EVENT_UNPLUGGED, {}))
+        if new == ChargerState.ERROR:
+            edges.append((EVENT_FAULT, {"code": data[CHARGER_STATE_KEY]}))
+
+    if previous.get(CHARGER_LOCKED_UNLOCKED_KEY) != data.get(
+        CHARGER_LOCKED_UNLOCKED_KEY
+    ):
+        edges.append(
+            (
+                (
+                    EVENT_LOCKED
+                    if data.get(CHARGER_LOCKED_UNLOCKED_KEY)
+                    else EVENT_UNLOCKED
+                ),
+                {},
+            )
+        )
+
+    old_current = previous.get(CHARGER_MAX_CHARGING_CURRENT_KEY)
+    new_current = data.get(CHARGER_MAX_CHARGING_CURRENT_KEY)
+    if old_current != new_current:
+        edges.append((EVENT_CURRENT_CHANGED, {"from": old_current, "to": new_current}))
+
+    return edges
+
+
+class EdgeDetector:
+    """Fire `oncharger_*` events when a new snapshot differs from the last."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entry = entry
+        self._previous: dict[str, Any] | None = None
+        self._device_id: str | None = None
+
+    @callback
+    def async_update(self, data: dict[str, Any]) -> None:
+        """Detect and fire events for a new snapshot."""
+        if data is self._previous:
+            return
+
+        if self._previous is not None:
+            for event_type, event_data in detect_edges(self._previous, data):
+                self._hass.bus.async_fire(
+                    f"{DOMAIN}_{event_type}",
+                    {ATTR_DEVICE_ID: self._async_device_id(data), **event_data},
+                )
+
+        self._previous = data
+
+    @callback
+    def _async_device_id(self, data: dict[str, Any]) -> str | None:
+        if self._device_id is None:
+            device = dr.async_get(self._hass).async_get_device(
+                identifiers={
+                    (DOMAIN, data[CHARGER_NAME_KEY], self._entry.data[DEVICE_NAME])
+                }
+            )
+            self._device_id = device.id if device else None
+        return self._device_id
@@ -0,0 +1,151 @@
+"""Bounded executor for the Oncharger integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    EXECUTOR_MAX_PENDING,
+    EXECUTOR_MAX_WORKERS,
+    EXECUTOR_MIN_WORKERS,
+)
+
+DATA_EXECUTOR = f"{DOMAIN}_executor"
+
+_T = TypeVar("_T")
+
+
+class ExecutorSaturated(ConnectionError):
+    """Error to indicate the charger has too many pending jobs."""
+
+
+class OnchargerExecutor:
+    """Thread pool shared by all Oncharger chargers.
+
+    Every charger runs at most one job at a time, and the pool grows to one
+    thread per charger up to EXECUTOR_MAX_WORKERS, so a charger that hangs
+    until its timeout only ever holds its own thread. Beyond that, chargers
+    share the threads."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.chargers = 0
+        self.workers = EXECUTOR_MIN_WORKERS
+        self.pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix=DOMAIN
+        )
+
+    def register(self) -> None:
+        """Reserve a thread for a charger."""
+        self.chargers += 1
+        if self.chargers <= self.workers or self.workers >= EXECUTOR_MAX_WORKERS:
+            return
+
+        # Running and queued jobs finish on the threads of the old pool
+        while self.workers < self.chargers:
+            self.workers *= 2
+        self.workers = min(self.workers, EXECUTOR_MAX_WORKERS)
+        old_pool = self.pool
+        self.pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix=DOMAIN
+        )
+        old_pool.shutdown(wait=False)
+
+    def release(self) -> None:
+        """Release the thread of a charger."""
+        self.chargers = max(0, self.chargers - 1)
+
+    def shutdown(self) -> None:
+        """Shut down the pool without waiting for running jobs."""
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+@callback
+def async_get_executor(hass: HomeAssistant) -> OnchargerExecutor:
+    """Return the executor shared by all Oncharger chargers."""
+    if (executor := hass.data.get(DATA_EXECUTOR)) is not None:
+        return executor
+
+    executor = OnchargerExecutor()
+    hass.data[DATA_EXECUTOR] = executor
+
+    @callback
+    def _async_shutdown(_event: Event) -> None:
+        hass.data.pop(DATA_EXECUTOR, None)
+        executor.shutdown()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+    return executor
+
+
+class OnchargerJobs:
+    """Per-charger job queue on top of the shared Oncharger thread pool.
+
+    Jobs of a charger run one at a time. Identical jobs submitted while one
+    is pending share its result, and new jobs are rejected once the charger
+    has too many of them queued."""
+
+    def __init__(
+        self, hass: HomeAssistant, max_pending: int = EXECUTOR_MAX_PENDING
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._max_pending = max_pending
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self._running = asyncio.Lock()
+        self._executor: OnchargerExecutor | None = None
+        self.submitted = 0
+        self.coalesced = 0
+        self.rejected = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of jobs pending for this charger."""
+        return len(self._pending)
+
+    async def async_run(self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking job in the Oncharger thread pool."""
+        key = (target, args)
+
+        if (future := self._pending.get(key)) is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        if len(self._pending) >= self._max_pending:
+            self.rejected += 1
+            raise ExecutorSaturated(
+                f"Too many pending jobs for charger ({len(self._pending)})"
+            )
+
+        if self._executor is None:
+            self._executor = async_get_executor(self._hass)
+            self._executor.register()
+
+        future = self._hass.loop.create_task(
+            self._async_execute(self._executor, target, *args)
+        )
+        self._pending[key] = future
+        future.add_done_callback(lambda _: self._pending.pop(key, None))
+        self.submitted += 1
+
+        return await asyncio.shield(future)
+
+    async def _async_execute(
+        self, executor: OnchargerExecutor, target: Callable[..., _T], *args: Any
+    ) -> _T:
+        async with self._running:
+            return await self._hass.loop.run_in_executor(executor.pool, target, *args)
+
+    @callback
+    def async_close(self) -> None:
+        """Give the thread of this charger back to the pool."""
+        if self._executor is not None:
+            self._executor.release()
+            self._executor = None
@@ -0,0 +1,263 @@
+"""Telemetry export for the Oncharger integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+import json
+import logging
+import socket
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    CHARGER_CURRENT_KEY,
+    CHARGER_DEVICE_TEMPERATURE_KEY,
+    CHARGER_MAX_CHARGING_CURRENT_KEY,
+    CHARGER_NAME_KEY,
+    CHARGER_SESSION_ENERGY_KEY,
+    CHARGER_STATE_KEY,
+    CHARGER_VOLTAGE_KEY,
+    EXPORT_BATCH_SIZE,
+    EXPORT_BUFFER_SIZE,
+    EXPORT_FLUSH_INTERVAL,
+    EXPORT_FORMAT,
+    EXPORT_RETRY_MAX,
+    EXPORT_URL,
+    LINE_PROTOCOL,
+)
+from .executor import async_get_executor
+
+_LOGGER = logging.getLogger(__name__)
+
+MEASUREMENT = "oncharger"
+UDP_PAYLOAD_SIZE = 1400
+HTTP_EXPORT_TIMEOUT = 10
+
+
+def encode_field(value: Any) -> str:
+    """Encode a field value as InfluxDB line protocol."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, int):
+        return f"{value}i"
+    return str(value)
+
+
+def encode_line_protocol(sample: dict[str, Any]) -> str:
+    """Encode a sample as InfluxDB line protocol."""
+    fields = ",".join(
+        f"{key}={encode_field(value)}" for key, value in sample["fields"].items()
+    )
+    charger = str(sample["charger"]).replace(" ", r"\ ").replace(",", r"\,")
+    return f"{MEASUREMENT},charger={charger} {fields} {sample['time']}"
+
+
+def encode_ndjson(sample: dict[str, Any]) -> str:
+    """Encode a sample as a JSON line."""
+    return json.dumps(
+        {
+            "time": dt_util.utc_from_timestamp(sample["time"] / 1e9).isoformat(),
+            "charger": sample["charger"],
+            **sample["fields"],
+        },
+        separators=(",", ":"),
+    )
+
+
+class TelemetryExporter:
+    """Buffer raw samples and flush them in batches to an external sink.
+
+    The buffer is bounded: when the sink is slow or down, the oldest
+    samples are dropped and counted instead of growing memory. At most one
+    flush is in flight, a failed batch is put back, and flushes back off
+    exponentially from EXPORT_FLUSH_INTERVAL up to EXPORT_RETRY_MAX until
+    the sink accepts a batch again."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        phases: list[str],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entry = entry
+        self._phases = phases
+        self._clock = clock
+        self._backoff = 0.0
+        self._retry_at = 0.0
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=EXPORT_BUFFER_SIZE)
+        self._flushing = False
+        self._socket: socket.socket | None = None
+        self.exported = 0
+        self.dropped = 0
+        self.failures = 0
+
+    @property
+    def url(self) -> str | None:
+        """Return the configured sink."""
+        return self._entry.options.get(EXPORT_URL)
+
+    @callback
+    def async_add(self, data: dict[str, Any]) -> None:
+        """Buffer a sample of a new snapshot."""
+        if not self.url:
+            return
+
+        fields = {
+            key: data[key]
+            for phase in self._phases
+            for key in (
+                f"{CHARGER_CURRENT_KEY}{phase}",
+                f"{CHARGER_VOLTAGE_KEY}{phase}",
+            )
+        }
+        for key in (
+            CHARGER_DEVICE_TEMPERATURE_KEY,
+            CHARGER_SESSION_ENERGY_KEY,
+            CHARGER_STATE_KEY,
+            CHARGER_MAX_CHARGING_CURRENT_KEY,
+        ):
+            fields[key] = data.get(key)
+
+        self._append(
+            {
+                "time": int(dt_util.utcnow().timestamp() * 1e9),
+                "charger": data[CHARGER_NAME_KEY],
+                "fields": {k: v for k, v in fields.items() if v is not None},
+            }
+        )
+
+        if (
+            len(self._buffer) >= EXPORT_BATCH_SIZE
+            and not self._flushing
+            and not self.backing_off
+        ):
+            self._hass.async_create_background_task(
+                self.async_flush(), "oncharger telemetry flush"
+            )
+
+    @property
+    def backing_off(self) -> bool:
+        """Return whether flushes wait after a failed export."""
+        return self._clock() < self._retry_at
+
+    async def async_flush(self, _now: datetime | None = None) -> None:
+        """Send buffered samples to the sink, unless backing off."""
+        if not self.backing_off:
+            await self._async_flush()
+
+    async def _async_flush(self) -> None:
+        if self._flushing or not self._buffer or not (url := self.url):
+            return
+
+        self._flushing = True
+        encode = (
+            encode_line_protocol
+            if self._entry.options.get(EXPORT_FORMAT) == LINE_PROTOCOL
+            else encode_ndjson
+        )
+        try:
+            while self._buffer:
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(EXPORT_BATCH_SIZE, len(self._buffer)))
+                ]
+                try:
+                    await self._async_send(url, [encode(sample) for sample in batch])
+                # NOTE: RuntimeError is raised once the thread pool is shut down
+                except (
+                    OSError,
+                    RuntimeError,
+                    aiohttp.ClientError,
+                    TimeoutError,
+                ) as error:
+                    self.failures += 1
+                    self._backoff = min(
+                        max(self._backoff * 2, EXPORT_FLUSH_INTERVAL), EXPORT_RETRY_MAX
+                    )
+                    self._retry_at = self._clock() + self._backoff
+                    _LOGGER.debug(
+                        f"Oncharger telemetry export failed, retrying in "
+                        f"{self._backoff}s: {error}"
+                    )
+                    for sample in reversed(batch):
+                        self._appendleft(sample)
+                    break
+                self.exported += len(batch)
+                self._backoff = self._retry_at = 0
+        finally:
+            self._flushing = False
+
+    async def async_close(self) -> None:
+        """Flush remaining samples and release resources."""
+        await self._async_flush()
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _append(self, sample: dict[str, Any]) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(sample)
+
+    def _appendleft(self, sample: dict[str, Any]) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+            return
+        self._buffer.appendleft(sample)
+
+    async def _async_send(self, url: str, lines: list[str]) -> None:
+        parsed = urlparse(url)
+
+        if parsed.scheme in ("http", "https"):
+            session = async_get_clientsession(self._hass)
+            async with session.post(
+                url,
+                data="\n".join(lines) + "\n",
+                timeout=aiohttp.ClientTimeout(total=HTTP_EXPORT_TIMEOUT),
+            ) as response:
+                response.raise_for_status()
+        elif parsed.scheme == "udp":
+            await self._async_run(self._send_udp, parsed.hostname, parsed.port, lines)
+        else:
+            # NOTE: relative paths are relative to the config directory
+            path = self._hass.config.path(
+                parsed.path if parsed.scheme == "file" else url
+            )
+            await self._async_run(self._write_file, path, lines)
+
+    async def _async_run(self, target: Callable[..., None], *args: Any) -> None:
+        """Run a blocking write in the Oncharger thread pool."""
+        pool = async_get_executor(self._hass).pool
+        await self._hass.loop.run_in_executor(pool, target, *args)
+
+    def _send_udp(self, host: str, port: int, lines: list[str]) -> None:
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        payload = b""
+        for line in lines:
+            encoded = line.encode() + b"\n"
+            if payload and len(payload) + len(encoded) > UDP_PAYLOAD_SIZE:
+                self._socket.sendto(payload, (host, port))
+                payload = b""
+            payload += encoded
+        if payload:
+            self._socket.sendto(payload, (host, port))
+
+    @staticmethod
+    def _write_file(path: str, lines: list[str]) -> None:
+        with open(path, "a", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
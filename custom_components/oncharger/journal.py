@@ -0,0 +1,53 @@
+"""Offline command journal for the Oncharger integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_VERSION
+
+SAVE_DELAY = 5
+
+
+class CommandJournal:
+    """Desired settings that could not be written to an unreachable charger.
+
+    Only the last value per setting is kept, so repeated commands from
+    automations collapse into a single write once the charger is back."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.journal"
+        )
+        self.desired: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Load desired settings from storage."""
+        if data := await self._store.async_load():
+            self.desired = data
+
+    async def async_remove(self) -> None:
+        """Remove desired settings from storage."""
+        await self._store.async_remove()
+
+    @callback
+    def async_record(self, **desired: Any) -> None:
+        """Record desired settings, replacing older values."""
+        self.desired.update(desired)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_clear(self, **applied: Any) -> None:
+        """Forget settings that were applied, unless they changed since."""
+        for key, value in applied.items():
+            if key in self.desired and self.desired[key] == value:
+                del self.desired[key]
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return self.desired
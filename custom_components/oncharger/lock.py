@@ -4,6 +4,8 @@ The lock component creates a lock entity."""
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.lock import LockEntity, LockEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -47,6 +49,14 @@ class OnchargerLock(OnchargerEntity, LockEntity):
         """Return the status of the lock."""
         return self.coordinator.data[CHARGER_LOCKED_UNLOCKED_KEY]  # type: ignore[no-any-return]
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state waiting to be applied on reconnect."""
+        journal = self.coordinator.journal
+        if journal is None or "locked" not in journal.desired:
+            return None
+        return {"desired_locked": journal.desired["locked"]}
+
     async def async_lock(self) -> None:
         """Lock charger."""
         await self.coordinator.async_set_lock_unlock(True)
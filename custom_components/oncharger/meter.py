@@ -0,0 +1,155 @@
+"""Local power meter endpoint for the Oncharger native power management."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+
+from homeassistant.components.network import async_get_source_ip
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .conditioning import parse_current
+from .const import (
+    CHARGER_VOLTAGE_KEY,
+    IP_ADDRESS,
+    METER_PORT,
+    METER_PORT_DEFAULT,
+    NATIVE_BOOST,
+    PHASE_CURRENT_ENTITY,
+    PHASE_MAX_LOAD,
+    PHASE_MAX_LOAD_MIN,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import OnchargerCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Port the charger polls when the meter address has no port
+CHARGER_METER_PORT = 80
+
+
+def meter_payload(current: float, voltages: list[float]) -> dict[str, Any]:
+    """Return a meter reading in the format polled by the charger.
+
+    Readings follow the Shelly EM status format, one meter per phase, and
+    every phase reports the same current."""
+    return {
+        "emeters": [
+            {
+                "power": round(current * voltage, 1),
+                "current": round(current, 2),
+                "voltage": round(voltage, 1),
+                "pf": 1,
+                "is_valid": True,
+            }
+            for voltage in voltages
+        ]
+    }
+
+
+class MeterServer:
+    """Serve the phase current entity as a meter for native power management.
+
+    With native boost the charger polls this endpoint at its own rate and
+    regulates itself, so Home Assistant only publishes readings. If the
+    endpoint cannot be served, boost falls back to adjusting the current
+    from Home Assistant."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, coordinator: OnchargerCoordinator
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._runner: web.AppRunner | None = None
+        self.enabled = bool(
+            entry.data.get(IP_ADDRESS) and entry.options.get(NATIVE_BOOST)
+        )
+        self.port: int = entry.options.get(METER_PORT, METER_PORT_DEFAULT)
+        self.host: str | None = None
+        self.requests = 0
+        self.fallbacks = 0
+
+    @property
+    def running(self) -> bool:
+        """Return whether the meter endpoint is being served."""
+        return self._runner is not None
+
+    @property
+    def reload_required(self) -> bool:
+        """Return whether native boost was toggled or moved since setup."""
+        return bool(self._entry.options.get(NATIVE_BOOST)) != self.running or (
+            self.running
+            and self._entry.options.get(METER_PORT, METER_PORT_DEFAULT) != self.port
+        )
+
+    async def async_start(self) -> None:
+        """Start serving the meter endpoint if native boost is enabled."""
+        if not self.enabled or self._runner is not None:
+            return
+
+        app = web.Application()
+        app.router.add_get("/", self._async_handle)
+        app.router.add_get("/status", self._async_handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        # Listen only on the interface the charger reaches us through
+        host = await async_get_source_ip(
+            self._hass, target_ip=self._entry.data[IP_ADDRESS]
+        )
+        try:
+            await web.TCPSite(runner, host, self.port).start()
+        except OSError as os_error:
+            await runner.cleanup()
+            self.enabled = False
+            _LOGGER.error(
+                f"Oncharger meter cannot listen on {host}:{self.port}, "
+                f"falling back to boost from Home Assistant: {os_error}"
+            )
+            return
+        self.host = host
+        self._runner = runner
+
+    async def async_stop(self) -> None:
+        """Stop serving the meter endpoint."""
+        if (runner := self._runner) is None:
+            return
+        self._runner = None
+        self.host = None
+        await runner.cleanup()
+
+    async def async_address(self) -> str:
+        """Return the address the charger should poll."""
+        host = self.host or await async_get_source_ip(
+            self._hass, target_ip=self._entry.data[IP_ADDRESS]
+        )
+        return host if self.port == CHARGER_METER_PORT else f"{host}:{self.port}"
+
+    def reading(self) -> float:
+        """Return the phase current in A.
+
+        An unknown current reads as the phase max load, so the charger backs
+        off instead of charging at full current."""
+        entity_id = self._entry.options.get(PHASE_CURRENT_ENTITY)
+        state = self._hass.states.get(entity_id) if entity_id else None
+        try:
+            return parse_current(state)
+        except ValueError as value_error:
+            self.fallbacks += 1
+            max_load = self._entry.options.get(PHASE_MAX_LOAD) or PHASE_MAX_LOAD_MIN
+            _LOGGER.debug(f"Oncharger meter reports {max_load}A: {value_error}")
+            return max_load
+
+    async def _async_handle(self, _request: web.Request) -> web.Response:
+        self.requests += 1
+        data = self._coordinator.data or {}
+        voltages = [
+            data.get(f"{CHARGER_VOLTAGE_KEY}{phase}", 2300) / 10
+            for phase in self._coordinator.phases
+        ]
+        return web.json_response(meter_payload(self.reading(), voltages))
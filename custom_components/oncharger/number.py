@@ -5,7 +5,7 @@ The number component allows control of charging current.
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
 from homeassistant.components.number import (
     NumberEntity,
@@ -70,6 +70,14 @@ class OnchargerNumber(OnchargerEntity, NumberEntity):
             float | None, self.coordinator.data[CHARGER_MAX_CHARGING_CURRENT_KEY]
         )
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the value waiting to be applied on reconnect."""
+        journal = self.coordinator.journal
+        if journal is None or "charging_current" not in journal.desired:
+            return None
+        return {"desired_value": journal.desired["charging_current"]}
+
     async def async_set_native_value(self, value: float) -> None:
         """Set the value of the entity."""
         await self.coordinator.async_set_charging_current(value)
@@ -3,44 +3,110 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from urllib.parse import urlparse, ParseResult
-import requests
 
+from .client import AsyncOncharger, OnchargerAuthError, RequestHooks
 from .const import (
+    CLOUD_CONNECT_TIMEOUT,
+    CLOUD_READ_TIMEOUT_MAX,
+    CLOUD_READ_TIMEOUT_MIN,
+    DEVICE_TYPE,
     HTTP_TIMEOUT,
+    HTTP_TIMEOUT_MAX,
     IP_ADDRESS,
+    LOCAL_CONNECT_TIMEOUT,
+    LOCAL_READ_TIMEOUT_MAX,
+    LOCAL_READ_TIMEOUT_MIN,
     PASSWORD,
+    THREE_PHASE,
     URL_BASE,
     USERNAME,
 )
+from .stats import RequestStats
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+    from .capture import TrafficRecorder
 
 _LOGGER = logging.getLogger(__name__)
 API_BASE = f"{URL_BASE}/api"
 
 
-class Oncharger:
-    """Oncharger instance."""
+class LatencyEstimator:
+    """Smoothed latency estimate used to derive request timeouts.
+
+    Follows the TCP retransmission timeout computation from RFC 6298."""
+
+    ALPHA = 1 / 8
+    BETA = 1 / 4
+    K = 4
+
+    def __init__(self, minimum: float, maximum: float = HTTP_TIMEOUT_MAX) -> None:
+        """Init estimator."""
+        self._minimum = minimum
+        self._maximum = maximum
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+        self.timeout: float = min(HTTP_TIMEOUT, maximum)
+
+    def sample(self, elapsed: float) -> None:
+        """Record the latency of a successful request."""
+        if self.srtt is None:
+            self.srtt = elapsed
+            self.rttvar = elapsed / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(
+                self.srtt - elapsed
+            )
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * elapsed
+
+        self.timeout = self._clamp(self.srtt + self.K * self.rttvar)
+
+    def backoff(self) -> None:
+        """Back off after a timeout, until the next successful sample."""
+        self.timeout = self._clamp(self.timeout * 2)
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self._minimum), self._maximum)
+
+
+class Oncharger(RequestHooks):
+    """Oncharger instance.
+
+    Polling goes through the shared async client, with this instance as its
+    request hooks. Writes are rare and run in the executor."""
 
     def __init__(self, data: dict[str, Any]) -> None:
         """Init oncharger."""
         self._ip_address = data.get(IP_ADDRESS)
         self._username = data[USERNAME]
         self._password = data[PASSWORD]
+        self.three_phase = data.get(DEVICE_TYPE) == THREE_PHASE
 
-    def get_config(self) -> dict[str, Any]:
-        """Get config data for Oncharger component."""
-        return self._get_request(path="config")
-
-    def get_status(self) -> dict[str, Any]:
-        """Get status data for Oncharger component."""
-        data = self._get_request(path="status")
-
-        if data.get("isOnline") is False:
-            raise ConnectionError("Device is offline")
-
-        return data
+        if self._ip_address:
+            self._connect_timeout = LOCAL_CONNECT_TIMEOUT
+            self._read_timeout_range = (LOCAL_READ_TIMEOUT_MIN, LOCAL_READ_TIMEOUT_MAX)
+        else:
+            self._connect_timeout = CLOUD_CONNECT_TIMEOUT
+            self._read_timeout_range = (CLOUD_READ_TIMEOUT_MIN, CLOUD_READ_TIMEOUT_MAX)
+        self._latency: dict[str, LatencyEstimator] = {}
+        self.stats = RequestStats()
+        self.capture: TrafficRecorder | None = None
+
+    def async_client(self, session: ClientSession) -> AsyncOncharger:
+        """Create the async client polling Oncharger over a session."""
+        return AsyncOncharger(
+            session,
+            self._username,
+            self._password,
+            self._ip_address,
+            API_BASE,
+            hooks=self,
+        )
 
     def set_max_charging_current(self, charging_current: float) -> None:
         """Set Oncharger max charging current."""
@@ -83,8 +149,49 @@ class Oncharger:
 
         return urlparse(API_BASE)
 
+    def _latency_of(self, path: str) -> LatencyEstimator:
+        """Get the latency estimate of an endpoint."""
+        if (latency := self._latency.get(path)) is None:
+            latency = LatencyEstimator(*self._read_timeout_range)
+            self._latency[path] = latency
+        return latency
+
+    def _timeout(self, path: str) -> tuple[float, float]:
+        """Get the connect and read timeouts of an endpoint."""
+        return (self._connect_timeout, self._latency_of(path).timeout)
+
+    def request_timeout(self, path: str) -> tuple[float, float]:
+        """Return the connect and read timeouts of a request."""
+        return self._timeout(path)
+
+    def record_response(
+        self, path: str, query: str | None, elapsed: float, status: int, text: str
+    ) -> None:
+        """Record a response."""
+        self._latency_of(path).sample(elapsed)
+        self.stats.record_request(path, elapsed, len(text))
+        if self.capture:
+            self.capture.record(path, query, elapsed, status, text)
+
+    def record_failure(
+        self, path: str, query: str | None, elapsed: float, error: str
+    ) -> None:
+        """Record a request that failed without a response."""
+        if error == "read_timeout":
+            self._latency_of(path).backoff()
+        self.stats.record_error(path, error)
+        if self.capture:
+            self.capture.record(path, query, elapsed, error=error)
+
+    def record_error(self, path: str, error: str) -> None:
+        """Record a response that was not usable."""
+        self.stats.record_error(path, error)
+
     def _get_request(self, path: str, query: str | None = None) -> dict[str, Any]:
         """Make GET request to the Oncharger API."""
+        # NOTE: imported here, so setting up the integration does not load it
+        import requests  # pylint: disable=import-outside-toplevel
+
         url = self._api_url._replace(path="/".join([self._api_url.path, path]))
         if query:
             url = url._replace(query="&".join([self._api_url.query, query]))
@@ -93,27 +200,49 @@ class Oncharger:
             "x-ocid": self._username,
             "x-password": self._password,
         }
-        _LOGGER.debug(f"Oncharger request: GET {url.geturl()}")
+        # NOTE: requests only reports the total time, so the read estimate
+        # also covers connecting, which keeps it on the safe side
+        timeout = self._timeout(path)
+        _LOGGER.debug(f"Oncharger request: GET {url.geturl()} (timeout {timeout})")
+        start = time.monotonic()
         try:
-            r = requests.get(url.geturl(), headers=headers, timeout=HTTP_TIMEOUT)
+            r = requests.get(url.geturl(), headers=headers, timeout=timeout)
+            self.record_response(
+                path, query, time.monotonic() - start, r.status_code, r.text
+            )
             r.raise_for_status()
             _LOGGER.debug(f"Oncharger status: {r.status_code}")
             _LOGGER.debug(f"Oncharger response: {r.text}")
             json = r.json()
 
             if json.get("err.auth.msg"):
-                raise Forbidden(response=r)
+                raise Forbidden(r.text)
 
             return json
+        except Forbidden:
+            self.record_error(path, "forbidden")
+            raise
+        except requests.exceptions.ConnectTimeout as timeout_error:
+            self.record_failure(
+                path, query, time.monotonic() - start, "connect_timeout"
+            )
+            raise ConnectionError from timeout_error
+        except requests.exceptions.Timeout as timeout_error:
+            self.record_failure(path, query, time.monotonic() - start, "read_timeout")
+            raise ConnectionError from timeout_error
         except TimeoutError as timeout_error:
+            self.record_failure(path, query, time.monotonic() - start, "timeout")
             raise ConnectionError from timeout_error
         except requests.exceptions.ConnectionError as connection_error:
+            self.record_failure(path, query, time.monotonic() - start, "connection")
             raise ConnectionError from connection_error
         except requests.exceptions.HTTPError as http_error:
             if http_error.response.status_code == 403:
+                self.record_error(path, "forbidden")
                 raise Forbidden from http_error
+            self.record_error(path, f"http_{http_error.response.status_code}")
             raise ConnectionError from http_error
 
 
-class Forbidden(requests.exceptions.RequestException):
+class Forbidden(OnchargerAuthError):
     """Error to indicate there is forbidden response."""
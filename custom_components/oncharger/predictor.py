@@ -0,0 +1,167 @@
+"""Household load prediction for the Oncharger boost."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    DOMAIN,
+    PREDICTOR_ALPHA,
+    PREDICTOR_MIN_SAMPLES,
+    STORAGE_VERSION,
+)
+
+SAVE_DELAY = 300
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+SLOTS = 7 * SLOTS_PER_DAY
+
+
+def slot_of(now: datetime) -> int:
+    """Return the time-of-week slot of a local time."""
+    return now.weekday() * SLOTS_PER_DAY + (now.hour * 60 + now.minute) // SLOT_MINUTES
+
+
+class LoadPredictor:
+    """Learn the typical peak household load per time-of-week slot.
+
+    The table has a fixed size of one week of 15 minute slots. The peak seen
+    in a slot is folded into its moving average when the slot is over, so
+    both updates and lookups are O(1). The daily boost statistics are kept
+    in the same store."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.predictor"
+        )
+        self._peaks = array("d", bytes(8 * SLOTS))
+        self._samples = array("H", bytes(2 * SLOTS))
+        self._slot: int | None = None
+        self._slot_peak = 0.0
+        self.boost_stats = BoostStats(self._async_schedule_save)
+
+    async def async_load(self) -> None:
+        """Load the load profile and boost statistics from storage."""
+        if data := await self._store.async_load():
+            self._peaks = array("d", data["peaks"])
+            self._samples = array("H", data["samples"])
+            if boost_stats := data.get("boost_stats"):
+                self.boost_stats.from_dict(boost_stats)
+
+    async def async_remove(self) -> None:
+        """Remove the load profile from storage."""
+        await self._store.async_remove()
+
+    @callback
+    def async_update(self, current: float, now: datetime | None = None) -> None:
+        """Record a household load reading in A."""
+        slot = slot_of(dt_util.as_local(now or dt_util.now()))
+        if slot != self._slot:
+            self._async_fold()
+            self._slot = slot
+            self._slot_peak = current
+        else:
+            self._slot_peak = max(self._slot_peak, current)
+
+    @callback
+    def _async_fold(self) -> None:
+        if (slot := self._slot) is None:
+            return
+        if self._samples[slot]:
+            self._peaks[slot] += PREDICTOR_ALPHA * (self._slot_peak - self._peaks[slot])
+        else:
+            self._peaks[slot] = self._slot_peak
+        self._samples[slot] = min(self._samples[slot] + 1, 0xFFFF)
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def predict(self, now: datetime | None = None) -> float | None:
+        """Return the expected peak load in A for now and the next slot."""
+        slot = slot_of(dt_util.as_local(now or dt_util.now()))
+        peaks = [
+            self._peaks[index]
+            for index in (slot, (slot + 1) % SLOTS)
+            if self._samples[index] >= PREDICTOR_MIN_SAMPLES
+        ]
+        return max(peaks) if peaks else None
+
+    def headroom(self, current: float, now: datetime | None = None) -> float:
+        """Return the current in A to reserve on top of the present load."""
+        if (peak := self.predict(now)) is None:
+            return 0.0
+        return max(0.0, peak - current)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "peaks": self._peaks.tolist(),
+            "samples": self._samples.tolist(),
+            "boost_stats": self.boost_stats.as_dict(),
+        }
+
+
+class BoostStats:
+    """Daily overload time and command counts of the boost."""
+
+    def __init__(self, on_change: Callable[[], None] | None = None) -> None:
+        """Initialize."""
+        self._on_change = on_change
+        self._day: str | None = None
+        self._overloaded_since: float | None = None
+        self.overload_seconds = 0.0
+        self.commands = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of the day."""
+        return {
+            "day": self._day,
+            "overload_seconds": self.overload_seconds,
+            "commands": self.commands,
+        }
+
+    def from_dict(self, data: dict[str, Any]) -> None:
+        """Restore the statistics of the day."""
+        self._day = data["day"]
+        self.overload_seconds = data["overload_seconds"]
+        self.commands = data["commands"]
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+    def _roll(self, now: datetime) -> None:
+        day = dt_util.as_local(now).date().isoformat()
+        if day != self._day:
+            self._day = day
+            self.overload_seconds = 0.0
+            self.commands = 0
+
+    def record_load(self, overloaded: bool, now: datetime | None = None) -> None:
+        """Record whether the phase is overloaded from now on.
+
+        Callers judge the overload from the household load and the charging
+        current of the last poll, so it lags the charger by up to a poll."""
+        now = now or dt_util.utcnow()
+        timestamp = now.timestamp()
+        self._roll(now)
+        if self._overloaded_since is not None:
+            self.overload_seconds += timestamp - self._overloaded_since
+            self._changed()
+        self._overloaded_since = timestamp if overloaded else None
+
+    def record_command(self, now: datetime | None = None) -> None:
+        """Record a charging current command."""
+        self._roll(now or dt_util.utcnow())
+        self.commands += 1
+        self._changed()
@@ -0,0 +1,73 @@
+"""On-demand profiler for the Oncharger integration."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import pstats
+from typing import Any
+
+from homeassistant.core import callback
+
+
+class OnchargerProfiler:
+    """Profile the next cycles of one or more coordinators.
+
+    The event loop is profiled for the whole window, which covers the
+    requests and parsing of the update coroutine, entity state writes and
+    boost callbacks."""
+
+    def __init__(self, cycles: int) -> None:
+        """Init profiler."""
+        self._cycles = cycles
+        self._remaining: dict[int, int] = {}
+        self._loop_profile = cProfile.Profile()
+        self._done = asyncio.Event()
+
+    def start(self, coordinators: list[Any]) -> None:
+        """Start profiling the coordinators."""
+        self._remaining = {
+            id(coordinator): self._cycles for coordinator in coordinators
+        }
+        self._loop_profile.enable()
+
+    def stop(self) -> pstats.Stats:
+        """Stop profiling and return the collected stats."""
+        self._loop_profile.disable()
+        return pstats.Stats(self._loop_profile)
+
+    async def async_wait(self) -> None:
+        """Wait until all coordinators completed their cycles."""
+        await self._done.wait()
+
+    @property
+    def cycles(self) -> int:
+        """Return the number of cycles completed by the slowest coordinator."""
+        return self._cycles - max(self._remaining.values(), default=0)
+
+    @callback
+    def async_cycle_done(self, coordinator: Any) -> None:
+        """Count a completed coordinator cycle."""
+        key = id(coordinator)
+        if self._remaining.get(key, 0) > 0:
+            self._remaining[key] -= 1
+        if not any(self._remaining.values()):
+            self._done.set()
+
+
+def hotspots(stats: pstats.Stats, top: int) -> list[dict[str, Any]]:
+    """Return the functions with the highest own time."""
+    entries = sorted(
+        stats.stats.items(),  # type: ignore[attr-defined]
+        key=lambda item: item[1][2],
+        reverse=True,
+    )
+    return [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "tottime": round(tottime, 6),
+            "cumtime": round(cumtime, 6),
+        }
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in entries[:top]
+    ]
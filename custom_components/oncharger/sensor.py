@@ -16,6 +16,8 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    EntityCategory,
+    PERCENTAGE,
     UnitOfElectricCurrent,
     UnitOfTemperature,
     UnitOfEnergy,
@@ -37,9 +39,9 @@ from .const import (
     CHARGER_TOTAL_ENERGY_KEY,
     CHARGER_VOLTAGE_KEY,
     ChargerState,
-    DEVICE_TYPE,
     DOMAIN,
-    THREE_PHASE,
+    IP_ADDRESS,
+    ROLLING_WINDOWS,
 )
 from .coordinator import OnchargerCoordinator
 from .entity import OnchargerEntity
@@ -47,6 +49,9 @@ from .entity import OnchargerEntity
 POWER_KEY = "power"
 TOTAL_POWER_KEY = "total_power"
 
+LOCAL_ENDPOINTS = ["config", "status", "api", "save-pm"]
+CLOUD_ENDPOINTS = ["config", "status", "update"]
+
 
 @dataclass
 class OnchargerSensorEntityDescription(SensorEntityDescription):
@@ -55,6 +60,14 @@ class OnchargerSensorEntityDescription(SensorEntityDescription):
     normalize: Callable[[Any], Any] | None = None
 
 
+@dataclass
+class OnchargerCoordinatorSensorEntityDescription(SensorEntityDescription):
+    """Describes Oncharger sensor entity computed by the coordinator."""
+
+    value_fn: Callable[[OnchargerCoordinator], StateType] = lambda _: None
+    attributes_fn: Callable[[OnchargerCoordinator], dict[str, Any]] | None = None
+
+
 def phase_descriptions(index="") -> dict[str, SensorEntityDescription]:
     """Generate entity descriptions for a given phase"""
     return {
@@ -79,9 +92,11 @@ def phase_descriptions(index="") -> dict[str, SensorEntityDescription]:
     }
 
 
-def phase_power_description(index="") -> SensorEntityDescription:
+def phase_power_description(
+    index="",
+) -> OnchargerCoordinatorSensorEntityDescription:
     """Generate power entity descriptions for a given phase"""
-    return OnchargerSensorEntityDescription(
+    return OnchargerCoordinatorSensorEntityDescription(
         key=f"{POWER_KEY}{index}",
         translation_key=POWER_KEY,
         icon="mdi:ev-plug-type2",
@@ -89,6 +104,28 @@ def phase_power_description(index="") -> SensorEntityDescription:
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_display_precision=0,
+        value_fn=lambda coordinator: round(coordinator.analytics.power[index], 0),
+    )
+
+
+def average_power_description(
+    window: int,
+) -> OnchargerCoordinatorSensorEntityDescription:
+    """Generate rolling average power entity description for a given window"""
+
+    def value_fn(coordinator: OnchargerCoordinator) -> StateType:
+        value = coordinator.analytics.averages.get(window)
+        return round(value, 0) if value is not None else None
+
+    return OnchargerCoordinatorSensorEntityDescription(
+        key=f"average_power_{window // 60}m",
+        translation_key=f"average_power_{window // 60}m",
+        icon="mdi:chart-line",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        suggested_display_precision=0,
+        value_fn=value_fn,
     )
 
 
@@ -112,7 +149,7 @@ TOTAL_ENERGY_DESCRIPTION = OnchargerSensorEntityDescription(
     normalize=lambda value: round(value / 1000, 2),
 )
 
-TOTAL_POWER_DESCRIPTION = OnchargerSensorEntityDescription(
+TOTAL_POWER_DESCRIPTION = OnchargerCoordinatorSensorEntityDescription(
     key=TOTAL_POWER_KEY,
     translation_key=TOTAL_POWER_KEY,
     icon="mdi:ev-plug-type2",
@@ -120,8 +157,184 @@ TOTAL_POWER_DESCRIPTION = OnchargerSensorEntityDescription(
     state_class=SensorStateClass.MEASUREMENT,
     native_unit_of_measurement=UnitOfPower.WATT,
     suggested_display_precision=0,
+    value_fn=lambda coordinator: round(coordinator.analytics.total_power, 0),
 )
 
+SESSION_PEAK_POWER_DESCRIPTION = OnchargerCoordinatorSensorEntityDescription(
+    key="session_peak_power",
+    translation_key="session_peak_power",
+    icon="mdi:chart-bell-curve",
+    device_class=SensorDeviceClass.POWER,
+    native_unit_of_measurement=UnitOfPower.WATT,
+    suggested_display_precision=0,
+    value_fn=lambda coordinator: (
+        coordinator.sessions.current["peak_power"]
+        if coordinator.sessions and coordinator.sessions.current
+        else None
+    ),
+)
+
+PHASE_DESCRIPTIONS_3P: list[OnchargerCoordinatorSensorEntityDescription] = [
+    OnchargerCoordinatorSensorEntityDescription(
+        key="max_phase_current",
+        translation_key="max_phase_current",
+        icon="mdi:current-ac",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: round(coordinator.analytics.max_current, 2),
+    ),
+    OnchargerCoordinatorSensorEntityDescription(
+        key="phase_imbalance",
+        translation_key="phase_imbalance",
+        icon="mdi:scale-unbalanced",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        value_fn=lambda coordinator: (
+            round(coordinator.analytics.imbalance, 1)
+            if coordinator.analytics.imbalance is not None
+            else None
+        ),
+        attributes_fn=lambda coordinator: {
+            f"current_{phase}": round(current, 2)
+            for phase, current in coordinator.analytics.currents.items()
+        },
+    ),
+]
+
+
+def endpoint_latency_description(
+    path: str,
+) -> OnchargerCoordinatorSensorEntityDescription:
+    """Generate latency entity description for a given endpoint"""
+
+    def value_fn(coordinator: OnchargerCoordinator) -> StateType:
+        stats = coordinator.stats.endpoints.get(path)
+        if stats is None or stats.latency_mean is None:
+            return None
+        return round(stats.latency_mean * 1000, 0)
+
+    def attributes_fn(coordinator: OnchargerCoordinator) -> dict[str, Any]:
+        return coordinator.stats.endpoint_as_dict(path)
+
+    return OnchargerCoordinatorSensorEntityDescription(
+        key=f"{path.replace('-', '_')}_latency",
+        translation_key=f"{path.replace('-', '_')}_latency",
+        icon="mdi:timer-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        value_fn=value_fn,
+        attributes_fn=attributes_fn,
+    )
+
+
+DIAGNOSTIC_DESCRIPTIONS: list[OnchargerCoordinatorSensorEntityDescription] = [
+    OnchargerCoordinatorSensorEntityDescription(
+        key="poll_duration",
+        translation_key="poll_duration",
+        icon="mdi:timer-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: (
+            round(coordinator.stats.poll_duration * 1000, 0)
+            if coordinator.stats.poll_duration is not None
+            else None
+        ),
+        attributes_fn=lambda coordinator: {"polls": coordinator.stats.polls},
+    ),
+    OnchargerCoordinatorSensorEntityDescription(
+        key="request_errors",
+        translation_key="request_errors",
+        icon="mdi:alert-circle-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.stats.error_count,
+        attributes_fn=lambda coordinator: coordinator.stats.errors,
+    ),
+    OnchargerCoordinatorSensorEntityDescription(
+        key="executor_queue_depth",
+        translation_key="executor_queue_depth",
+        icon="mdi:tray-full",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.jobs.queue_depth,
+        attributes_fn=lambda coordinator: {
+            "submitted": coordinator.jobs.submitted,
+            "coalesced": coordinator.jobs.coalesced,
+            "rejected": coordinator.jobs.rejected,
+        },
+    ),
+]
+
+SESSION_DESCRIPTIONS: list[OnchargerCoordinatorSensorEntityDescription] = [
+    OnchargerCoordinatorSensorEntityDescription(
+        key="month_energy",
+        translation_key="month_energy",
+        icon="mdi:calendar-month",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: coordinator.sessions.month_summary.get(
+            "energy", 0
+        ),
+    ),
+    OnchargerCoordinatorSensorEntityDescription(
+        key="month_sessions",
+        translation_key="month_sessions",
+        icon="mdi:counter",
+        value_fn=lambda coordinator: coordinator.sessions.month_summary.get(
+            "sessions", 0
+        ),
+    ),
+    OnchargerCoordinatorSensorEntityDescription(
+        key="last_session_energy",
+        translation_key="last_session_energy",
+        icon="mdi:history",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: (
+            coordinator.sessions.last_session["energy"]
+            if coordinator.sessions.last_session
+            else None
+        ),
+        attributes_fn=lambda coordinator: coordinator.sessions.last_session or {},
+    ),
+]
+
+COST_DESCRIPTIONS: list[OnchargerCoordinatorSensorEntityDescription] = [
+    OnchargerCoordinatorSensorEntityDescription(
+        key="session_cost",
+        translation_key="session_cost",
+        icon="mdi:cash",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: round(coordinator.costs.session_cost, 4),
+    ),
+    OnchargerCoordinatorSensorEntityDescription(
+        key="month_cost",
+        translation_key="month_cost",
+        icon="mdi:cash-multiple",
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: round(coordinator.costs.month_cost, 4),
+    ),
+]
+
 ENTITY_DESCRIPTIONS: dict[str, OnchargerSensorEntityDescription] = {
     CHARGER_STATE_KEY: OnchargerSensorEntityDescription(
         key=CHARGER_STATE_KEY,
@@ -178,27 +391,59 @@ async def async_setup_entry(
         [OnchargerTotalEnergySensor(hass, coordinator, entry, TOTAL_ENERGY_DESCRIPTION)]
     )
 
-    if entry.data.get(DEVICE_TYPE, None) == THREE_PHASE:
+    if coordinator.sessions:
         async_add_entities(
             [
-                OnchargerSensor(hass, coordinator, entry, description)
-                for ent in coordinator.data
-                if (description := ENTITY_DESCRIPTIONS_3P.get(ent))
+                OnchargerCoordinatorSensor(hass, coordinator, entry, description)
+                for description in SESSION_DESCRIPTIONS
             ]
         )
+
+    if coordinator.costs and coordinator.costs.configured:
         async_add_entities(
             [
-                OnchargerPowerSensor(
-                    hass, coordinator, entry, phase_power_description(phase)
-                )
-                for phase in ["1", "2", "3"]
+                OnchargerCostSensor(hass, coordinator, entry, description)
+                for description in COST_DESCRIPTIONS
             ]
         )
+
+    async_add_entities(
+        [
+            OnchargerCoordinatorSensor(hass, coordinator, entry, description)
+            for description in [
+                *[average_power_description(window) for window in ROLLING_WINDOWS],
+                SESSION_PEAK_POWER_DESCRIPTION,
+            ]
+        ]
+    )
+
+    endpoints = LOCAL_ENDPOINTS if entry.data.get(IP_ADDRESS) else CLOUD_ENDPOINTS
+    async_add_entities(
+        [
+            OnchargerCoordinatorSensor(hass, coordinator, entry, description)
+            for description in [
+                *DIAGNOSTIC_DESCRIPTIONS,
+                *[endpoint_latency_description(path) for path in endpoints],
+            ]
+        ]
+    )
+
+    if coordinator.three_phase:
         async_add_entities(
             [
-                OnchargerTotalPowerSensor(
-                    hass, coordinator, entry, TOTAL_POWER_DESCRIPTION
-                )
+                OnchargerSensor(hass, coordinator, entry, description)
+                for ent in coordinator.data
+                if (description := ENTITY_DESCRIPTIONS_3P.get(ent))
+            ]
+        )
+        async_add_entities(
+            [
+                OnchargerCoordinatorSensor(hass, coordinator, entry, description)
+                for description in [
+                    *[phase_power_description(phase) for phase in ["1", "2", "3"]],
+                    TOTAL_POWER_DESCRIPTION,
+                    *PHASE_DESCRIPTIONS_3P,
+                ]
             ]
         )
     else:
@@ -211,7 +456,7 @@ async def async_setup_entry(
         )
         async_add_entities(
             [
-                OnchargerPowerSensor(
+                OnchargerCoordinatorSensor(
                     hass, coordinator, entry, phase_power_description("")
                 )
             ]
@@ -245,41 +490,28 @@ class OnchargerTotalEnergySensor(OnchargerSensor):
         return cast(StateType, value) + cast(StateType, session_energy)
 
 
-class OnchargerPowerSensor(OnchargerSensor):
-    """Representation of the Oncharger power sensor."""
+class OnchargerCoordinatorSensor(OnchargerEntity, SensorEntity):
+    """Representation of the Oncharger sensor computed by the coordinator."""
+
+    entity_description: OnchargerCoordinatorSensorEntityDescription
 
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        key = self.entity_description.key
-        suffix = f"{key[-1]}" if key[-1] in ["1", "2", "3"] else ""
-        value = round(
-            (
-                self.coordinator.data[f"{CHARGER_CURRENT_KEY}{suffix}"]
-                * self.coordinator.data[f"{CHARGER_VOLTAGE_KEY}{suffix}"]
-            )
-            / 10000,
-            0,
-        )
-        return cast(StateType, value)
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes of the sensor."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self.coordinator)
 
 
-class OnchargerTotalPowerSensor(OnchargerSensor):
-    """Representation of the Oncharger total power sensor."""
+class OnchargerCostSensor(OnchargerCoordinatorSensor):
+    """Representation of the Oncharger cost sensor."""
 
     @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        value = round(
-            (
-                self.coordinator.data[f"{CHARGER_CURRENT_KEY}1"]
-                * self.coordinator.data[f"{CHARGER_VOLTAGE_KEY}1"]
-                + self.coordinator.data[f"{CHARGER_CURRENT_KEY}2"]
-                * self.coordinator.data[f"{CHARGER_VOLTAGE_KEY}2"]
-                + self.coordinator.data[f"{CHARGER_CURRENT_KEY}3"]
-                * self.coordinator.data[f"{CHARGER_VOLTAGE_KEY}3"]
-            )
-            / 10000,
-            0,
-        )
-        return cast(StateType, value)
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the currency of the sensor."""
+        return self.hass.config.currency
@@ -0,0 +1,217 @@
+"""Services for the Oncharger integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import logging
+import time
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    IP_ADDRESS,
+    PHASE_CURRENT_ENTITY,
+    PHASE_MAX_LOAD,
+    PHASE_MAX_LOAD_MIN,
+)
+from .coordinator import OnchargerCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_BOOST = "boost"
+ATTR_CHARGING_CURRENT = "charging_current"
+ATTR_CYCLES = "cycles"
+ATTR_DURATION = "duration"
+ATTR_LOCKED = "locked"
+ATTR_TOP = "top"
+
+SERVICE_APPLY_PROFILE = "apply_profile"
+SERVICE_CAPTURE = "capture"
+SERVICE_PROFILE = "profile"
+
+APPLY_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_LOCKED): cv.boolean,
+        vol.Optional(ATTR_CHARGING_CURRENT): vol.All(vol.Coerce(int), vol.Range(min=6)),
+        vol.Optional(ATTR_BOOST): cv.boolean,
+    }
+)
+
+CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=600): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=86400)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=5): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        vol.Optional(ATTR_TOP, default=20): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for Oncharger integration."""
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the next coordinator cycles."""
+        coordinators: list[OnchargerCoordinator] = list(
+            hass.data.get(DOMAIN, {}).values()
+        )
+        if not coordinators:
+            raise HomeAssistantError("No Oncharger devices are loaded")
+        if any(coordinator.profiler for coordinator in coordinators):
+            raise HomeAssistantError("Oncharger profiler is already running")
+
+        from .profiler import (  # pylint: disable=import-outside-toplevel
+            OnchargerProfiler,
+            hotspots,
+        )
+
+        cycles = call.data[ATTR_CYCLES]
+        profiler = OnchargerProfiler(cycles)
+        try:
+            profiler.start(coordinators)
+        except ValueError as value_error:
+            raise HomeAssistantError(
+                "Another profiler is already active"
+            ) from value_error
+
+        for coordinator in coordinators:
+            coordinator.profiler = profiler
+
+        # Give unreachable devices a chance, but don't wait for them forever
+        timeout = cycles * max(
+            coordinator.update_interval.total_seconds() for coordinator in coordinators
+        )
+        try:
+            async with asyncio.timeout(timeout * 2 + 30):
+                await profiler.async_wait()
+        except TimeoutError:
+            _LOGGER.warning(
+                f"Oncharger profiler timed out after {profiler.cycles} cycles"
+            )
+        finally:
+            for coordinator in coordinators:
+                coordinator.profiler = None
+            stats = profiler.stop()
+
+        path = hass.config.path(f"{DOMAIN}_profile_{int(time.time())}.prof")
+        await hass.async_add_executor_job(stats.dump_stats, path)
+
+        return {
+            "path": path,
+            "cycles": profiler.cycles,
+            "hotspots": hotspots(stats, call.data[ATTR_TOP]),
+        }
+
+    async def async_apply_profile(call: ServiceCall) -> ServiceResponse:
+        """Apply lock, current and boost settings in one go."""
+        device = dr.async_get(hass).async_get(call.data[ATTR_DEVICE_ID])
+        entry = next(
+            (
+                entry
+                for entry_id in (device.config_entries if device else [])
+                if (entry := hass.config_entries.async_get_entry(entry_id))
+                and entry.entry_id in hass.data.get(DOMAIN, {})
+            ),
+            None,
+        )
+        if entry is None:
+            raise HomeAssistantError("Device is not a loaded Oncharger device")
+        coordinator: OnchargerCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+        charging_current = call.data.get(ATTR_CHARGING_CURRENT)
+        boost_config = None
+        if (boost := call.data.get(ATTR_BOOST)) is not None:
+            if not entry.data.get(IP_ADDRESS) or not entry.options.get(
+                PHASE_CURRENT_ENTITY
+            ):
+                raise HomeAssistantError("Boost is not configured for this device")
+            meter = coordinator.meter
+            boost_config = (
+                5 if boost else 0,
+                entry.options[PHASE_MAX_LOAD],
+                0,
+                await meter.async_address() if boost and meter.enabled else "",
+            )
+            if not boost and charging_current is None:
+                charging_current = PHASE_MAX_LOAD_MIN
+
+        writes = await coordinator.async_apply_profile(
+            locked=call.data.get(ATTR_LOCKED),
+            charging_current=charging_current,
+            boost_config=boost_config,
+        )
+        return {"writes": writes}
+
+    async def async_capture(call: ServiceCall) -> ServiceResponse:
+        """Capture redacted traffic of all devices for a while."""
+        coordinators: list[OnchargerCoordinator] = list(
+            hass.data.get(DOMAIN, {}).values()
+        )
+        if not coordinators:
+            raise HomeAssistantError("No Oncharger devices are loaded")
+        if any(coordinator.capturing for coordinator in coordinators):
+            raise HomeAssistantError("Oncharger capture is already running")
+
+        timestamp = int(time.time())
+        paths = []
+        for index, coordinator in enumerate(coordinators):
+            path = hass.config.path(f"{DOMAIN}_capture_{timestamp}_{index}.ndjson")
+            await coordinator.async_start_capture(path)
+            paths.append(path)
+
+        async def async_stop(_now: datetime) -> None:
+            for coordinator in coordinators:
+                await coordinator.async_stop_capture()
+
+        async_call_later(hass, call.data[ATTR_DURATION], async_stop)
+
+        return {"paths": paths}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        async_apply_profile,
+        schema=APPLY_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CAPTURE,
+        async_capture,
+        schema=CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,171 @@
+"""Charging session tracking for the Oncharger integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    CHARGER_CURRENT_KEY,
+    CHARGER_SESSION_ELAPSED_KEY,
+    CHARGER_SESSION_ENERGY_KEY,
+    CHARGER_STATE,
+    CHARGER_STATE_KEY,
+    ChargerState,
+    DOMAIN,
+    PHASE_ACTIVE_CURRENT,
+    SESSION_LOG_KEEP,
+    SESSION_LOG_MAX,
+    STORAGE_VERSION,
+)
+
+ACTIVE_STATES = {ChargerState.CONNECTED, ChargerState.CHARGING}
+SAVE_INTERVAL = timedelta(seconds=60)
+
+
+class SessionTracker:
+    """Detect charging sessions and keep a compacted log of them.
+
+    Sessions are appended to the log as they end. Once the log grows past
+    SESSION_LOG_MAX it is compacted to the latest SESSION_LOG_KEEP sessions,
+    while monthly totals are kept in an index that is never compacted.
+
+    Sessions are saved as soon as they start or end, and at most once every
+    SAVE_INTERVAL while they are running."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, phases: list[str]) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.sessions"
+        )
+        self._phases = phases
+        self._state: ChargerState | None = None
+        self._session_energy: int | None = None
+        self._save_at: datetime | None = None
+        self._save_now = False
+        self.current: dict[str, Any] | None = None
+        self.sessions: list[dict[str, Any]] = []
+        self.index: dict[str, dict[str, float]] = {}
+
+    async def async_load(self) -> None:
+        """Load sessions from storage."""
+        if data := await self._store.async_load():
+            self.current = data.get("current")
+            self.sessions = data.get("sessions", [])
+            self.index = data.get("index", {})
+
+    async def async_remove(self) -> None:
+        """Remove sessions from storage."""
+        await self._store.async_remove()
+
+    @property
+    def month_summary(self) -> dict[str, float]:
+        """Return totals of the current month."""
+        return self.index.get(dt_util.now().strftime("%Y-%m"), {})
+
+    @property
+    def last_session(self) -> dict[str, Any] | None:
+        """Return the last finished session."""
+        return self.sessions[-1] if self.sessions else None
+
+    @callback
+    def async_update(self, data: dict[str, Any], power: float) -> None:
+        """Update sessions from a new snapshot and its total power in W."""
+        now = dt_util.utcnow()
+        state = CHARGER_STATE.get(data[CHARGER_STATE_KEY], ChargerState.ERROR)
+        session_energy = data[CHARGER_SESSION_ENERGY_KEY]
+
+        if state == ChargerState.READY:
+            self._async_end(now)
+        elif state in ACTIVE_STATES:
+            reset = (
+                self._session_energy is not None
+                and session_energy < self._session_energy
+            )
+            if reset:
+                self._async_end(now)
+            if self.current is None and (reset or self._state not in ACTIVE_STATES):
+                self._async_start(now)
+
+        if self.current is not None:
+            self._async_sample(now, data, power)
+
+        if self._save_now or (self.current is not None and self._save_at is None):
+            self._save_now = False
+            self._async_schedule_save(now, now)
+        elif self.current is not None and self._save_at < now:
+            self._async_schedule_save(now, max(now, self._save_at + SAVE_INTERVAL))
+
+        self._state = state
+        self._session_energy = session_energy
+
+    @callback
+    def _async_start(self, now: datetime) -> None:
+        self.current = {
+            "start": now.isoformat(),
+            "energy": 0.0,
+            "duration": 0,
+            "peak_power": 0.0,
+            "phases": [],
+        }
+        self._save_now = True
+
+    @callback
+    def _async_sample(self, now: datetime, data: dict[str, Any], power: float) -> None:
+        session = self.current
+        session["energy"] = round(data[CHARGER_SESSION_ENERGY_KEY] / 3600000, 3)
+        session["duration"] = data.get(CHARGER_SESSION_ELAPSED_KEY) or int(
+            (now - dt_util.parse_datetime(session["start"])).total_seconds()
+        )
+        session["peak_power"] = max(session["peak_power"], round(power, 0))
+        session["phases"] = sorted(
+            set(session["phases"])
+            | {
+                phase or "1"
+                for phase in self._phases
+                if data[f"{CHARGER_CURRENT_KEY}{phase}"] >= PHASE_ACTIVE_CURRENT
+            }
+        )
+
+    @callback
+    def _async_end(self, now: datetime) -> None:
+        if (session := self.current) is None:
+            return
+        self.current = None
+
+        if session["energy"] > 0:
+            session["end"] = now.isoformat()
+            session["average_power"] = (
+                round(session["energy"] * 3600000 / session["duration"], 0)
+                if session["duration"]
+                else 0
+            )
+            self.sessions.append(session)
+
+            month = self.index.setdefault(
+                dt_util.as_local(now).strftime("%Y-%m"),
+                {"energy": 0.0, "sessions": 0, "duration": 0},
+            )
+            month["energy"] = round(month["energy"] + session["energy"], 3)
+            month["sessions"] += 1
+            month["duration"] += session["duration"]
+
+        self._save_now = True
+
+    @callback
+    def _async_schedule_save(self, now: datetime, save_at: datetime) -> None:
+        self._save_at = save_at
+        self._store.async_delay_save(
+            self._data_to_save, (save_at - now).total_seconds()
+        )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        if len(self.sessions) > SESSION_LOG_MAX:
+            self.sessions = self.sessions[-SESSION_LOG_KEEP:]
+
+        return {"current": self.current, "sessions": self.sessions, "index": self.index}
@@ -0,0 +1,166 @@
+"""Request statistics for the Oncharger integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+
+from .const import COMMAND_HISTORY_SIZE, POLL_HISTORY_SIZE
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+@dataclass
+class EndpointStats:
+    """Statistics for a single Oncharger endpoint."""
+
+    requests: int = 0
+    payload_bytes: int = 0
+    latency_sum: float = 0
+    latency_max: float = 0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    errors: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def latency_mean(self) -> float | None:
+        """Return the mean latency in seconds."""
+        return self.latency_sum / self.requests if self.requests else None
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed requests."""
+        return sum(self.errors.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return statistics as a serializable dict."""
+        return {
+            "requests": self.requests,
+            "payload_bytes": self.payload_bytes,
+            "latency_mean": self.latency_mean,
+            "latency_max": self.latency_max,
+            "histogram": {
+                f"le_{bound}": count
+                for bound, count in zip(
+                    [*LATENCY_BUCKETS, "inf"], self.histogram, strict=True
+                )
+            },
+            "errors": dict(self.errors),
+        }
+
+
+class RequestStats:
+    """Statistics for all requests and polls of an Oncharger device."""
+
+    def __init__(self) -> None:
+        """Init stats."""
+        self._lock = threading.Lock()
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.polls = 0
+        self.poll_duration: float | None = None
+        self.poll_duration_sum: float = 0
+        self.poll_history: deque[dict[str, Any]] = deque(maxlen=POLL_HISTORY_SIZE)
+        self.pending_commands: list[dict[str, Any]] = []
+        self.commands: deque[dict[str, Any]] = deque(maxlen=COMMAND_HISTORY_SIZE)
+
+    def record_request(self, path: str, elapsed: float, payload_bytes: int) -> None:
+        """Record a completed request."""
+        with self._lock:
+            stats = self._endpoint(path)
+            stats.requests += 1
+            stats.payload_bytes += payload_bytes
+            stats.latency_sum += elapsed
+            stats.latency_max = max(stats.latency_max, elapsed)
+            stats.histogram[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    def record_error(self, path: str, error: str) -> None:
+        """Record a failed request by error class."""
+        with self._lock:
+            errors = self._endpoint(path).errors
+            errors[error] = errors.get(error, 0) + 1
+
+    def record_poll(self, duration: float, error: str | None = None) -> None:
+        """Record the duration and error of a coordinator poll."""
+        self.polls += 1
+        self.poll_duration = duration
+        self.poll_duration_sum += duration
+        self.poll_history.append(
+            {
+                "time": dt_util.utcnow().isoformat(),
+                "duration": round(duration, 4),
+                "error": error,
+            }
+        )
+
+    @contextmanager
+    def command(self, name: str, **args: Any) -> Iterator[None]:
+        """Track a command while it is queued or running, then keep it."""
+        command: dict[str, Any] = {
+            "command": name,
+            "args": args,
+            "queued": dt_util.utcnow().isoformat(),
+            "latency": None,
+            "error": None,
+        }
+        self.pending_commands.append(command)
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as err:
+            command["error"] = type(err.__cause__ or err).__name__
+            raise
+        finally:
+            command["latency"] = round(time.monotonic() - start, 4)
+            self.pending_commands.remove(command)
+            self.commands.append(command)
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed requests across endpoints."""
+        with self._lock:
+            return sum(stats.error_count for stats in self.endpoints.values())
+
+    @property
+    def errors(self) -> dict[str, int]:
+        """Return failed requests across endpoints by error class."""
+        errors: dict[str, int] = {}
+        with self._lock:
+            for stats in self.endpoints.values():
+                for error, count in stats.errors.items():
+                    errors[error] = errors.get(error, 0) + count
+        return errors
+
+    def endpoint_as_dict(self, path: str) -> dict[str, Any]:
+        """Return statistics of an endpoint as a serializable dict."""
+        with self._lock:
+            stats = self.endpoints.get(path)
+            return stats.as_dict() if stats else {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return statistics as a serializable dict."""
+        with self._lock:
+            return {
+                "polls": self.polls,
+                "poll_duration": self.poll_duration,
+                "poll_duration_mean": (
+                    self.poll_duration_sum / self.polls if self.polls else None
+                ),
+                "endpoints": {
+                    path: stats.as_dict() for path, stats in self.endpoints.items()
+                },
+            }
+
+    def _endpoint(self, path: str) -> EndpointStats:
+        if (stats := self.endpoints.get(path)) is None:
+            stats = EndpointStats()
+            self.endpoints[path] = stats
+        return stats
@@ -3,31 +3,44 @@
 The switch component creates a switch entity."""
 
 from __future__ import annotations
+from collections.abc import Callable
+from datetime import datetime
 import logging
 import math
+import time
+from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    UnitOfElectricCurrent,
-    STATE_UNKNOWN,
-    ATTR_UNIT_OF_MEASUREMENT,
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    Event,
+    EventStateChangedData,
+    callback,
 )
-from homeassistant.core import HomeAssistant, Event, EventStateChangedData
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.util.unit_conversion import ElectricCurrentConverter
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
 
 from .const import (
     CHARGER_BOOST_NATIVE_KEY,
     CHARGER_BOOST_TYPE_KEY,
+    CHARGER_MAX_AVAILABLE_POWER_KEY,
     CHARGER_MAX_CHARGING_CURRENT_KEY,
+    CONDITIONER_MIN_INTERVAL,
+    CONDITIONER_SETTLE_INTERVAL,
     DOMAIN,
     IP_ADDRESS,
     PHASE_CURRENT_ENTITY,
+    PHASE_CURRENT_FILTER,
     PHASE_MAX_LOAD_MIN,
     PHASE_MAX_LOAD,
+    PREDICTIVE_HEADROOM,
 )
+from .conditioning import PhaseCurrentConditioner
 from .coordinator import OnchargerCoordinator
 from .entity import OnchargerEntity
 
@@ -60,21 +73,63 @@ async def async_setup_entry(
 class OnchargerSwitch(OnchargerEntity, SwitchEntity):
     """Representation of a Oncharger switch."""
 
+    _reserved_current = 0.0
+    _flush_unsub: CALLBACK_TYPE | None = None
+    _recheck_unsub: CALLBACK_TYPE | None = None
+    _settle_unsub: CALLBACK_TYPE | None = None
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: OnchargerCoordinator,
+        entry: ConfigEntry,
+        description: SwitchEntityDescription,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a Oncharger switch."""
+        super().__init__(hass, coordinator, entry, description)
+        self._clock = clock
+        self._conditioner = self._create_conditioner()
+
+    def _create_conditioner(self) -> PhaseCurrentConditioner:
+        return PhaseCurrentConditioner(
+            self._entry.options.get(PHASE_MAX_LOAD) or PHASE_MAX_LOAD_MIN,
+            self._entry.options.get(PHASE_CURRENT_FILTER),
+            clock=self._clock,
+        )
+
     @property
     def phase_current_entity_id(self) -> str | None:
         """Return the entity id for phase current."""
         return self._entry.options.get(PHASE_CURRENT_ENTITY)
 
+    @property
+    def native(self) -> bool:
+        """Return whether boost uses the native power management."""
+        return self.coordinator.meter is not None and self.coordinator.meter.enabled
+
     @property
     def available(self) -> bool:
         """Return the availability of the switch.
         If user didn't set the entity, we are not available.
-        If user has native device boosting, we don't want to interfere."""
-        return (
-            super().available
-            and self.phase_current_entity_id
-            and self.coordinator.data[CHARGER_BOOST_NATIVE_KEY] == 0
-        )
+        If user has native device boosting, we don't want to interfere,
+        unless it reads the meter served by us."""
+        if not super().available or not self.phase_current_entity_id:
+            return False
+        if self.native:
+            return self.coordinator.meter.running
+        return self.coordinator.data[CHARGER_BOOST_NATIVE_KEY] == 0
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the boost statistics of today."""
+        return {
+            "overload_seconds": round(self.coordinator.boost_stats.overload_seconds),
+            "commands": self.coordinator.boost_stats.commands,
+            "predictive_headroom": bool(self._entry.options.get(PREDICTIVE_HEADROOM)),
+            "reserved_current": round(self._reserved_current, 1),
+            "phase_current_events": self._conditioner.counters,
+        }
 
     @property
     def is_on(self) -> bool:
@@ -87,7 +142,7 @@ class OnchargerSwitch(OnchargerEntity, SwitchEntity):
             5,
             self._entry.options[PHASE_MAX_LOAD],
             0,
-            "",
+            await self.coordinator.meter.async_address() if self.native else "",
         )
 
     async def async_turn_off(self) -> None:
@@ -105,10 +160,13 @@ class OnchargerSwitch(OnchargerEntity, SwitchEntity):
         await super().async_added_to_hass()
 
         async def update_listener(_hass, _entry):
-            if self.available and self.is_on:
+            self._async_cancel_flush()
+            self._conditioner = self._create_conditioner()
+            if self.available and self.is_on and not self.native:
                 await self._async_phase_current_changed_update()
 
         self._entry.async_on_unload(self._entry.add_update_listener(update_listener))
+        self.async_on_remove(self._async_cancel_flush)
         await update_listener(self.hass, self._entry)
 
         if not self.phase_current_entity_id:
@@ -120,9 +178,9 @@ class OnchargerSwitch(OnchargerEntity, SwitchEntity):
             self._async_phase_current_changed_event,
         )
 
-    async def _async_phase_current_changed_update(self):
+    async def _async_phase_current_changed_update(self, resample: bool = False):
         await self._async_phase_current_changed(
-            self.hass.states.get(self.phase_current_entity_id)
+            self.hass.states.get(self.phase_current_entity_id), resample
         )
 
     async def _async_phase_current_changed_event(
@@ -130,40 +188,116 @@ class OnchargerSwitch(OnchargerEntity, SwitchEntity):
     ):
         await self._async_phase_current_changed(event.data["new_state"])
 
-    async def _async_phase_current_changed(self, new_state):
+    async def _async_phase_current_changed(self, new_state, resample=False):
         """Handle phase current changes."""
+        conditioner = self._conditioner
+        current = conditioner.process(new_state, resample)
+        predictor = self.coordinator.predictor
+        if conditioner.sample is not None and predictor:
+            predictor.async_update(conditioner.sample)
 
-        if not self.available or not self.is_on:
+        if not self.available or not self.is_on or self.native:
             return
 
-        if (
-            new_state is None
-            or new_state.state is None
-            or new_state.state == STATE_UNKNOWN
-        ):
-            return await self._async_set_charging_current(PHASE_MAX_LOAD_MIN)
-
-        try:
-            current = float(new_state.state)
-        except Exception as exception_error:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                f"Unexpected exception in phase current {exception_error}"
+        if current is not None:
+            await self._async_apply_phase_current(current)
+        elif conditioner.lost:
+            if self.coordinator.data[CHARGER_MAX_CHARGING_CURRENT_KEY] != (
+                PHASE_MAX_LOAD_MIN
+            ):
+                _LOGGER.warning(
+                    f"Phase current is unavailable, limiting to {PHASE_MAX_LOAD_MIN}A"
+                )
+                await self._async_set_charging_current(PHASE_MAX_LOAD_MIN)
+        elif conditioner.pending is not None and self._flush_unsub is None:
+            self._flush_unsub = async_call_later(
+                self.hass, conditioner.retry_in, self._async_flush_phase_current
             )
-            return await self._async_set_charging_current(PHASE_MAX_LOAD_MIN)
 
-        unit_of_measurement = new_state.attributes[ATTR_UNIT_OF_MEASUREMENT]
-        if unit_of_measurement:
-            current = ElectricCurrentConverter.convert(
-                current, unit_of_measurement, UnitOfElectricCurrent.AMPERE
-            )
+        if conditioner.failing:
+            # An entity that stays unavailable changes state only once
+            if not conditioner.lost and self._recheck_unsub is None:
+                self._recheck_unsub = async_call_later(
+                    self.hass,
+                    CONDITIONER_MIN_INTERVAL,
+                    self._async_recheck_phase_current,
+                )
+        elif conditioner.sample is not None:
+            # A steady reading is not repeated, so settle once it held
+            self._async_cancel_settle()
+            if conditioner.settling:
+                self._settle_unsub = async_call_later(
+                    self.hass,
+                    CONDITIONER_SETTLE_INTERVAL,
+                    self._async_settle_phase_current,
+                )
+
+    async def _async_recheck_phase_current(self, _now: datetime) -> None:
+        """Process an invalid phase current again until it is lost."""
+        self._recheck_unsub = None
+        await self._async_phase_current_changed_update(resample=True)
+
+    async def _async_settle_phase_current(self, _now: datetime) -> None:
+        """Apply the phase current the filter settled on."""
+        self._settle_unsub = None
+        current = self._conditioner.settle()
+        if current is None or not self.available or not self.is_on or self.native:
+            return
+        await self._async_apply_phase_current(current)
+
+    async def _async_flush_phase_current(self, _now: datetime) -> None:
+        """Apply a phase current decrease held back by the rate cap."""
+        self._flush_unsub = None
+        current = self._conditioner.flush()
+        if current is None or not self.available or not self.is_on or self.native:
+            return
+        await self._async_apply_phase_current(current)
 
-        available_current = self._entry.options[PHASE_MAX_LOAD] - math.ceil(current)
+    async def _async_apply_phase_current(self, current: float) -> None:
+        """Set the charging current from the phase current in A."""
+        predictor = self.coordinator.predictor
+        max_load = self._entry.options[PHASE_MAX_LOAD]
+        # NOTE: the charger draw is approximated by the highest phase current
+        # of the last poll
+        self.coordinator.boost_stats.record_load(
+            current + (self.coordinator.analytics.max_current or 0) > max_load
+        )
+
+        self._reserved_current = (
+            predictor.headroom(current)
+            if predictor and self._entry.options.get(PREDICTIVE_HEADROOM)
+            else 0.0
+        )
+        available_current = max_load - math.ceil(current + self._reserved_current)
+        # A phase exporting solar power leaves more than the max load
+        if (
+            charger_max := self.coordinator.data.get(CHARGER_MAX_AVAILABLE_POWER_KEY)
+        ) is not None:
+            available_current = min(available_current, charger_max)
         if available_current != float(
             self.coordinator.data[CHARGER_MAX_CHARGING_CURRENT_KEY]
         ):
             await self._async_set_charging_current(available_current)
 
+    @callback
+    def _async_cancel_flush(self) -> None:
+        """Cancel a scheduled phase current flush, recheck or settle."""
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+        if self._recheck_unsub is not None:
+            self._recheck_unsub()
+            self._recheck_unsub = None
+        self._async_cancel_settle()
+
+    @callback
+    def _async_cancel_settle(self) -> None:
+        if self._settle_unsub is not None:
+            self._settle_unsub()
+            self._settle_unsub = None
+
     async def _async_set_charging_current(self, value: float) -> None:
         """Set the charging current."""
         _LOGGER.debug(f"Oncharger boost setting current: {value}")
-        await self.coordinator.async_set_charging_current(value)
+        self.coordinator.boost_stats.record_command()
+        await self.coordinator.async_set_charging_current(value, journal=False)
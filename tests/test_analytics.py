@@ -0,0 +1,48 @@
+"""Tests for the Oncharger power analytics."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.oncharger.analytics import PhaseAnalytics
+from custom_components.oncharger.const import CHARGER_CURRENT_KEY, CHARGER_VOLTAGE_KEY
+
+
+def snapshot(currents: dict[str, int], voltage: int = 2300) -> dict[str, int]:
+    """Return charger data with phase currents in mA and voltages in dV."""
+    data = {}
+    for phase, current in currents.items():
+        data[f"{CHARGER_CURRENT_KEY}{phase}"] = current
+        data[f"{CHARGER_VOLTAGE_KEY}{phase}"] = voltage
+    return data
+
+
+def test_phase_vector_is_aggregated() -> None:
+    """Power, peak current and imbalance come from all phases."""
+    analytics = PhaseAnalytics(["1", "2", "3"], 5)
+    analytics.update(snapshot({"1": 16000, "2": 16000, "3": 10000}), 0)
+
+    assert analytics.currents == {"1": 16, "2": 16, "3": 10}
+    assert analytics.power == {"1": 3680, "2": 3680, "3": 2300}
+    assert analytics.total_power == 9660
+    assert analytics.max_current == 16
+    assert analytics.imbalance == pytest.approx(4 / 14 * 100)
+
+    analytics.update(snapshot({"1": 0, "2": 0, "3": 0}), 5)
+    assert analytics.imbalance is None
+
+
+def test_rolling_averages_are_time_weighted() -> None:
+    """A sample counts for the time since the previous one, even across gaps."""
+    analytics = PhaseAnalytics([""], 5)
+    analytics.update(snapshot({"": 10000}, 1000), 10)
+    analytics.update(snapshot({"": 30000}, 1000), 40)
+    assert analytics.averages == {
+        60: pytest.approx(95000 / 35),
+        300: pytest.approx(95000 / 35),
+        900: pytest.approx(95000 / 35),
+    }
+
+    analytics.update(snapshot({"": 0}, 1000), 100)
+    assert analytics.averages[60] == 0
+    assert analytics.averages[300] == pytest.approx(95000 / 95)
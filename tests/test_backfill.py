@@ -0,0 +1,84 @@
+"""Tests for the Oncharger energy statistics backfill."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.backfill import (
+    EnergyBackfill,
+    hourly_energy,
+    hourly_sums,
+)
+
+SESSIONS = [
+    {
+        "start": "2026-01-01T10:30:00+00:00",
+        "end": "2026-01-01T12:00:00+00:00",
+        "energy": 3.0,
+    },
+    {
+        "start": "2026-01-01T14:00:00+00:00",
+        "end": "2026-01-01T14:30:00+00:00",
+        "energy": 1.0,
+    },
+]
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    """Return a time on the day of the sessions."""
+    return datetime(2026, 1, 1, hour, minute, tzinfo=timezone.utc)
+
+
+def test_session_energy_is_spread_over_hours() -> None:
+    """Energy is split over the hours a session spans."""
+    assert hourly_energy(SESSIONS, at(0)) == {at(10): 1.0, at(11): 2.0, at(14): 1.0}
+    assert hourly_energy(SESSIONS, at(13)) == {at(14): 1.0}
+
+
+def test_sums_end_at_the_lifetime_counter() -> None:
+    """Sums count back from the total, leaving out hours not yet complete."""
+    hours = hourly_energy(SESSIONS, at(0))
+    rows = hourly_sums(hours, 100, at(14))
+    assert [(row["start"].hour, row["sum"]) for row in rows] == [
+        (10, 97.0),
+        (11, 99.0),
+        (12, 99.0),
+        (13, 99.0),
+    ]
+
+
+def test_import_anchors_sums_at_the_lifetime_counter() -> None:
+    """Completed hours are imported once with sums ending at the total."""
+    statistics = pytest.importorskip("homeassistant.components.recorder.statistics")
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            hass.config.components.add("recorder")
+            entry = SimpleNamespace(entry_id="backfill", title="Oncharger")
+            backfill = EnergyBackfill(hass, entry)
+            with patch.object(
+                statistics, "async_add_external_statistics"
+            ) as add, patch("homeassistant.util.dt.utcnow", return_value=at(15, 30)):
+                await backfill.async_import("charger", 100, SESSIONS)
+
+                metadata, rows = add.call_args.args[1:]
+                assert metadata["statistic_id"] == "oncharger:charger_backfill_energy"
+                assert [(row["start"].hour, row["sum"]) for row in rows] == [
+                    (10, 97.0),
+                    (11, 99.0),
+                    (12, 99.0),
+                    (13, 99.0),
+                    (14, 100.0),
+                ]
+
+                add.reset_mock()
+                await backfill.async_import("charger", 100, SESSIONS)
+                add.assert_not_called()
+
+    asyncio.run(run())
@@ -0,0 +1,120 @@
+"""Tests for the Oncharger phase current conditioner."""
+
+from __future__ import annotations
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import State
+
+from custom_components.oncharger.conditioning import PhaseCurrentConditioner
+from custom_components.oncharger.const import FILTER_EWMA, FILTER_MEDIAN
+
+ENTITY_ID = "sensor.phase_current"
+
+
+class Clock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.seconds = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.seconds
+
+
+def feed(
+    conditioner: PhaseCurrentConditioner, *states: str, resample: bool = False
+) -> list[float | None]:
+    """Process states and return the emitted values."""
+    return [
+        conditioner.process(
+            State(ENTITY_ID, state, {"unit_of_measurement": "A"}), resample
+        )
+        for state in states
+    ]
+
+
+def test_noop_events_are_dropped_before_the_filter() -> None:
+    """Repeated states and attribute-only changes never reach the filter."""
+    conditioner = PhaseCurrentConditioner(16, FILTER_MEDIAN, clock=Clock())
+    feed(conditioner, "5", "20")
+    conditioner.process(
+        State(ENTITY_ID, "20", {"unit_of_measurement": "A", "friendly_name": "L1"})
+    )
+    feed(conditioner, "20")
+    assert conditioner.counters["unchanged"] == 2
+    assert conditioner.value == 12.5
+    assert conditioner.settling
+
+
+def test_steady_reading_settles() -> None:
+    """A reading that held steady settles the filter on it."""
+    for filter_type in (FILTER_MEDIAN, FILTER_EWMA):
+        conditioner = PhaseCurrentConditioner(16, filter_type, clock=Clock())
+        feed(conditioner, "5", "20", "20")
+        assert conditioner.settling
+        assert conditioner.settle() == 20
+        assert not conditioner.settling
+        assert conditioner.settle() is None
+
+
+def test_settled_median_rejects_a_spike() -> None:
+    """Settling fills the median window, so a single spike is still filtered."""
+    conditioner = PhaseCurrentConditioner(16, FILTER_MEDIAN, clock=Clock())
+    feed(conditioner, "5", "20")
+    conditioner.settle()
+    assert feed(conditioner, "40", "20") == [None, None]
+    assert conditioner.value == 20
+
+
+def test_exported_current_is_valid() -> None:
+    """A phase exporting solar power reads negative down to the max load."""
+    conditioner = PhaseCurrentConditioner(16, clock=Clock())
+    assert feed(conditioner, "-10", "-16") == [-10, None]
+    assert not conditioner.failing
+
+    feed(conditioner, "-17")
+    assert conditioner.failing
+    assert conditioner.counters["outliers"] == 1
+
+
+def test_single_spike_is_filtered() -> None:
+    """A single spike does not reach the boost with the median filter."""
+    conditioner = PhaseCurrentConditioner(16, FILTER_MEDIAN, clock=Clock())
+    emitted = feed(conditioner, "5", "5", "40", "5", "5")
+    assert emitted[0] == 5
+    assert 40 not in emitted
+    assert conditioner.value == 5
+
+
+def test_decrease_is_rate_capped() -> None:
+    """A decrease waits for the rate cap, an increase passes at once."""
+    clock = Clock()
+    conditioner = PhaseCurrentConditioner(16, clock=clock)
+    assert feed(conditioner, "10", "4") == [10, None]
+    assert conditioner.pending == 4
+    assert feed(conditioner, "12") == [12]
+
+    clock.seconds += conditioner.retry_in
+    assert feed(conditioner, "6") == [6]
+
+
+def test_unavailable_signal_is_lost() -> None:
+    """A state that stays unavailable counts as a failure every time."""
+    conditioner = PhaseCurrentConditioner(16, clock=Clock())
+    feed(conditioner, "5")
+    feed(conditioner, STATE_UNAVAILABLE)
+    assert conditioner.failing
+    assert not conditioner.lost
+
+    feed(conditioner, STATE_UNAVAILABLE)
+    assert conditioner.counters["unchanged"] == 1
+
+    feed(conditioner, *[STATE_UNAVAILABLE] * 9, resample=True)
+    assert conditioner.lost
+    assert conditioner.counters["invalid"] == 10
+
+    feed(conditioner, "5")
+    assert not conditioner.failing
+    assert not conditioner.lost
@@ -0,0 +1,160 @@
+"""Tests for the Oncharger coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.const import (
+    CHARGER_BOOST_TYPE_KEY,
+    CHARGER_LOCKED_UNLOCKED_KEY,
+    CHARGER_MAX_CHARGING_CURRENT_KEY,
+    CHARGER_SESSION_ENERGY_KEY,
+    CHARGER_STATE_KEY,
+    CHARGER_TOTAL_ENERGY_KEY,
+    DEVICE_NAME,
+    DEVICE_TYPE,
+    IP_ADDRESS,
+    PASSWORD,
+    SINGLE_PHASE,
+    USERNAME,
+)
+from custom_components.oncharger.coordinator import OnchargerCoordinator
+from custom_components.oncharger.oncharger import Oncharger
+from homeassistant.exceptions import HomeAssistantError
+
+DATA = {
+    DEVICE_NAME: "coordinator",
+    DEVICE_TYPE: SINGLE_PHASE,
+    USERNAME: "coordinator",
+    PASSWORD: "coordinator",
+    IP_ADDRESS: "127.0.0.1:9",
+}
+
+THREE_PHASE_DATA = {
+    CHARGER_STATE_KEY: 1,
+    CHARGER_SESSION_ENERGY_KEY: 0,
+    CHARGER_TOTAL_ENERGY_KEY: 0,
+    **{f"amp{phase}": 6000 for phase in ("", "1", "2", "3")},
+    **{f"volt{phase}": 2300 for phase in ("", "1", "2", "3")},
+}
+
+
+def create_coordinator(hass, data: dict) -> OnchargerCoordinator:
+    """Return a coordinator whose charger is unreachable."""
+    entry = SimpleNamespace(entry_id="coordinator", data=DATA, options={})
+    coordinator = OnchargerCoordinator(Oncharger(DATA), hass, entry)
+    coordinator.data = data
+    return coordinator
+
+
+def test_apply_profile_writes_only_changes_in_order() -> None:
+    """Locking comes first, unlocking last, and matching settings are skipped."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            coordinator = create_coordinator(
+                hass,
+                {
+                    CHARGER_LOCKED_UNLOCKED_KEY: False,
+                    CHARGER_MAX_CHARGING_CURRENT_KEY: 16,
+                    CHARGER_BOOST_TYPE_KEY: 0,
+                },
+            )
+            with patch.object(coordinator.jobs, "async_run") as run_job, patch.object(
+                coordinator, "async_request_refresh", AsyncMock()
+            ):
+                boost = (5, 32, 1, "")
+                assert await coordinator.async_apply_profile(
+                    locked=True, charging_current=10, boost_config=boost
+                ) == ["set_lock_unlock", "set_boost_config", "set_max_charging_current"]
+
+                coordinator.data[CHARGER_LOCKED_UNLOCKED_KEY] = True
+                assert await coordinator.async_apply_profile(
+                    locked=False, charging_current=16
+                ) == ["set_lock_unlock"]
+                assert run_job.call_args.args[1] == (("set_lock_unlock", (False,)),)
+
+                run_job.reset_mock()
+                assert await coordinator.async_apply_profile(charging_current=16) == []
+                run_job.assert_not_called()
+
+    asyncio.run(run())
+
+
+def test_apply_profile_rejects_unreported_settings() -> None:
+    """A setting the firmware does not report names itself in the error."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            coordinator = create_coordinator(
+                hass, {CHARGER_MAX_CHARGING_CURRENT_KEY: 16}
+            )
+            with patch.object(coordinator.jobs, "async_run") as run_job:
+                with pytest.raises(HomeAssistantError, match="locked"):
+                    await coordinator.async_apply_profile(
+                        locked=True, charging_current=10
+                    )
+                with pytest.raises(HomeAssistantError, match="boost"):
+                    await coordinator.async_apply_profile(boost_config=(5, 32, 1, ""))
+                run_job.assert_not_called()
+
+    asyncio.run(run())
+
+
+def test_phases_follow_the_polled_data() -> None:
+    """A charger configured as single phase that reports three phases is one."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            coordinator = create_coordinator(hass, {})
+            phases = coordinator.phases
+            assert not coordinator.three_phase
+
+            with patch.object(
+                coordinator, "_async_get_data", AsyncMock(return_value=THREE_PHASE_DATA)
+            ):
+                await coordinator._async_fetch_once()
+
+            assert coordinator.three_phase
+            assert phases == ["1", "2", "3"]
+            assert coordinator.analytics.total_power == 3 * 1380
+
+    asyncio.run(run())
+
+
+def test_refresh_burst_is_single_flight() -> None:
+    """Refreshes requested during a slow fetch share it and add one follow-up."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            coordinator = create_coordinator(hass, {})
+            in_flight = peak = 0
+
+            async def slow_fetch() -> dict:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.1)
+                in_flight -= 1
+                return dict(THREE_PHASE_DATA)
+
+            with patch.object(coordinator, "_async_get_data", slow_fetch):
+                poll = hass.async_create_task(coordinator.async_refresh())
+                await asyncio.sleep(0.02)
+                await asyncio.gather(
+                    *(coordinator.async_request_refresh() for _ in range(20)),
+                    *(coordinator.async_refresh() for _ in range(5)),
+                )
+                await poll
+                coordinator._debounced_refresh.async_cancel()
+
+            assert peak == 1
+            assert (coordinator.fetches, coordinator.followup_fetches) == (2, 1)
+            assert coordinator.last_update_success
+
+    asyncio.run(run())
@@ -0,0 +1,105 @@
+"""Tests for the Oncharger cost engine."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.const import (
+    CHARGER_SESSION_ENERGY_KEY,
+    CHARGER_TOTAL_ENERGY_KEY,
+    TARIFF,
+)
+from custom_components.oncharger.cost import SAVE_INTERVAL, CostEngine
+import homeassistant.util.dt as dt_util
+
+SESSION = {"start": "2026-01-01T10:00:00+00:00"}
+
+
+def poll(total_wh: float, session_kwh: float = 0) -> dict[str, float]:
+    """Return charger data with lifetime and session energy."""
+    return {
+        CHARGER_TOTAL_ENERGY_KEY: total_wh,
+        CHARGER_SESSION_ENERGY_KEY: session_kwh * 3600000,
+    }
+
+
+def test_session_reset_is_not_charged_twice() -> None:
+    """Energy that drops and comes back is priced only once."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            entry = SimpleNamespace(entry_id="cost", options={TARIFF: "00:00=1"})
+            costs = CostEngine(hass, entry)
+            with patch.object(costs._store, "async_delay_save") as save:
+                costs.async_update(poll(1000), SESSION)
+                costs.async_update(poll(1000, 1), SESSION)
+                assert costs.session_cost == pytest.approx(1)
+
+                # wsec resets before wat includes the session
+                costs.async_update(poll(1000), SESSION)
+                costs.async_update(poll(2000), SESSION)
+                assert costs.month_cost == pytest.approx(1)
+
+                saves = save.call_count
+                costs.async_update(poll(2000), SESSION)
+                assert save.call_count == saves
+
+                # a lifetime counter reset starts a new baseline
+                costs.async_update(poll(0), SESSION)
+                costs.async_update(poll(500), SESSION)
+                assert costs.month_cost == pytest.approx(1.5)
+
+    asyncio.run(run())
+
+
+def test_no_price_keeps_the_baseline() -> None:
+    """Energy used without a price is not charged once a price is known."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            entry = SimpleNamespace(entry_id="cost", options={})
+            costs = CostEngine(hass, entry)
+            with patch.object(costs._store, "async_delay_save"):
+                costs.async_update(poll(1000), None)
+                costs.async_update(poll(3000), None)
+                entry.options = {TARIFF: "00:00=1"}
+                costs.async_update(poll(4000), None)
+            assert costs.month_cost == pytest.approx(1)
+
+    asyncio.run(run())
+
+
+def test_saves_are_not_postponed_by_polls() -> None:
+    """A new session saves right away and charging saves at a fixed interval."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            entry = SimpleNamespace(entry_id="cost", options={TARIFF: "00:00=1"})
+            costs = CostEngine(hass, entry)
+            now = dt_util.now()
+            with patch.object(costs._store, "async_delay_save") as save, patch(
+                "homeassistant.util.dt.now", side_effect=lambda: now
+            ):
+                costs.async_update(poll(1000), None)
+                assert save.call_args.args[1:] == (0,)
+
+                for index in range(1, 5):
+                    now += SAVE_INTERVAL / 4
+                    costs.async_update(poll(1000, index / 10), None)
+                assert save.call_count == 2
+                assert save.call_args.args[1:] == (
+                    (SAVE_INTERVAL * 3 / 4).total_seconds(),
+                )
+
+                now += timedelta(seconds=1)
+                costs.async_update(poll(1000, 1), SESSION)
+                assert save.call_count == 3
+                assert save.call_args.args[1:] == (0,)
+
+    asyncio.run(run())
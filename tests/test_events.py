@@ -0,0 +1,96 @@
+"""Tests for the Oncharger device events and triggers."""
+
+from __future__ import annotations
+
+import asyncio
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.const import (
+    CHARGER_LOCKED_UNLOCKED_KEY,
+    CHARGER_MAX_CHARGING_CURRENT_KEY,
+    CHARGER_NAME_KEY,
+    CHARGER_STATE_KEY,
+    DEVICE_NAME,
+    DOMAIN,
+)
+from custom_components.oncharger.device_trigger import async_attach_trigger
+from custom_components.oncharger.events import (
+    EVENT_CHARGING_STARTED,
+    EVENT_CURRENT_CHANGED,
+    EVENT_PLUGGED,
+    EdgeDetector,
+    detect_edges,
+)
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.helpers import device_registry as dr
+
+READY, CHARGING = 1, 3
+
+
+def snapshot(state: int, current: int = 16) -> dict[str, int | str | bool]:
+    """Return charger data with a state and a current limit."""
+    return {
+        CHARGER_NAME_KEY: "charger",
+        CHARGER_STATE_KEY: state,
+        CHARGER_LOCKED_UNLOCKED_KEY: False,
+        CHARGER_MAX_CHARGING_CURRENT_KEY: current,
+    }
+
+
+def test_transitions_are_detected() -> None:
+    """Only the changes between two snapshots are reported."""
+    assert detect_edges(snapshot(READY), snapshot(READY)) == []
+    assert detect_edges(snapshot(READY), snapshot(CHARGING, 10)) == [
+        (EVENT_PLUGGED, {}),
+        (EVENT_CHARGING_STARTED, {}),
+        (EVENT_CURRENT_CHANGED, {"from": 16, "to": 10}),
+    ]
+
+
+def test_device_trigger_fires_on_transition() -> None:
+    """A device trigger runs its action once when charging starts."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            hass.config_entries = ConfigEntries(hass, {})
+            entry = ConfigEntry(
+                version=1,
+                minor_version=1,
+                domain=DOMAIN,
+                title="Oncharger",
+                data={DEVICE_NAME: "Oncharger"},
+                source="user",
+            )
+            hass.config_entries._entries[entry.entry_id] = entry
+            await dr.async_load(hass)
+            device = dr.async_get(hass).async_get_or_create(
+                config_entry_id=entry.entry_id,
+                identifiers={(DOMAIN, "charger", "Oncharger")},
+            )
+
+            calls = []
+            await async_attach_trigger(
+                hass,
+                {
+                    CONF_PLATFORM: "device",
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_DEVICE_ID: device.id,
+                    CONF_TYPE: EVENT_CHARGING_STARTED,
+                },
+                lambda run_variables, context=None: calls.append(run_variables),
+                {"trigger_data": {}, "variables": {}},
+            )
+
+            edges = EdgeDetector(hass, entry)
+            edges.async_update(snapshot(READY))
+            edges.async_update(snapshot(CHARGING))
+            edges.async_update(snapshot(CHARGING))
+            await hass.async_block_till_done()
+
+            assert len(calls) == 1
+            event = calls[0]["trigger"]["event"]
+            assert event.event_type == f"{DOMAIN}_{EVENT_CHARGING_STARTED}"
+            assert event.data[CONF_DEVICE_ID] == device.id
+
+    asyncio.run(run())
@@ -0,0 +1,132 @@
+"""Tests for the Oncharger executor."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.config_flow import validate_input
+from custom_components.oncharger.const import (
+    DEVICE_NAME,
+    DEVICE_TYPE,
+    EXECUTOR_MAX_PENDING,
+    EXECUTOR_MAX_WORKERS,
+    EXECUTOR_MIN_WORKERS,
+    IP_ADDRESS,
+    PASSWORD,
+    SINGLE_PHASE,
+    USERNAME,
+)
+from custom_components.oncharger.executor import (
+    ExecutorSaturated,
+    OnchargerExecutor,
+    OnchargerJobs,
+    async_get_executor,
+)
+
+
+def blocking_job(event: threading.Event, index: int) -> int:
+    """Block until the event is set and return the index."""
+    event.wait()
+    return index
+
+
+def test_slow_charger_does_not_starve_others() -> None:
+    """A charger with hanging jobs only holds its own thread."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            hanging = threading.Event()
+            slow = OnchargerJobs(hass)
+            fast = [OnchargerJobs(hass) for _ in range(8)]
+
+            slow_jobs = [
+                asyncio.ensure_future(slow.async_run(blocking_job, hanging, index))
+                for index in range(EXECUTOR_MAX_PENDING)
+            ]
+            await asyncio.sleep(0.05)
+
+            start = time.monotonic()
+            results = await asyncio.wait_for(
+                asyncio.gather(*(jobs.async_run(lambda: 1) for jobs in fast)), 2
+            )
+            elapsed = time.monotonic() - start
+
+            assert results == [1] * len(fast)
+            assert elapsed < 0.5
+            assert slow.queue_depth == EXECUTOR_MAX_PENDING
+            assert async_get_executor(hass).workers >= 1 + len(fast)
+
+            hanging.set()
+            await asyncio.gather(*slow_jobs)
+
+    asyncio.run(run())
+
+
+def test_jobs_coalesce_and_reject() -> None:
+    """Identical jobs share a result and a full queue rejects new jobs."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            release = threading.Event()
+            jobs = OnchargerJobs(hass)
+
+            first = asyncio.ensure_future(jobs.async_run(blocking_job, release, 0))
+            second = asyncio.ensure_future(jobs.async_run(blocking_job, release, 0))
+            queued = [
+                asyncio.ensure_future(jobs.async_run(blocking_job, release, index))
+                for index in range(1, EXECUTOR_MAX_PENDING)
+            ]
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(ExecutorSaturated):
+                await jobs.async_run(blocking_job, release, EXECUTOR_MAX_PENDING)
+
+            release.set()
+            assert await first == 0
+            assert await second == 0
+            await asyncio.gather(*queued)
+            assert (jobs.submitted, jobs.coalesced, jobs.rejected) == (
+                EXECUTOR_MAX_PENDING,
+                1,
+                1,
+            )
+
+    asyncio.run(run())
+
+
+def test_pool_growth_is_capped() -> None:
+    """The pool stops growing at the maximum number of workers."""
+    executor = OnchargerExecutor()
+    for _ in range(10 * EXECUTOR_MAX_WORKERS):
+        executor.register()
+
+    assert executor.workers == EXECUTOR_MAX_WORKERS
+    executor.shutdown()
+
+
+def test_failed_validation_releases_the_charger() -> None:
+    """A config flow that cannot reach the charger leaves no charger behind."""
+    data = {
+        DEVICE_NAME: "executor",
+        DEVICE_TYPE: SINGLE_PHASE,
+        USERNAME: "executor",
+        PASSWORD: "executor",
+        IP_ADDRESS: "127.0.0.1:9",
+    }
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            for _ in range(8):
+                with pytest.raises(ConnectionError):
+                    await validate_input(hass, data)
+
+            executor = async_get_executor(hass)
+            assert executor.chargers == 0
+            assert executor.workers == EXECUTOR_MIN_WORKERS
+
+    asyncio.run(run())
@@ -0,0 +1,104 @@
+"""Tests for the Oncharger telemetry exporter."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.const import (
+    CHARGER_CURRENT_KEY,
+    CHARGER_NAME_KEY,
+    CHARGER_STATE_KEY,
+    CHARGER_VOLTAGE_KEY,
+    DOMAIN,
+    EXPORT_BATCH_SIZE,
+    EXPORT_FLUSH_INTERVAL,
+    EXPORT_FORMAT,
+    EXPORT_URL,
+    LINE_PROTOCOL,
+)
+from custom_components.oncharger.exporter import (
+    TelemetryExporter,
+    encode_line_protocol,
+)
+
+DATA = {
+    CHARGER_NAME_KEY: "charger",
+    CHARGER_CURRENT_KEY: 16000,
+    CHARGER_VOLTAGE_KEY: 230.5,
+    CHARGER_STATE_KEY: 3,
+}
+
+
+def test_line_protocol_field_types() -> None:
+    """Integers get the integer suffix and booleans are written as words."""
+    sample = {
+        "time": 1,
+        "charger": "my charger",
+        "fields": {"amp": 16, "volt": 230.5, "loc": True, "boost": False},
+    }
+    assert encode_line_protocol(sample) == (
+        r"oncharger,charger=my\ charger amp=16i,volt=230.5,loc=true,boost=false 1"
+    )
+
+
+def test_failed_export_backs_off() -> None:
+    """A failing sink is retried after growing delays, not on every poll."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            now = 0.0
+            entry = SimpleNamespace(
+                options={
+                    EXPORT_URL: "missing/telemetry.txt",
+                    EXPORT_FORMAT: LINE_PROTOCOL,
+                }
+            )
+            exporter = TelemetryExporter(hass, entry, [""], clock=lambda: now)
+            # tracked tasks, so async_block_till_done waits for the flushes
+            hass.async_create_background_task = hass.async_create_task
+
+            for _ in range(EXPORT_BATCH_SIZE):
+                exporter.async_add(DATA)
+            await hass.async_block_till_done()
+            assert exporter.failures == 1
+            assert exporter.backing_off
+
+            exporter.async_add(DATA)
+            await exporter.async_flush()
+            await hass.async_block_till_done()
+            assert exporter.failures == 1
+
+            now += EXPORT_FLUSH_INTERVAL
+            await exporter.async_flush()
+            assert exporter.failures == 2
+
+            now += EXPORT_FLUSH_INTERVAL
+            await exporter.async_flush()
+            assert exporter.failures == 2
+
+            os.mkdir(hass.config.path("missing"))
+            threads = []
+            write_file = exporter._write_file
+
+            def record_thread(path: str, lines: list[str]) -> None:
+                threads.append(threading.current_thread().name)
+                write_file(path, lines)
+
+            now += EXPORT_FLUSH_INTERVAL
+            with patch.object(exporter, "_write_file", record_thread):
+                await exporter.async_flush()
+            assert exporter.exported == EXPORT_BATCH_SIZE + 1
+            assert not exporter.backing_off
+            assert all(name.startswith(DOMAIN) for name in threads)
+
+            with open(hass.config.path("missing/telemetry.txt")) as file:
+                lines = file.read().splitlines()
+            assert len(lines) == EXPORT_BATCH_SIZE + 1
+            assert lines[0].startswith("oncharger,charger=charger amp=16000i,")
+
+    asyncio.run(run())
@@ -0,0 +1,107 @@
+"""Tests for the Oncharger offline command journal."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.const import (
+    DEVICE_NAME,
+    DEVICE_TYPE,
+    IP_ADDRESS,
+    PASSWORD,
+    SINGLE_PHASE,
+    USERNAME,
+)
+from custom_components.oncharger.coordinator import InvalidAuth, OnchargerCoordinator
+from custom_components.oncharger.journal import CommandJournal
+from custom_components.oncharger.oncharger import Oncharger
+
+DATA = {
+    DEVICE_NAME: "journal",
+    DEVICE_TYPE: SINGLE_PHASE,
+    USERNAME: "journal",
+    PASSWORD: "journal",
+    IP_ADDRESS: "127.0.0.1:9",
+}
+
+
+def create_coordinator(hass) -> OnchargerCoordinator:
+    """Return a coordinator whose charger is unreachable."""
+    entry = SimpleNamespace(entry_id="journal", data=DATA, options={})
+    coordinator = OnchargerCoordinator(Oncharger(DATA), hass, entry)
+    coordinator.data = {}
+    return coordinator
+
+
+def test_journal_keeps_the_last_value() -> None:
+    """Only the newest value is kept, and a stale clear keeps it."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            journal = CommandJournal(hass, "journal")
+            journal.async_record(charging_current=10)
+            journal.async_record(charging_current=12, locked=True)
+            assert journal.desired == {"charging_current": 12, "locked": True}
+
+            journal.async_clear(charging_current=10, locked=True)
+            assert journal.desired == {"charging_current": 12}
+
+            await journal._store.async_save(journal._data_to_save())
+            restored = CommandJournal(hass, "journal")
+            await restored.async_load()
+            assert restored.desired == {"charging_current": 12}
+
+    asyncio.run(run())
+
+
+def test_offline_write_is_journaled_and_shown() -> None:
+    """A failed write is journaled and the entities are told about it."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            coordinator = create_coordinator(hass)
+            updates = []
+            coordinator.async_add_listener(lambda: updates.append(True))
+
+            with patch.object(
+                coordinator.jobs, "async_run", side_effect=ConnectionError
+            ):
+                await coordinator.async_set_charging_current(10)
+                assert coordinator.journal.desired == {"charging_current": 10}
+                assert updates
+
+                # the boost current is recomputed, so it is never journaled
+                with pytest.raises(ConnectionError):
+                    await coordinator.async_set_charging_current(16, journal=False)
+                assert coordinator.journal.desired == {"charging_current": 10}
+
+    asyncio.run(run())
+
+
+def test_replay_gives_up_on_invalid_auth() -> None:
+    """Settings the charger rejects are not retried on every poll."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            coordinator = create_coordinator(hass)
+            coordinator.journal.async_record(locked=True)
+
+            with patch.object(
+                coordinator, "async_apply_profile", side_effect=InvalidAuth
+            ):
+                await coordinator._async_replay()
+            assert coordinator.journal.desired == {}
+
+            coordinator.journal.async_record(locked=True)
+            with patch.object(
+                coordinator, "async_apply_profile", side_effect=ConnectionError
+            ):
+                await coordinator._async_replay()
+            assert coordinator.journal.desired == {"locked": True}
+
+    asyncio.run(run())
@@ -0,0 +1,70 @@
+"""Tests for the Oncharger meter endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.const import (
+    CHARGER_VOLTAGE_KEY,
+    IP_ADDRESS,
+    PHASE_CURRENT_ENTITY,
+    PHASE_MAX_LOAD,
+    PHASE_MAX_LOAD_MIN,
+)
+from custom_components.oncharger.meter import MeterServer
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    STATE_UNAVAILABLE,
+    UnitOfElectricCurrent,
+)
+
+ENTITY_ID = "sensor.phase_current"
+
+
+def create_meter(hass, options: dict) -> MeterServer:
+    """Return a meter for a single phase charger."""
+    entry = SimpleNamespace(data={IP_ADDRESS: "127.0.0.1"}, options=options)
+    coordinator = SimpleNamespace(data={CHARGER_VOLTAGE_KEY: 2300}, phases=[""])
+    return MeterServer(hass, entry, coordinator)
+
+
+async def async_served(meter: MeterServer) -> dict:
+    """Return the meter reading served to the charger."""
+    response = await meter._async_handle(None)
+    return json.loads(response.body)["emeters"][0]
+
+
+def test_unknown_current_reads_as_max_load() -> None:
+    """The charger never sees a low reading when the current is unknown."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            meter = create_meter(
+                hass, {PHASE_CURRENT_ENTITY: ENTITY_ID, PHASE_MAX_LOAD: 20}
+            )
+            assert (await async_served(meter))["current"] == 20
+
+            hass.states.async_set(ENTITY_ID, STATE_UNAVAILABLE)
+            assert (await async_served(meter))["current"] == 20
+
+            hass.states.async_set(
+                ENTITY_ID,
+                "12500",
+                {ATTR_UNIT_OF_MEASUREMENT: UnitOfElectricCurrent.MILLIAMPERE},
+            )
+            assert await async_served(meter) == {
+                "power": 2875.0,
+                "current": 12.5,
+                "voltage": 230.0,
+                "pf": 1,
+                "is_valid": True,
+            }
+            assert (meter.requests, meter.fallbacks) == (3, 2)
+
+            meter = create_meter(hass, {})
+            assert (await async_served(meter))["current"] == PHASE_MAX_LOAD_MIN
+
+    asyncio.run(run())
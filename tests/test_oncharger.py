@@ -0,0 +1,103 @@
+"""Tests for the Oncharger requests and their timeouts."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+from aiohttp import web
+import pytest
+
+from custom_components.oncharger.const import (
+    CLOUD_CONNECT_TIMEOUT,
+    CLOUD_READ_TIMEOUT_MAX,
+    DEVICE_NAME,
+    HTTP_TIMEOUT,
+    IP_ADDRESS,
+    LOCAL_CONNECT_TIMEOUT,
+    LOCAL_READ_TIMEOUT_MIN,
+    PASSWORD,
+    USERNAME,
+)
+from custom_components.oncharger.client import OnchargerAuthError
+from custom_components.oncharger.oncharger import Oncharger
+
+DATA = {
+    DEVICE_NAME: "timeouts",
+    USERNAME: "timeouts",
+    PASSWORD: "timeouts",
+}
+
+
+def test_local_read_timeout_is_bounded() -> None:
+    """LAN read timeouts adapt to latency but never exceed HTTP_TIMEOUT."""
+    oncharger = Oncharger({**DATA, IP_ADDRESS: "127.0.0.1:9"})
+    latency = oncharger._latency_of("status")
+
+    for _ in range(10):
+        latency.backoff()
+    assert oncharger._timeout("status") == (LOCAL_CONNECT_TIMEOUT, HTTP_TIMEOUT)
+
+    for _ in range(50):
+        latency.sample(0.01)
+    assert oncharger._timeout("status") == (
+        LOCAL_CONNECT_TIMEOUT,
+        LOCAL_READ_TIMEOUT_MIN,
+    )
+
+
+def test_cloud_read_timeout_backs_off_further() -> None:
+    """Cloud read timeouts back off up to their own maximum."""
+    oncharger = Oncharger(DATA)
+    latency = oncharger._latency_of("status")
+
+    for _ in range(10):
+        latency.backoff()
+    assert oncharger._timeout("status") == (
+        CLOUD_CONNECT_TIMEOUT,
+        CLOUD_READ_TIMEOUT_MAX,
+    )
+
+
+def test_async_client_reports_to_the_hooks() -> None:
+    """Polls through the async client feed the timeouts and statistics."""
+
+    async def handler(request: web.Request) -> web.Response:
+        if request.match_info["path"] == "status":
+            await asyncio.sleep(1)
+        if request.query["pass"] != "timeouts":
+            return web.Response(status=403, text="forbidden")
+        return web.json_response({"ocid": "timeouts"})
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get("/{path}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            oncharger = Oncharger({**DATA, IP_ADDRESS: f"127.0.0.1:{port}"})
+            latency = oncharger._latency_of("status")
+            for _ in range(50):
+                latency.sample(0.01)
+
+            async with aiohttp.ClientSession() as session:
+                client = oncharger.async_client(session)
+                assert await client.get_config() == {"ocid": "timeouts"}
+                with pytest.raises(ConnectionError):
+                    await client.get_status()
+
+                oncharger._password = "wrong"
+                with pytest.raises(OnchargerAuthError):
+                    await oncharger.async_client(session).get_config()
+        finally:
+            await runner.cleanup()
+
+        assert oncharger.stats.endpoints["config"].requests == 2
+        assert dict(oncharger.stats.endpoints["status"].errors) == {"read_timeout": 1}
+        assert oncharger._timeout("status")[1] == 2 * LOCAL_READ_TIMEOUT_MIN
+        assert dict(oncharger.stats.endpoints["config"].errors) == {"forbidden": 1}
+
+    asyncio.run(run())
@@ -0,0 +1,41 @@
+"""Tests for the Oncharger load predictor."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.predictor import LoadPredictor
+
+NOW = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def test_boost_stats_survive_a_restart() -> None:
+    """The statistics of the day are saved with the load profile."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            predictor = LoadPredictor(hass, "predictor")
+            stats = predictor.boost_stats
+            with patch.object(predictor._store, "async_delay_save") as save:
+                stats.record_load(True, NOW)
+                stats.record_load(False, NOW + timedelta(seconds=30))
+                stats.record_command(NOW + timedelta(seconds=30))
+                assert save.call_count == 2
+            await predictor._store.async_save(predictor._data_to_save())
+
+            restored = LoadPredictor(hass, "predictor")
+            await restored.async_load()
+            assert restored.boost_stats.overload_seconds == pytest.approx(30)
+            assert restored.boost_stats.commands == 1
+
+            # the statistics still roll over to the next day
+            restored.boost_stats.record_command(NOW + timedelta(days=1))
+            assert restored.boost_stats.overload_seconds == 0
+            assert restored.boost_stats.commands == 1
+
+    asyncio.run(run())
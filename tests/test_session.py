@@ -0,0 +1,94 @@
+"""Tests for the Oncharger session tracker."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from benchmarks.common import async_test_home_assistant
+from custom_components.oncharger.const import (
+    CHARGER_CURRENT_KEY,
+    CHARGER_SESSION_ELAPSED_KEY,
+    CHARGER_SESSION_ENERGY_KEY,
+    CHARGER_STATE_KEY,
+)
+from custom_components.oncharger.session import SAVE_INTERVAL, SessionTracker
+import homeassistant.util.dt as dt_util
+
+READY, CHARGING = 1, 3
+
+
+def poll(state: int, session_kwh: float = 0, elapsed: int = 0) -> dict[str, float]:
+    """Return charger data for a single phase charger."""
+    return {
+        CHARGER_STATE_KEY: state,
+        CHARGER_SESSION_ENERGY_KEY: session_kwh * 3600000,
+        CHARGER_SESSION_ELAPSED_KEY: elapsed,
+        CHARGER_CURRENT_KEY: 16000 if state == CHARGING else 0,
+    }
+
+
+def test_session_opens_closes_and_persists() -> None:
+    """A finished session is saved right away and survives a restart."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            sessions = SessionTracker(hass, "session", [""])
+            sessions.async_update(poll(READY), 0)
+            assert sessions.current is None
+
+            sessions.async_update(poll(CHARGING, 1, 600), 3600)
+            assert sessions.current["energy"] == 1
+            sessions.async_update(poll(CHARGING, 2, 1200), 7200)
+            sessions.async_update(poll(READY), 0)
+            assert sessions.current is None
+            assert sessions.last_session["energy"] == 2
+            assert sessions.last_session["peak_power"] == 7200
+            assert sessions.last_session["phases"] == ["1"]
+
+            await asyncio.sleep(0)
+            await hass.async_block_till_done()
+            restored = SessionTracker(hass, "session", [""])
+            await restored.async_load()
+            assert restored.sessions == sessions.sessions
+            assert restored.index == sessions.index
+            assert restored.current is None
+
+    asyncio.run(run())
+
+
+def test_running_session_saves_at_a_fixed_interval() -> None:
+    """Polls during a session do not keep postponing the save."""
+
+    async def run() -> None:
+        async with async_test_home_assistant() as hass:
+            sessions = SessionTracker(hass, "session", [""])
+            now = dt_util.utcnow()
+            with patch.object(sessions._store, "async_delay_save") as save, patch(
+                "homeassistant.util.dt.utcnow", side_effect=lambda: now
+            ):
+                sessions.async_update(poll(READY), 0)
+                assert save.call_count == 0
+
+                sessions.async_update(poll(CHARGING, 1), 3600)
+                assert save.call_args.args[1:] == (0,)
+
+                for _ in range(4):
+                    now += SAVE_INTERVAL / 4
+                    sessions.async_update(poll(CHARGING, 1), 3600)
+                assert save.call_count == 2
+                assert save.call_args.args[1:] == (
+                    (SAVE_INTERVAL * 3 / 4).total_seconds(),
+                )
+
+                now += timedelta(seconds=1)
+                sessions.async_update(poll(CHARGING, 1), 3600)
+                assert save.call_count == 3
+                assert save.call_args.args[1:] == (SAVE_INTERVAL.total_seconds() - 1,)
+
+                sessions.async_update(poll(READY), 0)
+                assert save.call_count == 4
+                assert save.call_args.args[1:] == (0,)
+
+    asyncio.run(run())